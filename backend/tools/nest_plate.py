@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+import argparse
+import glob
+import json
+import os
+import sys
+
+# cadlib lives at the repository root
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+try:
+    from cadlib.nesting import nest
+except Exception as e:
+    print(json.dumps({"error": f"import cadlib.nesting failed: {e}"}))
+    sys.exit(1)
+
+PART_EXTENSIONS = (".stl", ".step", ".stp", ".brep")
+
+parser = argparse.ArgumentParser(description="Arrange exported parts on print plates.")
+parser.add_argument("parts", nargs="+", help="part files, or directories of exported parts (e.g. out/)")
+parser.add_argument("--bed", default="220x220", help="bed size in mm, XxY (default 220x220)")
+parser.add_argument("--spacing", type=float, default=2.0, help="gap between parts in mm")
+parser.add_argument("--margin", type=float, default=5.0, help="distance from the bed edge in mm")
+parser.add_argument("--out", default=None, help="plate file (.stl, .3mf, .step); default <first dir>/plate.3mf")
+args = parser.parse_args()
+
+paths = []
+for p in args.parts:
+    if os.path.isdir(p):
+        found = glob.glob(os.path.join(p, "*"))
+        # Skip plates written by earlier runs
+        paths.extend(sorted(f for f in found if f.lower().endswith(PART_EXTENSIONS) and not os.path.basename(f).startswith("plate")))
+    else:
+        paths.append(p)
+if not paths:
+    print(json.dumps({"error": "no part files found"}))
+    sys.exit(2)
+
+try:
+    bed = tuple(float(v) for v in args.bed.lower().split("x"))
+    layout = nest(paths, bed=bed, spacing=args.spacing, margin=args.margin)
+except Exception as e:
+    print(json.dumps({"error": f"nesting failed: {e}"}))
+    sys.exit(3)
+
+out = args.out or os.path.join(os.path.dirname(paths[0]) or ".", "plate.3mf")
+stem, ext = os.path.splitext(out)
+plates = []
+for k in range(layout.plate_count):
+    # One file per plate: plate.3mf, plate_2.3mf, ...
+    plate_path = out if k == 0 else f"{stem}_{k + 1}{ext}"
+    layout.export(plate_path, plate=k)
+    plates.append({"path": plate_path, "utilization": round(layout.utilization(k), 4)})
+transforms_path = stem + ".json"
+with open(transforms_path, "w", encoding="utf-8") as fh:
+    json.dump({"bed": list(layout.bed), "placements": layout.transforms()}, fh, indent=2)
+
+print(json.dumps({"plates": plates, "transforms": transforms_path, "parts": len(paths)}))
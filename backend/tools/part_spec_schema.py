@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""Print the JSON schema of cadlib part specs, for LLM structured output.
+
+Specs matching it can be passed to run_generated_guarded.py as a .json file.
+"""
+import json
+import os
+import sys
+
+# cadlib lives at the repository root
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+try:
+    from cadlib.specs import spec_schema
+except Exception as e:
+    print(json.dumps({"error": f"import cadlib.specs failed: {e}"}))
+    sys.exit(1)
+
+print(json.dumps(spec_schema(), indent=2))
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""Run K candidate scripts (or .json part specs) for one part concurrently.
+
+Each candidate runs the guarded runner in its own directory and process
+group, with a wall-clock timeout and an optional memory cap. By default the
+first candidate whose outputs all pass the BRep check wins, the others are
+killed and the winner's out/ is copied to --out. With --all every candidate
+runs to completion and the report ranks them.
+"""
+import argparse
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+RUNNER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "run_generated_guarded.py")
+
+
+def _limits(memory_mb):
+    def apply():
+        if memory_mb:
+            import resource
+
+            limit = int(memory_mb) * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    return apply
+
+
+class Candidate:
+    def __init__(self, index, path, work_dir):
+        self.index = index
+        self.path = path
+        self.dir = os.path.join(work_dir, f"candidate{index + 1}")
+        os.makedirs(self.dir)
+        self.script = os.path.join(self.dir, os.path.basename(path))
+        shutil.copyfile(path, self.script)
+        self.proc = None
+        self.started = None
+        self.elapsed = None
+        self.status = "pending"
+        self.returncode = None
+
+    def start(self, runner_args, env, memory_mb):
+        self.log = open(os.path.join(self.dir, "run.log"), "wb")
+        self.proc = subprocess.Popen(
+            [sys.executable, RUNNER, self.script, *runner_args],
+            cwd=self.dir,
+            env=env,
+            stdout=self.log,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+            preexec_fn=_limits(memory_mb),
+        )
+        self.started = time.monotonic()
+        self.status = "running"
+
+    def kill(self, status):
+        if self.proc is not None and self.proc.poll() is None:
+            # The whole group: the runner may have started pool workers
+            try:
+                os.killpg(self.proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            self.proc.wait()
+        self._finish(status)
+
+    def poll(self, timeout):
+        if self.proc.poll() is not None:
+            self._finish(None)
+        elif time.monotonic() - self.started > timeout:
+            self.kill("timeout")
+        return self.status != "running"
+
+    def _finish(self, status):
+        if self.status != "running" and self.status != "pending":
+            return
+        self.elapsed = None if self.started is None else time.monotonic() - self.started
+        self.returncode = None if self.proc is None else self.proc.returncode
+        if self.proc is not None:
+            self.log.close()
+        if status is None:
+            status = "ok" if self.returncode == 0 and self.parts() else "failed"
+        self.status = status
+
+    def parts(self):
+        try:
+            with open(os.path.join(self.dir, "out", "manifest.json"), "r", encoding="utf-8") as fh:
+                return json.load(fh).get("parts", {})
+        except (OSError, ValueError):
+            return {}
+
+    def valid(self):
+        parts = self.parts()
+        return self.status == "ok" and all(p.get("valid", False) for p in parts.values())
+
+    def rank_key(self):
+        parts = self.parts()
+        n_valid = sum(1 for p in parts.values() if p.get("valid"))
+        return (self.status == "ok", self.valid(), n_valid, len(parts), -(self.elapsed or float("inf")))
+
+    def report(self):
+        out = {
+            "path": self.path,
+            "status": self.status,
+            "returncode": self.returncode,
+            "elapsed_s": None if self.elapsed is None else round(self.elapsed, 3),
+            "valid": self.valid(),
+            "parts": {name: {"valid": p.get("valid"), "file": p.get("file")} for name, p in self.parts().items()},
+        }
+        if self.status == "failed":
+            with open(os.path.join(self.dir, "run.log"), "rb") as fh:
+                out["error"] = fh.read().decode("utf-8", errors="replace")[-2000:]
+        return out
+
+
+parser = argparse.ArgumentParser(description="Run repair candidates for one part concurrently; first valid result wins.")
+parser.add_argument("candidates", nargs="+", help="candidate scripts or .json part specs")
+parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="candidates run at once (default: CPU count)")
+parser.add_argument("--timeout", type=float, default=120.0, help="per-candidate wall-clock limit in seconds")
+parser.add_argument("--memory-mb", type=float, default=None, help="per-candidate address-space limit")
+parser.add_argument("--quality", choices=("preview", "final"), default=None)
+parser.add_argument("--max-cost", type=float, default=None, help="static cost budget passed to the runner (0 disables it)")
+parser.add_argument("--all", action="store_true", help="run every candidate and rank them instead of stopping at the first valid one")
+parser.add_argument("--out", default="out", help="directory that receives the winner's outputs (default ./out)")
+args = parser.parse_args()
+
+runner_args = ["--quality", args.quality] if args.quality else []
+if args.max_cost is not None:
+    runner_args += ["--max-cost", str(args.max_cost)]
+env = dict(os.environ)
+env["PYTHONPATH"] = os.pathsep.join(p for p in (REPO_ROOT, env.get("PYTHONPATH")) if p)
+
+work_dir = tempfile.mkdtemp(prefix="cadlib_candidates_")
+winner = None
+try:
+    candidates = [Candidate(i, p, work_dir) for i, p in enumerate(args.candidates)]
+    queue = list(candidates)
+    running = []
+    while (queue or running) and winner is None:
+        while queue and len(running) < max(args.jobs, 1):
+            cand = queue.pop(0)
+            cand.start(runner_args, env, args.memory_mb)
+            running.append(cand)
+        for cand in list(running):
+            if cand.poll(args.timeout):
+                running.remove(cand)
+                if not args.all and cand.valid():
+                    winner = cand
+                    break
+        if winner is None and running:
+            time.sleep(0.02)
+    for cand in running + queue:
+        cand.kill("cancelled")
+
+    ranked = sorted(candidates, key=lambda c: c.rank_key(), reverse=True)
+    if winner is None and ranked[0].status == "ok":
+        winner = ranked[0]
+    if winner is not None:
+        shutil.copytree(os.path.join(winner.dir, "out"), args.out, dirs_exist_ok=True)
+    print(json.dumps({
+        "winner": None if winner is None else winner.path,
+        "valid": winner is not None and winner.valid(),
+        "out": args.out if winner is not None else None,
+        "ranking": [c.report() for c in ranked],
+    }))
+finally:
+    shutil.rmtree(work_dir, ignore_errors=True)
+sys.exit(0 if winner is not None else 1)
@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 import ast
+import contextlib
+import json
 import os
 import runpy
+import shutil
 import sys
 import traceback
 
@@ -50,12 +53,155 @@ def _sanitize_name(name: str) -> str:
     return safe or "part"
 
 
-def main() -> None:
-    if len(sys.argv) < 2:
-        print("Usage: run_generated_guarded.py <generated.py>")
-        sys.exit(2)
+def _stl_tolerances():
+    """Linear and angular STL tolerances for the active cadlib quality mode."""
+
+    try:
+        from cadlib.modes import tessellation
+    except ImportError:
+        return 0.1, 0.1
+    return tessellation(0.1, 0.1)
+
+
+def _fingerprint(wp):
+    """cadlib geometry fingerprint of an output, or None when unavailable."""
+
+    try:
+        from cadlib.fingerprints import fingerprint
+    except ImportError:
+        return None
+    try:
+        return fingerprint(wp)
+    except Exception:
+        return None
+
+
+def _threads(wp):
+    """cadlib thread annotations of an output, as manifest entries."""
+
+    try:
+        from cadlib.threads import threads_of
+    except ImportError:
+        return []
+    return [t.to_dict() for t in threads_of(wp)]
+
+
+def _check(wp, heal=False):
+    """(output to export, manifest fields) from cadlib's validity check; plain BRep check without cadlib."""
+
+    try:
+        from cadlib.validity import check_shape
+    except ImportError:
+        try:
+            valid = all(v.isValid() for v in wp.vals() if isinstance(v, cq.Shape))
+        except Exception:
+            valid = False
+        return wp, {"valid": valid, "diagnostics": []}
+    report = check_shape(wp, heal=heal)
+    fields = {"valid": report.ok, "diagnostics": [d.to_dict() for d in report.diagnostics]}
+    if report.healed:
+        fields["healed"] = True
+        wp = cq.Workplane("XY").newObject([report.shape])
+    return wp, fields
+
+
+def _tracing():
+    """Record the operation and line behind each Workplane step, for diagnostics."""
+
+    try:
+        from cadlib.validity import trace_operations
+    except ImportError:
+        return contextlib.nullcontext()
+    return trace_operations()
+
+
+def _load_manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, "manifest.json"), "r", encoding="utf-8") as fh:
+            return json.load(fh).get("parts", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def _assembly_builder(parts):
+    """The build() result if it is a cadlib AssemblyBuilder, else None."""
+
+    try:
+        from cadlib.assembly import AssemblyBuilder
+    except ImportError:
+        return None
+    return parts if isinstance(parts, AssemblyBuilder) else None
+
+
+def _export_assembly(out_dir, items, builder=None) -> None:
+    """Write all outputs as one instanced assembly.glb/.step; repeated shapes are stored once."""
+
+    from cadlib.assembly import AssemblyBuilder
+
+    if builder is None:
+        builder = AssemblyBuilder("assembly")
+        for name, solid in items:
+            builder.add(solid, _sanitize_name(name))
+    tolerance, angular_tolerance = _stl_tolerances()
+    for ext in ("glb", "step"):
+        path = os.path.join(out_dir, f"assembly.{ext}")
+        builder.export(path, tolerance=tolerance, angular_tolerance=angular_tolerance)
+        print(f"Exported {path} ({len(builder.shapes)} unique shapes, {len(builder.nodes)} nodes)")
+
+
+def _build_spec(src_path):
+    """Parts of a JSON part spec (see cadlib.specs); exits with the validation errors if it is invalid."""
+
+    # cadlib is found next to the spec, as for generated scripts
+    spec_dir = os.path.abspath(os.path.dirname(src_path))
+    if spec_dir not in sys.path:
+        sys.path.insert(0, spec_dir)
+    from cadlib.specs import build_spec
+
+    try:
+        with open(src_path, "r", encoding="utf-8") as fh:
+            return build_spec(fh.read())
+    except Exception:
+        print("[runner] Invalid or failing part spec:")
+        traceback.print_exc()
+        sys.exit(1)
+
+
+def _check_cost(src, max_cost, cost_only):
+    """Reject scripts whose static cost estimate is over budget or pathological (exit 3).
+
+    `max_cost` defaults to cadlib.costs.MAX_COST; 0 disables the check.
+    """
+
+    try:
+        from cadlib.costs import MAX_COST, analyze_script
+    except ImportError:
+        return
+    try:
+        cost = analyze_script(src)
+    except Exception as exc:
+        # A bug in the estimate must not take the run down; report it and run unguarded
+        report = {"cost": None, "issues": [f"cost analysis failed: {type(exc).__name__}: {exc}"], "fatal": [], "tier": "unknown"}
+        print(f"[runner] {report['issues'][0]}")
+        if cost_only:
+            print(json.dumps(report))
+            sys.exit(0)
+        return
+    report = cost.to_dict()
+    if cost_only:
+        print(json.dumps(report))
+        sys.exit(0)
+    max_cost = MAX_COST if max_cost is None else max_cost
+    if max_cost > 0 and (cost.fatal or cost.cost > max_cost):
+        reasons = list(cost.fatal) or [f"estimated cost {cost.cost:.0f} exceeds {max_cost:.0f}"]
+        print(f"[runner] Rejected before execution: {'; '.join(reasons)}")
+        print(json.dumps(report))
+        sys.exit(3)
+
+
+def _run_script(src_path, max_cost=None, cost_only=False):
+    """Run a generated script under the import guard; returns (build() result or None, globals)."""
 
-    src_path = sys.argv[1]
     src = open(src_path, "r", encoding="utf-8").read()
 
     # Static guard: forbid forbidden imports in generated.py
@@ -70,28 +216,81 @@ def main() -> None:
     repo_root = os.path.abspath(os.path.join(os.path.dirname(src_path), "."))
     if repo_root not in sys.path:
         sys.path.insert(0, repo_root)
+    _check_cost(src, max_cost, cost_only)
     _ensure_compound_solids_wrapper()
 
-    try:
-        env = runpy.run_path(src_path, init_globals={"cq": cq}, run_name="__main__")
-    except Exception:
-        print("[runner] Exception executing generated script:")
-        traceback.print_exc()
-        sys.exit(1)
-
-    # Collect outputs
-    parts = None
-    if callable(env.get("build")):
+    with _tracing():
         try:
-            parts = env["build"]()
+            env = runpy.run_path(src_path, init_globals={"cq": cq}, run_name="__main__")
         except Exception:
-            print("build() raised; traceback:")
+            print("[runner] Exception executing generated script:")
             traceback.print_exc()
-            print("Falling back to scanning environment for outputs...")
-            parts = None
+            sys.exit(1)
 
+        parts = None
+        if callable(env.get("build")):
+            try:
+                parts = env["build"]()
+            except Exception:
+                print("build() raised; traceback:")
+                traceback.print_exc()
+                print("Falling back to scanning environment for outputs...")
+                parts = None
+    return parts, env
+
+
+def main() -> None:
+    args = sys.argv[1:]
+    if "--quality" in args:
+        i = args.index("--quality")
+        if i + 1 >= len(args) or args[i + 1] not in ("preview", "final"):
+            print("--quality must be 'preview' or 'final'")
+            sys.exit(2)
+        # cadlib reads this on import; worker processes inherit it
+        os.environ["CADLIB_QUALITY"] = args[i + 1]
+        del args[i : i + 2]
+    if "--real-threads" in args:
+        # Helical threads for the final export only; generation and repair runs
+        # keep them cosmetic, and preview does regardless
+        os.environ["CADLIB_THREADS"] = "real"
+        args.remove("--real-threads")
+    write_assembly = "--assembly" in args
+    if write_assembly:
+        args.remove("--assembly")
+    heal = "--heal" in args
+    if heal:
+        args.remove("--heal")
+    cost_only = "--cost-only" in args
+    if cost_only:
+        args.remove("--cost-only")
+    max_cost = None
+    if "--max-cost" in args:
+        i = args.index("--max-cost")
+        try:
+            max_cost = float(args[i + 1])
+        except (IndexError, ValueError):
+            print("--max-cost must be a number of cost units (0 disables the check)")
+            sys.exit(2)
+        del args[i : i + 2]
+    if len(args) < 1:
+        print("Usage: run_generated_guarded.py <generated.py|part_spec.json> [--quality preview|final] [--real-threads] [--assembly] [--heal] [--max-cost N] [--cost-only]")
+        sys.exit(2)
+
+    src_path = args[0]
+    if src_path.lower().endswith(".json"):
+        # Declarative part spec: built in-process, nothing to guard or execute
+        parts, env = _build_spec(src_path), {}
+    else:
+        parts, env = _run_script(src_path, max_cost, cost_only)
+
+    # Collect outputs
     items = []  # list[(name, solid_like)]
-    if isinstance(parts, dict):
+    builder = _assembly_builder(parts)
+    if builder is not None:
+        # An assembly result exports each placed node as its own STL too
+        items = [(n.name, builder.shapes[n.shape].moved(n.location)) for n in builder.nodes]
+        write_assembly = True
+    elif isinstance(parts, dict):
         items = list(parts.items())
     elif isinstance(parts, (list, tuple)):
         for idx, it in enumerate(parts):
@@ -114,6 +313,12 @@ def main() -> None:
     out_dir = os.path.join(os.path.dirname(src_path), "out")
     os.makedirs(out_dir, exist_ok=True)
 
+    tolerance, angular_tolerance = _stl_tolerances()
+    settings = [tolerance, angular_tolerance]
+    previous = _load_manifest(out_dir)
+    manifest = {}
+    failed = []
+    by_fingerprint = {}  # fingerprint -> STL written (or kept) in this run
     for name, solid in items:
         # Wrap compound to Workplane; accept Workplane directly
         if isinstance(solid, cq.Workplane):
@@ -126,14 +331,70 @@ def main() -> None:
             except Exception:
                 raise SystemExit(f"Output '{name}' is not a recognized cadlib solid")
 
-        stl_path = os.path.join(out_dir, f"{_sanitize_name(name)}.stl")
+        file_name = f"{_sanitize_name(name)}.stl"
+        stl_path = os.path.join(out_dir, file_name)
+        fp = _fingerprint(wp)
+        prev = previous.get(name, {})
+        entry = {"file": file_name, "fingerprint": fp, "tessellation": settings, "heal": heal}
+        threads = _threads(wp)
+        if threads:
+            entry["threads"] = threads
+        unchanged = (
+            fp
+            and prev.get("fingerprint") == fp
+            and prev.get("tessellation") == settings
+            # A healed export differs from the unhealed one of the same input
+            and prev.get("heal", False) == heal
+            and os.path.exists(stl_path)
+        )
+        if unchanged:
+            entry.update(valid=prev.get("valid", True), diagnostics=prev.get("diagnostics", []))
+        else:
+            wp, fields = _check(wp, heal)
+            entry.update(fields)
+        if not entry["valid"]:
+            print(f"[runner] Diagnostics for {name}: {json.dumps(entry['diagnostics'])}")
+        if any(d["category"] in ("empty", "not_solid") for d in entry["diagnostics"]):
+            # Nothing printable to export; the diagnostics say which step lost the solid
+            entry["status"] = "failed"
+            failed.append(name)
+            manifest[name] = entry
+            continue
         try:
-            cq.exporters.export(wp, stl_path)
-            print(f"Exported {stl_path}")
+            if unchanged:
+                # Same geometry as last run: keep the file so later stages can skip it
+                entry["status"] = "unchanged"
+                print(f"Unchanged {stl_path}")
+            elif fp and fp in by_fingerprint:
+                # Identical to an output of this run: reuse its STL instead of tessellating again
+                shutil.copyfile(by_fingerprint[fp][1], stl_path)
+                entry.update(status="duplicate", same_as=by_fingerprint[fp][0])
+                print(f"Exported {stl_path} (same as {by_fingerprint[fp][0]})")
+            else:
+                cq.exporters.export(wp, stl_path, tolerance=tolerance, angularTolerance=angular_tolerance)
+                entry["status"] = "exported"
+                print(f"Exported {stl_path}")
         except Exception:
             print(f"[runner] Export failed for {name}; traceback:")
             traceback.print_exc()
             sys.exit(1)
+        if fp:
+            by_fingerprint.setdefault(fp, (name, stl_path))
+        manifest[name] = entry
+
+    with open(os.path.join(out_dir, "manifest.json"), "w", encoding="utf-8") as fh:
+        json.dump({"parts": manifest}, fh, indent=2)
+    if failed:
+        print(f"[runner] No solid to export for: {', '.join(failed)}")
+        sys.exit(1)
+
+    if write_assembly:
+        try:
+            _export_assembly(out_dir, items, builder)
+        except Exception:
+            print("[runner] Assembly export failed; traceback:")
+            traceback.print_exc()
+            sys.exit(1)
 
 
 if __name__ == "__main__":
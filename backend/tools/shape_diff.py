@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+import json
+import os
+import sys
+
+# cadlib lives at the repository root
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+try:
+    from cadlib.compare import compare_shapes, load_stl
+except Exception as e:
+    print(json.dumps({"error": f"import cadlib.compare failed: {e}"}))
+    sys.exit(1)
+
+if len(sys.argv) < 3:
+    print(json.dumps({"error": "usage: shape_diff.py <previous.stl> <current.stl> [threshold_mm]"}))
+    sys.exit(2)
+
+prev_path, cur_path = sys.argv[1], sys.argv[2]
+threshold = float(sys.argv[3]) if len(sys.argv) > 3 else 0.05
+try:
+    diff = compare_shapes(load_stl(prev_path), load_stl(cur_path), threshold=threshold)
+except Exception as e:
+    print(json.dumps({"error": f"failed to compare meshes: {e}"}))
+    sys.exit(3)
+
+print(json.dumps({
+    "previous": prev_path,
+    "current": cur_path,
+    **diff.summary(),
+    "converged": diff.converged(distance_tol=threshold),
+}))
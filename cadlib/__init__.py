@@ -1,26 +1,71 @@
-from .utils import Fit, apply_fit_to_hole
-from .validators import TubeParams, HoleSpec, RectEnclosureParams
-from .cylinders import tube
-from .fasteners import apply_screw_holes
-from .patterns import linear_array, grid_array, circular_array
-from .standards import pattern_nema17, pattern_vesa, bolt_circle
-from .pcb import pcb_pocket, pcb_standoffs
-from .connectors import cutout_usb_c, cutout_rj45, cutout_dc_barrel
-from .sealing import o_ring_gland_face, gasket_channel_rect
-from .vents import louvre_panel
-from .inserts import insert_boss
-from .enclosures import elliptical_enclosure, d_shaped_enclosure, rectangular_enclosure_base_and_lid
+"""cadlib: parametric CadQuery building blocks.
+
+Public names load their submodule on first access, so OCCT-free modules
+(`estimates`, `costs`, `validators`, `utils`, `modes`) import without cadquery.
+"""
+
+import importlib
+from typing import Any, Dict, List
+
+_SUBMODULE_EXPORTS = {
+    "utils": ("Fit", "apply_fit_to_hole"),
+    "validators": ("TubeParams", "HoleSpec", "ThreadSpec", "RectEnclosureParams"),
+    "cylinders": ("tube",),
+    "fasteners": ("apply_screw_holes",),
+    "patterns": ("linear_array", "grid_array", "circular_array", "array_at_points"),
+    "standards": ("pattern_nema17", "pattern_vesa", "bolt_circle"),
+    "pcb": ("pcb_pocket", "pcb_standoffs"),
+    "connectors": ("cutout_usb_c", "cutout_rj45", "cutout_dc_barrel"),
+    "sealing": ("o_ring_gland_face", "gasket_channel_rect"),
+    "vents": ("louvre_panel", "perforated_panel", "perforation_tool"),
+    "inserts": ("insert_boss",),
+    "enclosures": ("elliptical_enclosure", "d_shaped_enclosure", "rectangular_enclosure_base_and_lid"),
+    "sections": ("Section", "section", "slice_heights", "sections_to_svg"),
+    "compare": ("ShapeDiff", "compare_shapes"),
+    "cache": ("CacheStats", "cache_stats", "clear_cache", "configure_cache"),
+    "instances": ("Instances", "instanced_mesh", "export_3mf"),
+    "csg": ("as_csg",),
+    "parallel": ("call", "run_parallel"),
+    "modes": ("Quality", "current_quality", "quality", "set_quality", "thread_geometry"),
+    "variants": ("SweepTable", "parameter_grid", "sweep"),
+    "points": (
+        "bolt_circle_points",
+        "rect_grid_points",
+        "staggered_grid_points",
+        "hex_grid_points",
+        "spiral_points",
+        "poisson_disk_points",
+        "filter_keepouts",
+        "transform_points",
+    ),
+    "placement": ("PanelRegion", "valid_positions"),
+    "estimates": ("Estimate", "estimate"),
+    "nesting": ("PlateLayout", "nest"),
+    "assembly": ("AssemblyBuilder", "geometry_hash"),
+    "fingerprints": ("fingerprint", "same_geometry"),
+    "specs": ("PartSpec", "build_spec", "spec_schema"),
+    "costs": ("ScriptCost", "analyze_script"),
+    "validity": ("Diagnostic", "ValidityReport", "check_shape", "trace_operations"),
+    "threads": ("Thread", "thread", "apply_thread", "threads_of"),
+    "hole_tools": ("hole_tool", "insert_tool", "bore_tool", "clearance_diameter"),
+    "profiles": ("revolve_profile",),
+}
+_EXPORTS: Dict[str, str] = {
+    name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names
+}
 
 __all__ = [
     "Fit",
     "TubeParams",
     "HoleSpec",
+    "ThreadSpec",
     "RectEnclosureParams",
     "tube",
     "apply_screw_holes",
     "linear_array",
     "grid_array",
     "circular_array",
+    "array_at_points",
     "pattern_nema17",
     "pattern_vesa",
     "bolt_circle",
@@ -32,11 +77,84 @@ __all__ = [
     "o_ring_gland_face",
     "gasket_channel_rect",
     "louvre_panel",
+    "perforated_panel",
+    "perforation_tool",
     "insert_boss",
     "elliptical_enclosure",
     "d_shaped_enclosure",
     "rectangular_enclosure_base_and_lid",
     "apply_fit_to_hole",
+    "Section",
+    "section",
+    "slice_heights",
+    "sections_to_svg",
+    "ShapeDiff",
+    "compare_shapes",
+    "CacheStats",
+    "cache_stats",
+    "clear_cache",
+    "configure_cache",
+    "Instances",
+    "instanced_mesh",
+    "export_3mf",
+    "as_csg",
+    "call",
+    "run_parallel",
+    "Quality",
+    "current_quality",
+    "quality",
+    "set_quality",
+    "thread_geometry",
+    "SweepTable",
+    "parameter_grid",
+    "sweep",
+    "bolt_circle_points",
+    "rect_grid_points",
+    "staggered_grid_points",
+    "hex_grid_points",
+    "spiral_points",
+    "poisson_disk_points",
+    "filter_keepouts",
+    "transform_points",
+    "PanelRegion",
+    "valid_positions",
+    "Estimate",
+    "estimate",
+    "PlateLayout",
+    "nest",
+    "AssemblyBuilder",
+    "geometry_hash",
+    "fingerprint",
+    "same_geometry",
+    "PartSpec",
+    "build_spec",
+    "spec_schema",
+    "ScriptCost",
+    "analyze_script",
+    "Diagnostic",
+    "ValidityReport",
+    "check_shape",
+    "trace_operations",
+    "Thread",
+    "thread",
+    "apply_thread",
+    "threads_of",
+    "hole_tool",
+    "insert_tool",
+    "bore_tool",
+    "clearance_diameter",
+    "revolve_profile",
 ]
 
 
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
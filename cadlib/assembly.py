@@ -0,0 +1,169 @@
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import cadquery as cq
+from OCP.TopLoc import TopLoc_Location
+
+from .fingerprints import _digest, _signature
+from .instances import _matrix_location, _trsf_matrix
+from .modes import tessellation
+from .points import PointsLike, as_points
+from .sections import _to_shape
+
+
+ShapeLike = Union[cq.Workplane, cq.Shape]
+LocationLike = Union[cq.Location, Sequence[float], None]
+ColorLike = Union[str, Tuple[float, float, float], Tuple[float, float, float, float], None]
+
+
+def geometry_hash(shape: ShapeLike, digits: int = 6) -> str:
+    """`fingerprint` without the position: translated copies hash the same.
+
+    Rotated or mirrored copies do not.
+    """
+
+    return _digest(_signature(_to_shape(shape), digits, anchored=False)[0])
+
+
+def _location(loc: LocationLike) -> cq.Location:
+    if loc is None:
+        return cq.Location()
+    if isinstance(loc, cq.Location):
+        return loc
+    return cq.Location(cq.Vector(*(tuple(float(v) for v in loc) + (0.0,))[:3]))
+
+
+def _color(color: ColorLike) -> Optional[cq.Color]:
+    if color is None or isinstance(color, cq.Color):
+        return color
+    if isinstance(color, str):
+        return cq.Color(color)
+    return cq.Color(*color)
+
+
+def _euler_xyz(rx: float, ry: float, rz: float) -> np.ndarray:
+    """Rotation matrix of a three.js 'XYZ' Euler triple (radians)."""
+
+    cx, sx, cy, sy, cz, sz = np.cos(rx), np.sin(rx), np.cos(ry), np.sin(ry), np.cos(rz), np.sin(rz)
+    rot_x = np.array([[1.0, 0.0, 0.0], [0.0, cx, -sx], [0.0, sx, cx]])
+    rot_y = np.array([[cy, 0.0, sy], [0.0, 1.0, 0.0], [-sy, 0.0, cy]])
+    rot_z = np.array([[cz, -sz, 0.0], [sz, cz, 0.0], [0.0, 0.0, 1.0]])
+    return rot_x @ rot_y @ rot_z
+
+
+@dataclass(frozen=True)
+class Node:
+    """One placed occurrence: `shape` indexes the builder's unique shapes."""
+
+    name: str
+    shape: int
+    location: cq.Location
+    color: Optional[cq.Color] = None
+
+
+class AssemblyBuilder:
+    """Places parts and hardware by transform; identical shapes are stored once.
+
+    Shapes are deduplicated by `geometry_hash`, and every occurrence of a
+    shape references the same BRep, so STEP export writes one product per
+    unique shape and GLB export one mesh.
+    """
+
+    def __init__(self, name: str = "assembly"):
+        self.name = name
+        self.shapes: List[cq.Shape] = []
+        self.nodes: List[Node] = []
+        self._by_hash: Dict[str, int] = {}
+        self._centroids: List[np.ndarray] = []
+        self._names: Dict[str, int] = {}
+
+    def _unique_name(self, name: str) -> str:
+        count = self._names.get(name, 0)
+        self._names[name] = count + 1
+        return name if count == 0 else f"{name}_{count + 1}"
+
+    def _shape_index(self, part: ShapeLike) -> Tuple[int, cq.Location]:
+        shape = _to_shape(part)
+        own = cq.Location(shape.wrapped.Location())
+        bare = cq.Shape.cast(shape.wrapped.Located(TopLoc_Location()))
+        # Same underlying BRep as a stored shape: skip hashing
+        for i, stored in enumerate(self.shapes):
+            if stored.wrapped.IsPartner(bare.wrapped):
+                return i, own
+        signature, centroid = _signature(bare, 6, anchored=False)
+        key = _digest(signature)
+        if key not in self._by_hash:
+            self._by_hash[key] = len(self.shapes)
+            self.shapes.append(bare)
+            self._centroids.append(centroid)
+        index = self._by_hash[key]
+        # A translated copy is the stored shape moved by the centroid offset
+        offset = centroid - self._centroids[index]
+        return index, own * cq.Location(cq.Vector(*offset.tolist()))
+
+    def add(self, part: ShapeLike, name: Optional[str] = None, loc: LocationLike = None, color: ColorLike = None) -> str:
+        """Place `part` at `loc` (a `cq.Location` or an (x, y, z) offset); returns the node name."""
+
+        index, own = self._shape_index(part)
+        node = Node(self._unique_name(name or f"part{index + 1}"), index, _location(loc) * own, _color(color))
+        self.nodes.append(node)
+        return node.name
+
+    def add_at(self, part: ShapeLike, points: PointsLike, name: Optional[str] = None, color: ColorLike = None) -> List[str]:
+        """Place copies of `part` (e.g. screws or inserts) at each point; they share one definition."""
+
+        return [self.add(part, name, tuple(p), color) for p in as_points(points)]
+
+    def add_scene_graph(self, root: Mapping[str, Any], parts: Mapping[str, ShapeLike]) -> List[str]:
+        """Add the nodes of a backend scene graph whose `componentId` is in `parts`.
+
+        Transforms follow the viewer: position, then rotation as XYZ Euler
+        radians, composed down the tree. Only unit scale is supported.
+        """
+
+        added: List[str] = []
+
+        def walk(node: Mapping[str, Any], parent: np.ndarray) -> None:
+            t = node.get("transform") or {}
+            if not np.allclose(t.get("scale", (1.0, 1.0, 1.0)), 1.0):
+                raise ValueError(f"scene node {node.get('name')!r} is scaled; only rigid transforms are supported")
+            local = np.column_stack([_euler_xyz(*t.get("rotation", (0.0, 0.0, 0.0))), t.get("position", (0.0, 0.0, 0.0))])
+            world = np.column_stack([parent[:, :3] @ local[:, :3], parent[:, :3] @ local[:, 3] + parent[:, 3]])
+            if node.get("componentId") in parts:
+                added.append(self.add(parts[node["componentId"]], node.get("name"), _matrix_location(world)))
+            for child in node.get("children", ()):
+                walk(child, world)
+
+        walk(root.get("root", root), np.column_stack([np.eye(3), np.zeros(3)]))
+        return added
+
+    def assembly(self) -> cq.Assembly:
+        assy = cq.Assembly(name=self.name)
+        for node in self.nodes:
+            assy.add(self.shapes[node.shape], name=node.name, loc=node.location, color=node.color)
+        return assy
+
+    def export(self, path: str, tolerance: Optional[float] = None, angular_tolerance: Optional[float] = None) -> None:
+        """Write .step, .glb or .gltf; meshes default to the runner's STL tolerances."""
+
+        ext = os.path.splitext(path)[1].lower()
+        kinds = {".step": "STEP", ".stp": "STEP", ".glb": "GLTF", ".gltf": "GLTF"}
+        if ext not in kinds:
+            raise ValueError(f"unsupported assembly format {ext!r}; expected .step, .glb or .gltf")
+        linear, angular = tessellation(0.1, 0.1)
+        self.assembly().export(
+            path,
+            kinds[ext],
+            tolerance=linear if tolerance is None else tolerance,
+            angularTolerance=angular if angular_tolerance is None else angular_tolerance,
+        )
+
+    def placements(self) -> List[dict]:
+        """Per-node name, shape index and 4×4 transform, JSON-ready."""
+
+        return [
+            {"name": n.name, "shape": n.shape, "matrix": np.vstack([_trsf_matrix(n.location), [0.0, 0.0, 0.0, 1.0]]).tolist()}
+            for n in self.nodes
+        ]
@@ -0,0 +1,42 @@
+import time
+
+import cadquery as cq
+
+from cadlib.csg import as_csg
+
+
+def _scene(nx: int, ny: int):
+    plate = cq.Workplane("XY").box(10 * nx + 20, 10 * ny + 20, 6)
+    holes = [
+        cq.Workplane("XY").center(-5 * (nx - 1) + 10 * i, -5 * (ny - 1) + 10 * j).circle(1.6).extrude(10).translate((0, 0, -5))
+        for i in range(nx)
+        for j in range(ny)
+    ]
+    bosses = [cq.Workplane("XY").center(-5 * (nx - 1) + 10 * i + 5, 0).circle(3).extrude(8) for i in range(0, nx - 1, 3)]
+    return plate, holes, bosses
+
+
+def main() -> None:
+    for nx, ny in ((4, 3), (10, 6), (20, 11)):
+        plate, holes, bosses = _scene(nx, ny)
+        start = time.perf_counter()
+        wp = plate
+        for b in bosses:
+            wp = wp.union(b)
+        for h in holes:
+            wp = wp.cut(h)
+        chained = time.perf_counter() - start
+
+        start = time.perf_counter()
+        node = as_csg(plate)
+        for b in bosses:
+            node = node + b
+        for h in holes:
+            node = node - h
+        node.evaluate()
+        lazy = time.perf_counter() - start
+        print(f"{len(holes):4d} cuts + {len(bosses):2d} unions: chained {chained:8.3f}s  csg {lazy:8.3f}s  speedup {chained / lazy:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
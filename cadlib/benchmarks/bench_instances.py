@@ -0,0 +1,50 @@
+import os
+import tempfile
+import time
+
+import cadquery as cq
+
+from cadlib.cache import configure_cache
+from cadlib.instances import export_3mf
+from cadlib.pcb import pcb_standoffs
+
+
+def _standoffs_per_location(hole_locations_xy, height, outer_d=6.0, hole_d=3.2, fillet=0.8):
+    # Legacy pcb_standoffs: build and fillet a fresh standoff at every hole
+    shapes = []
+    for (x, y) in hole_locations_xy:
+        standoff = cq.Workplane("XY").center(x, y).circle(outer_d / 2.0).extrude(height).faces("<Z").workplane().hole(hole_d)
+        if fillet > 0:
+            try:
+                standoff = standoff.edges("|Z").fillet(fillet)
+            except Exception:
+                pass
+        shapes.append(standoff.val())
+    return cq.Workplane("XY").add(cq.Compound.makeCompound(shapes))
+
+
+def main() -> None:
+    configure_cache(enabled=False)
+    tmp = tempfile.mkdtemp()
+    for n in (4, 64, 400):
+        pts = [(10.0 * (i % 20), 10.0 * (i // 20)) for i in range(n)]
+        start = time.perf_counter()
+        _standoffs_per_location(pts, 6.0)
+        legacy = time.perf_counter() - start
+        start = time.perf_counter()
+        standoffs = pcb_standoffs(pts, 6.0)
+        instanced = time.perf_counter() - start
+        print(f"{n:4d} standoffs: per-location {legacy:8.3f}s  instanced {instanced:8.3f}s  speedup {legacy / instanced:6.1f}x")
+
+        stl, tmf = os.path.join(tmp, "s.stl"), os.path.join(tmp, "s.3mf")
+        start = time.perf_counter()
+        cq.exporters.export(standoffs.val(), stl)
+        t_stl = time.perf_counter() - start
+        start = time.perf_counter()
+        export_3mf(standoffs, tmf)
+        t_3mf = time.perf_counter() - start
+        print(f"      export: STL {t_stl:8.3f}s {os.path.getsize(stl) / 1e6:8.2f} MB  3MF {t_3mf:8.3f}s {os.path.getsize(tmf) / 1e6:8.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
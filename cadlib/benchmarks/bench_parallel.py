@@ -0,0 +1,50 @@
+import os
+import time
+
+from cadlib.cache import configure_cache
+from cadlib.enclosures import d_shaped_enclosure, elliptical_enclosure, rectangular_enclosure_base_and_lid
+from cadlib.parallel import call, get_pool, run_parallel, shutdown_pool
+from cadlib.validators import RectEnclosureParams
+
+
+def _calls(n: int):
+    # Distinct sizes so no call is served from a cache
+    calls = []
+    for i in range(n):
+        k = i % 3
+        if k == 0:
+            calls.append(call(rectangular_enclosure_base_and_lid, RectEnclosureParams(length=80 + i, width=50 + i)))
+        elif k == 1:
+            calls.append(call(elliptical_enclosure, 80 + i, 50, 30, 2, 8))
+        else:
+            calls.append(call(d_shaped_enclosure, 60 + i, 40, 30, 2, 8))
+    return calls
+
+
+def main() -> None:
+    os.environ["CADLIB_CACHE"] = "0"  # inherited by the worker processes
+    configure_cache(enabled=False)
+    cores = os.cpu_count() or 1
+    print(f"{cores} CPU cores")
+    n = 32
+    start = time.perf_counter()
+    run_parallel(_calls(n), max_workers=1)
+    sequential = time.perf_counter() - start
+    print(f"{n} parts sequential: {sequential:8.3f}s")
+    for workers in (2, 4, 8, 16):
+        if workers > cores:
+            print(f"{workers:2d} workers: skipped (only {cores} cores)")
+            continue
+        start = time.perf_counter()
+        get_pool(workers)
+        run_parallel([call(os.getpid)] * workers, max_workers=workers)
+        startup = time.perf_counter() - start
+        start = time.perf_counter()
+        run_parallel(_calls(n), max_workers=workers)
+        elapsed = time.perf_counter() - start
+        print(f"{workers:2d} workers: {elapsed:8.3f}s  speedup {sequential / elapsed:6.1f}x  (pool start {startup:.2f}s, once per process)")
+    shutdown_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+import time
+
+import numpy as np
+
+from cadlib.placement import PanelRegion
+from cadlib.points import hex_grid_points
+
+
+def _region() -> PanelRegion:
+    return PanelRegion.from_polygon([(0, 0), (200, 0), (200, 120), (100, 160), (0, 120)]).with_keepouts(
+        circles=[(50, 50, 10), (150, 50, 10)], rects=[(90, 0, 110, 30)]
+    )
+
+
+def _timed(fn, repeat: int) -> float:
+    fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    region = _region()
+    for pitch in (3.0, 1.5, 0.75):
+        cand = hex_grid_points(region.bounds(), pitch)
+        kept = region.filter(cand, 0.5)
+        seconds = _timed(lambda: region.filter(cand, 0.5), 5)
+        rate = len(cand) / seconds if seconds else np.inf
+        print(f"pitch {pitch:4.2f} mm: {len(cand):7d} candidates -> {len(kept):7d} kept in {seconds * 1e3:8.2f} ms ({rate / 1e6:5.2f} M/s)")
+
+
+if __name__ == "__main__":
+    main()
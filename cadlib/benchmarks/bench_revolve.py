@@ -0,0 +1,60 @@
+import time
+
+import cadquery as cq
+
+from cadlib.cache import configure_cache
+from cadlib.cylinders import tube
+from cadlib.inserts import insert_boss
+from cadlib.validators import TubeParams
+
+
+def _boolean_tube(params: TubeParams) -> cq.Workplane:
+    """The cylinder-minus-void construction `tube` used before profiles."""
+
+    r = params.outer_diameter / 2.0
+    body = cq.Workplane("XY").circle(r).extrude(params.height, both=True)
+    start = -params.height / 2.0 + params.end_cap_thickness
+    void = cq.Workplane("XY").workplane(offset=start).circle(r - params.wall_thickness).extrude(params.height - params.end_cap_thickness)
+    return body.cut(void)
+
+
+def _boolean_boss(height: float = 8.0) -> cq.Workplane:
+    """The hole-plus-groove construction `insert_boss("M3")` used before profiles."""
+
+    od = 4.6 + 2 * 1.2
+    boss = cq.Workplane("XY").circle(od / 2.0).extrude(height).hole(4.4)
+    groove = cq.Workplane("XY").workplane(offset=height * 0.6).circle(od / 2.0).circle(od / 2.0 - 0.3).extrude(0.6)
+    return boss.cut(groove)
+
+
+def _time(build, repeat: int):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        shape = build().val()
+    built = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(repeat):
+        build().val().tessellate(0.01, 0.1)
+    meshed = time.perf_counter() - start - built
+    return built / repeat, meshed / repeat, len(shape.Faces())
+
+
+def main() -> None:
+    configure_cache(enabled=False)
+    params = TubeParams(outer_diameter=30, wall_thickness=2, height=40, end_style="one_end_closed")
+    cases = [
+        ("tube", lambda: _boolean_tube(params), lambda: tube(params)),
+        ("insert_boss", _boolean_boss, lambda: insert_boss("M3", 8.0)),
+    ]
+    for name, boolean, revolved in cases:
+        b_build, b_mesh, b_faces = _time(boolean, 50)
+        r_build, r_mesh, r_faces = _time(revolved, 50)
+        print(
+            f"{name:12s} boolean {b_build * 1e3:7.2f} ms + mesh {b_mesh * 1e3:7.2f} ms ({b_faces} faces)  "
+            f"revolve {r_build * 1e3:7.2f} ms + mesh {r_mesh * 1e3:7.2f} ms ({r_faces} faces)  "
+            f"build speedup {b_build / r_build:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+import time
+
+import cadquery as cq
+
+from cadlib.fasteners import apply_screw_holes
+from cadlib.validators import HoleSpec
+
+
+def _grid(n: int, pitch: float = 8.0):
+    cols = int(n ** 0.5 + 0.999)
+    x0 = -((cols - 1) * pitch) / 2.0
+    return [(x0 + (i % cols) * pitch, x0 + (i // cols) * pitch, 2.5) for i in range(n)]
+
+
+def main() -> None:
+    spec = HoleSpec(size="M3", fit="SNAP", through=True, counterbore=True, head_type="socket")
+    for n in (4, 50, 500):
+        pts = _grid(n)
+        side = (int(n ** 0.5 + 0.999) + 1) * 8.0
+        plate = cq.Workplane("XY").rect(side, side).extrude(5)
+        timings = {}
+        for batched in (False, True):
+            start = time.perf_counter()
+            apply_screw_holes(plate, pts, spec, batched=batched)
+            timings[batched] = time.perf_counter() - start
+        print(
+            f"{n:4d} holes: sequential {timings[False]:8.3f}s  batched {timings[True]:8.3f}s  "
+            f"speedup {timings[False] / timings[True]:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import time
+
+import cadquery as cq
+
+from cadlib.vents import louvre_panel, perforated_panel, perforation_tool
+
+
+def _louvre_per_slot(length, width, thickness, slot_width, slot_pitch, tilt_deg=35.0):
+    # Legacy louvre_panel: one boolean per slot
+    plate = cq.Workplane("XY").rect(length, width).extrude(thickness)
+    n_slots = int((width - slot_pitch) // slot_pitch)
+    y0 = -((n_slots - 1) * slot_pitch) / 2.0
+    for i in range(n_slots):
+        slot = (
+            cq.Workplane("XY")
+            .workplane(offset=thickness / 2.0)
+            .transformed(rotate=(tilt_deg, 0, 0))
+            .center(0, y0 + i * slot_pitch)
+            .rect(length * 0.8, slot_width)
+            .extrude(thickness)
+        )
+        plate = plate.cut(slot)
+    return plate
+
+
+def _timed(fn, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    for width in (60, 150, 400):
+        args = (200, width, 3, 2, 4)
+        legacy = _timed(_louvre_per_slot, *args)
+        batched = _timed(louvre_panel, *args)
+        print(f"louvres {int((width - 4) // 4):4d} slots: per-slot {legacy:8.3f}s  batched {batched:8.3f}s  speedup {legacy / batched:6.1f}x")
+
+    for side in (60, 120):
+        region = (-side / 2 + 5, -side / 2 + 5, side / 2 - 5, side / 2 - 5)
+        plate = cq.Workplane("XY").rect(side, side).extrude(2)
+        cut = _timed(lambda: plate.val().cut(perforation_tool(region, 2, "round", 3, 5).val()))
+        face = _timed(perforated_panel, side, side, 2, "round", 3, 5, margin=5)
+        print(f"perforation {side}x{side} mm: boolean cut {cut:8.3f}s  face extrude {face:8.3f}s  speedup {cut / face:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
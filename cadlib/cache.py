@@ -0,0 +1,460 @@
+import functools
+import hashlib
+import inspect
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple, TypeVar
+
+import cadquery as cq
+from pydantic import BaseModel
+
+from .modes import current_quality, real_threads
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Rough in-memory footprint of a BRep, in bytes per topological entity
+_COST_PER_FACE = 4096
+_COST_PER_EDGE = 512
+_COST_PER_VERTEX = 128
+DEFAULT_MAX_COST = 256 * 1024 * 1024
+DEFAULT_DISK_MAX_BYTES = 1024 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of shape cache counters."""
+
+    hits: int
+    misses: int
+    evictions: int
+    bypassed: int
+    entries: int
+    cost: int
+    max_cost: int
+    disk_hits: int = 0
+    disk_writes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class _Entry:
+    __slots__ = ("shapes", "plane", "is_workplane", "cost")
+
+    def __init__(self, shapes: Tuple[cq.Shape, ...], plane: Optional[cq.Plane], is_workplane: bool, cost: int):
+        self.shapes = shapes
+        self.plane = plane
+        self.is_workplane = is_workplane
+        self.cost = cost
+
+
+class ShapeCache:
+    """LRU cache of builder results bounded by an estimated memory cost in bytes."""
+
+    def __init__(self, max_cost: int = DEFAULT_MAX_COST):
+        self.max_cost = max_cost
+        self.enabled = os.environ.get("CADLIB_CACHE", "1") not in ("0", "false", "off")
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._cost = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._bypassed = 0
+        self._disk_hits = 0
+        self._disk_writes = 0
+        self.disk: Optional["DiskCache"] = None
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[_Entry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry
+
+    def put(self, key: str, entry: _Entry) -> None:
+        if entry.cost > self.max_cost:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._cost -= old.cost
+            self._entries[key] = entry
+            self._cost += entry.cost
+            self._shrink()
+
+    def _shrink(self) -> None:
+        while self._cost > self.max_cost and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._cost -= evicted.cost
+            self._evictions += 1
+
+    def resize(self, max_cost: int) -> None:
+        with self._lock:
+            self.max_cost = max_cost
+            self._shrink()
+
+    def note_bypass(self) -> None:
+        with self._lock:
+            self._bypassed += 1
+
+    def note_disk(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self._disk_hits += 1
+            else:
+                self._disk_writes += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._cost = 0
+            self._hits = self._misses = self._evictions = self._bypassed = 0
+            self._disk_hits = self._disk_writes = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                bypassed=self._bypassed,
+                entries=len(self._entries),
+                cost=self._cost,
+                max_cost=self.max_cost,
+                disk_hits=self._disk_hits,
+                disk_writes=self._disk_writes,
+            )
+
+
+@functools.lru_cache(maxsize=None)
+def library_version() -> str:
+    """Hash of the cadlib sources and kernel versions; part of every disk cache key."""
+
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"cadquery={cq.__version__}".encode())
+    try:
+        import OCP
+
+        h.update(f"OCP={OCP.__version__}".encode())
+    except (ImportError, AttributeError):
+        pass
+    root = Path(__file__).resolve().parent
+    for path in sorted(root.rglob("*.py")):
+        rel = path.relative_to(root).as_posix()
+        if rel.startswith(("tests/", "benchmarks/")):
+            continue
+        h.update(rel.encode())
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+class DiskCache:
+    """Binary BRep files shared by processes, bounded by total size with LRU eviction.
+
+    Each entry is `<key>.brep` (binary BRep, readable by any OCCT tool) plus a
+    small `<key>.json` sidecar describing how to rebuild the builder result.
+    Files are written to a temp name and renamed, so readers never see partial
+    data; file mtime records the last use and the oldest files are evicted
+    first under an exclusive lock.
+    """
+
+    def __init__(self, directory: os.PathLike, max_bytes: int = DEFAULT_DISK_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Scan for eviction after roughly this many bytes written by this process
+        self._unscanned = max(max_bytes // 20, 1)
+
+    def _paths(self, key: str) -> Tuple[Path, Path]:
+        shard = self.directory / key[:2]
+        return shard / f"{key}.brep", shard / f"{key}.json"
+
+    def get(self, key: str) -> Optional[_Entry]:
+        brep, meta = self._paths(key)
+        try:
+            data = brep.read_bytes()
+            info = json.loads(meta.read_text())
+            shape = cq.Shape.importBin(io.BytesIO(data))
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Corrupt or truncated entry: drop it and rebuild
+            self._remove(brep, meta)
+            return None
+        try:
+            os.utime(brep)
+        except OSError:
+            pass
+        shapes = tuple(shape) if info["n_shapes"] > 1 else (shape,)
+        plane = None
+        if info.get("plane"):
+            origin, x_dir, normal = info["plane"]
+            plane = cq.Plane(cq.Vector(*origin), cq.Vector(*x_dir), cq.Vector(*normal))
+        return _Entry(shapes, plane, info["is_workplane"], _estimate_cost(shapes))
+
+    def put(self, key: str, entry: _Entry) -> None:
+        brep, meta = self._paths(key)
+        shape = entry.shapes[0] if len(entry.shapes) == 1 else cq.Compound.makeCompound(list(entry.shapes))
+        buf = io.BytesIO()
+        shape.exportBin(buf)
+        info = {"n_shapes": len(entry.shapes), "is_workplane": entry.is_workplane, "plane": None}
+        if entry.plane is not None:
+            p = entry.plane
+            info["plane"] = [p.origin.toTuple(), p.xDir.toTuple(), p.zDir.toTuple()]
+        brep.parent.mkdir(exist_ok=True)
+        # Sidecar first: a visible .brep always has its metadata next to it
+        self._atomic_write(meta, json.dumps(info).encode())
+        self._atomic_write(brep, buf.getvalue())
+        self._unscanned -= len(buf.getvalue())
+        if self._unscanned <= 0:
+            self.evict()
+
+    def _atomic_write(self, path: Path, data: bytes) -> None:
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    @staticmethod
+    def _remove(*paths: Path) -> None:
+        for path in paths:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def _files(self) -> List[Tuple[float, int, Path]]:
+        files = []
+        for shard in self.directory.iterdir():
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard):
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                files.append((st.st_mtime, st.st_size, Path(entry.path)))
+        return files
+
+    def size(self) -> int:
+        return sum(size for _, size, _ in self._files())
+
+    def evict(self, target: Optional[int] = None) -> None:
+        """Delete least recently used entries until the cache is under `target` bytes (default 90% of the cap)."""
+
+        target = int(self.max_bytes * 0.9) if target is None else target
+        self._unscanned = max(self.max_bytes // 20, 1)
+        with open(self.directory / ".lock", "a+") as lock:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    return  # another process is already evicting
+            files = self._files()
+            now = time.time()
+            total = 0
+            breps = []
+            for mtime, size, path in files:
+                if path.suffix == ".tmp":
+                    # Leftover from a crashed writer
+                    if now - mtime > 3600:
+                        self._remove(path)
+                    continue
+                total += size
+                if path.suffix == ".brep":
+                    breps.append((mtime, size, path))
+            breps.sort()
+            for _, size, path in breps:
+                if total <= target:
+                    break
+                meta = path.with_suffix(".json")
+                meta_size = meta.stat().st_size if meta.exists() else 0
+                self._remove(path, meta)
+                total -= size + meta_size
+
+    def clear(self) -> None:
+        self.evict(target=0)
+
+
+_CACHE = ShapeCache()
+
+
+def cache_stats() -> CacheStats:
+    """Return hit/miss/eviction counters and current cost of the shape cache."""
+
+    return _CACHE.stats()
+
+
+def clear_cache() -> None:
+    """Drop all cached shapes and reset counters."""
+
+    _CACHE.clear()
+
+
+def configure_cache(
+    enabled: Optional[bool] = None,
+    max_cost: Optional[int] = None,
+    disk_dir: Optional[os.PathLike] = None,
+    disk_max_bytes: int = DEFAULT_DISK_MAX_BYTES,
+    disable_disk: bool = False,
+) -> None:
+    """Enable/disable the shape cache, change its cost bound (bytes, estimated) or attach a disk tier.
+
+    The cache can also be disabled with the environment variable CADLIB_CACHE=0.
+    The disk tier is enabled at import when CADLIB_DISK_CACHE_DIR is set
+    (size cap in MB via CADLIB_DISK_CACHE_MAX_MB).
+    """
+
+    if enabled is not None:
+        _CACHE.enabled = enabled
+    if max_cost is not None:
+        _CACHE.resize(max_cost)
+    if disable_disk:
+        _CACHE.disk = None
+    elif disk_dir is not None:
+        _CACHE.disk = DiskCache(disk_dir, disk_max_bytes)
+
+
+if os.environ.get("CADLIB_DISK_CACHE_DIR"):
+    configure_cache(
+        disk_dir=os.environ["CADLIB_DISK_CACHE_DIR"],
+        disk_max_bytes=int(float(os.environ.get("CADLIB_DISK_CACHE_MAX_MB", "1024")) * 1024 * 1024),
+    )
+
+
+def _canonical(value: Any) -> Any:
+    """JSON-compatible canonical form of a builder argument; raises TypeError if unsupported."""
+
+    if isinstance(value, BaseModel):
+        return {"__model__": type(value).__name__, "fields": _canonical(value.model_dump(mode="json"))}
+    if isinstance(value, Enum):
+        return {"__enum__": type(value).__name__, "name": value.name}
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    if isinstance(value, (int, float)):
+        # 3 and 3.0 build the same geometry; -0.0 and 0.0 too
+        return float(value) + 0.0
+    if hasattr(value, "tolist") and hasattr(value, "dtype"):
+        return _canonical(value.tolist())
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    raise TypeError(f"uncacheable argument of type {type(value).__name__}")
+
+
+def cache_key(func: Callable[..., Any], *args: Any, **kwargs: Any) -> str:
+    """Canonical hash of a builder call; defaults are applied so equivalent calls collide.
+
+    The active quality mode is part of the key, so preview and final results
+    never mix; so is the thread geometry switch when it is on.
+    """
+
+    bound = inspect.signature(func).bind(*args, **kwargs)
+    bound.apply_defaults()
+    call = {"fn": f"{func.__module__}.{func.__qualname__}", "args": _canonical(dict(bound.arguments)), "quality": current_quality()}
+    if real_threads():
+        call["threads"] = "real"
+    payload = json.dumps(call, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode(), digest_size=20).hexdigest()
+
+
+def _estimate_cost(shapes: Tuple[cq.Shape, ...]) -> int:
+    cost = 0
+    for s in shapes:
+        cost += _COST_PER_FACE * len(s.Faces()) + _COST_PER_EDGE * len(s.Edges()) + _COST_PER_VERTEX * len(s.Vertices())
+    return max(cost, 1)
+
+
+def _to_entry(result: Any) -> Optional[_Entry]:
+    if isinstance(result, cq.Workplane):
+        shapes = tuple(result.vals())
+        if not shapes or not all(isinstance(s, cq.Shape) for s in shapes):
+            return None
+        plane, is_workplane = result.plane, True
+    elif isinstance(result, cq.Shape):
+        shapes, plane, is_workplane = (result,), None, False
+    else:
+        return None
+    # Keep private handles so in-place moves of the returned result do not leak in
+    shapes = tuple(s.moved(cq.Location()) for s in shapes)
+    return _Entry(shapes, plane, is_workplane, _estimate_cost(shapes))
+
+
+def _from_entry(entry: _Entry) -> Any:
+    # A fresh located handle per use: callers may move()/locate() it in place
+    # without touching the cached shape, while the BRep data stays shared.
+    shapes = [s.moved(cq.Location()) for s in entry.shapes]
+    if entry.is_workplane:
+        return cq.Workplane(entry.plane).newObject(shapes)
+    return shapes[0]
+
+
+def cached(func: F) -> F:
+    """Memoize a pure parametric builder in the shared shape cache.
+
+    Results (a Workplane of shapes or a single Shape) are keyed by the
+    canonical arguments; calls with unsupported argument types build directly.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not _CACHE.enabled:
+            return func(*args, **kwargs)
+        try:
+            key = cache_key(func, *args, **kwargs)
+        except TypeError:
+            _CACHE.note_bypass()
+            return func(*args, **kwargs)
+        entry = _CACHE.get(key)
+        if entry is not None:
+            return _from_entry(entry)
+        disk = _CACHE.disk
+        if disk is not None:
+            disk_key = hashlib.blake2b(f"{key}:{library_version()}".encode(), digest_size=20).hexdigest()
+            entry = disk.get(disk_key)
+            if entry is not None:
+                _CACHE.note_disk(hit=True)
+                _CACHE.put(key, entry)
+                return _from_entry(entry)
+        result = func(*args, **kwargs)
+        entry = _to_entry(result)
+        if entry is not None:
+            _CACHE.put(key, entry)
+            if disk is not None:
+                try:
+                    disk.put(disk_key, entry)
+                    _CACHE.note_disk(hit=False)
+                except OSError:
+                    pass  # a read-only or full cache dir must not fail the build
+        return result
+
+    wrapper.__wrapped__ = func  # type: ignore[attr-defined]
+    return wrapper  # type: ignore[return-value]
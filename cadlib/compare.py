@@ -0,0 +1,314 @@
+from dataclasses import dataclass
+from typing import Tuple, Union
+
+import numpy as np
+import cadquery as cq
+from scipy.spatial import cKDTree
+
+from .sections import _to_shape, _weld_mesh
+
+
+Mesh = Tuple[np.ndarray, np.ndarray]
+ShapeOrMesh = Union[cq.Workplane, cq.Shape, Mesh]
+
+
+@dataclass(frozen=True)
+class ShapeDiff:
+    """Distances and volume change between two part versions (mm / mm³).
+
+    `changed_a` / `changed_b` flag the sampled points of each version that lie
+    farther than the comparison threshold from the other surface.
+    """
+
+    hausdorff: float
+    mean_distance: float
+    mean_a_to_b: float
+    mean_b_to_a: float
+    volume_a: float
+    volume_b: float
+    points_a: np.ndarray
+    points_b: np.ndarray
+    changed_a: np.ndarray
+    changed_b: np.ndarray
+    threshold: float
+
+    @property
+    def volume_delta(self) -> float:
+        return self.volume_b - self.volume_a
+
+    @property
+    def changed_fraction(self) -> float:
+        total = len(self.changed_a) + len(self.changed_b)
+        return float(self.changed_a.sum() + self.changed_b.sum()) / total if total else 0.0
+
+    def converged(self, distance_tol: float = 0.05, volume_rel_tol: float = 1e-3) -> bool:
+        """True when the versions are within tolerance, i.e. another iteration changed nothing useful."""
+
+        scale = max(abs(self.volume_a), abs(self.volume_b), 1e-9)
+        return self.hausdorff <= distance_tol and abs(self.volume_delta) / scale <= volume_rel_tol
+
+    def summary(self) -> dict:
+        return {
+            "hausdorff": self.hausdorff,
+            "mean_distance": self.mean_distance,
+            "mean_a_to_b": self.mean_a_to_b,
+            "mean_b_to_a": self.mean_b_to_a,
+            "volume_a": self.volume_a,
+            "volume_b": self.volume_b,
+            "volume_delta": self.volume_delta,
+            "changed_fraction": self.changed_fraction,
+            "threshold": self.threshold,
+        }
+
+
+def mesh_volume(verts: np.ndarray, tris: np.ndarray) -> float:
+    """Enclosed volume of a closed triangle mesh (signed tetrahedron sum)."""
+
+    a, b, c = verts[tris[:, 0]], verts[tris[:, 1]], verts[tris[:, 2]]
+    return float(np.einsum("ij,ij->i", a, np.cross(b, c)).sum() / 6.0)
+
+
+def sample_surface(verts: np.ndarray, tris: np.ndarray, n: int, seed: int = 0) -> np.ndarray:
+    """Draw `n` area-weighted random points on the mesh surface."""
+
+    a, b, c = verts[tris[:, 0]], verts[tris[:, 1]], verts[tris[:, 2]]
+    areas = 0.5 * np.linalg.norm(np.cross(b - a, c - a), axis=1)
+    if n <= 0 or areas.sum() <= 0:
+        return np.empty((0, 3))
+    rng = np.random.default_rng(seed)
+    idx = rng.choice(len(tris), size=n, p=areas / areas.sum())
+    r1 = np.sqrt(rng.random((n, 1)))
+    r2 = rng.random((n, 1))
+    return (1 - r1) * a[idx] + r1 * (1 - r2) * b[idx] + r1 * r2 * c[idx]
+
+
+def load_stl(path: str) -> Mesh:
+    """Read a binary or ASCII STL into welded (vertices, triangles) arrays."""
+
+    with open(path, "rb") as fh:
+        data = fh.read()
+    n_tri = int.from_bytes(data[80:84], "little") if len(data) >= 84 else -1
+    if len(data) == 84 + 50 * n_tri:
+        records = np.frombuffer(data, dtype=np.dtype([("n", "<f4", 3), ("v", "<f4", (3, 3)), ("a", "<u2")]), count=n_tri, offset=84)
+        corners = records["v"].astype(float).reshape(-1, 3)
+    else:
+        text = data.decode("utf-8", errors="ignore").split()
+        coords = [text[i + 1 : i + 4] for i, tok in enumerate(text) if tok == "vertex"]
+        corners = np.array(coords, dtype=float).reshape(-1, 3)
+    keys = np.round(corners / 1e-6).astype(np.int64)
+    _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    return corners[first], inverse.reshape(-1, 3)
+
+
+def write_stl(path: str, verts: np.ndarray, tris: np.ndarray) -> None:
+    """Write a triangle mesh as binary STL."""
+
+    a, b, c = verts[tris[:, 0]], verts[tris[:, 1]], verts[tris[:, 2]]
+    normals = np.cross(b - a, c - a)
+    normals /= np.maximum(np.linalg.norm(normals, axis=1, keepdims=True), 1e-300)
+    records = np.zeros(len(tris), dtype=np.dtype([("n", "<f4", 3), ("v", "<f4", (3, 3)), ("a", "<u2")]))
+    records["n"] = normals
+    records["v"] = np.stack([a, b, c], axis=1)
+    with open(path, "wb") as fh:
+        fh.write(b"cadlib".ljust(80, b"\0"))
+        fh.write(len(tris).to_bytes(4, "little"))
+        fh.write(records.tobytes())
+
+
+def _segment_distance(p: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    ab = b - a
+    denom = np.maximum(np.einsum("...i,...i->...", ab, ab), 1e-30)
+    t = np.clip(np.einsum("...i,...i->...", p - a, ab) / denom, 0.0, 1.0)
+    return np.linalg.norm(p - (a + t[..., None] * ab), axis=-1)
+
+
+def _triangle_distance(p: np.ndarray, a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """Exact point/triangle distances, broadcast over leading axes."""
+
+    n = np.cross(b - a, c - a)
+    n_len = np.linalg.norm(n, axis=-1)
+    unit = n / np.maximum(n_len, 1e-30)[..., None]
+    height = np.einsum("...i,...i->...", p - a, unit)
+    proj = p - height[..., None] * unit
+    inside = (
+        (np.einsum("...i,...i->...", np.cross(b - a, proj - a), n) >= 0)
+        & (np.einsum("...i,...i->...", np.cross(c - b, proj - b), n) >= 0)
+        & (np.einsum("...i,...i->...", np.cross(a - c, proj - c), n) >= 0)
+        & (n_len > 1e-12)
+    )
+    edge = np.minimum(np.minimum(_segment_distance(p, a, b), _segment_distance(p, b, c)), _segment_distance(p, c, a))
+    return np.where(inside, np.abs(height), edge)
+
+
+def _triangle_proxies(a: np.ndarray, b: np.ndarray, c: np.ndarray, spacing: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Grid points on every triangle so each surface point is near a proxy of its own triangle.
+
+    The grid runs along the triangle's shortest edge and one adjacent edge, so
+    long slivers get a row of points instead of a dense square grid.
+    """
+
+    edges = np.stack([np.linalg.norm(b - a, axis=1), np.linalg.norm(c - b, axis=1), np.linalg.norm(a - c, axis=1)], axis=1)
+    shortest = edges.argmin(axis=1)
+    # Rotate corners so (p0, p1) is the shortest edge
+    corners = np.stack([a, b, c], axis=1)
+    order = (shortest[:, None] + np.arange(3)[None, :]) % 3
+    rows = np.arange(len(a))[:, None]
+    p0, p1, p2 = (corners[rows, order][:, i] for i in range(3))
+    m1 = np.maximum(np.ceil(np.linalg.norm(p1 - p0, axis=1) / spacing), 1).astype(np.int64)
+    m2 = np.maximum(np.ceil(np.linalg.norm(p2 - p0, axis=1) / spacing), 1).astype(np.int64)
+    m3 = np.maximum(np.ceil(np.linalg.norm(p2 - p1, axis=1) / spacing), 1).astype(np.int64)
+
+    counts = (m1 + 1) * (m2 + 1)
+    tri = np.repeat(np.arange(len(a)), counts)
+    local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    u = (local // (m2[tri] + 1)) / m1[tri]
+    v = (local % (m2[tri] + 1)) / m2[tri]
+    keep = u + v <= 1.0 + 1e-9
+    tri, u, v = tri[keep], u[keep], v[keep]
+    grid = p0[tri] + u[:, None] * (p1[tri] - p0[tri]) + v[:, None] * (p2[tri] - p0[tri])
+
+    # Points along the third edge close the gap the clipped grid leaves there
+    counts3 = m3 + 1
+    tri3 = np.repeat(np.arange(len(a)), counts3)
+    t3 = (np.arange(counts3.sum()) - np.repeat(np.cumsum(counts3) - counts3, counts3)) / m3[tri3]
+    edge = p1[tri3] + t3[:, None] * (p2[tri3] - p1[tri3])
+    return np.vstack([grid, edge]), np.concatenate([tri, tri3])
+
+
+def _expand_ranges(counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Owner index and local offset for each item of variable-length runs."""
+
+    owner = np.repeat(np.arange(len(counts)), counts)
+    local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return owner, local
+
+
+def _box_cells(lo: np.ndarray, hi: np.ndarray, dims: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Flattened voxel keys of every cell in the integer boxes [lo, hi]."""
+
+    ext = hi - lo + 1
+    owner, local = _expand_ranges(ext.prod(axis=1))
+    ny, nz = ext[owner, 1], ext[owner, 2]
+    ix = lo[owner, 0] + local // (ny * nz)
+    iy = lo[owner, 1] + (local // nz) % ny
+    iz = lo[owner, 2] + local % nz
+    return owner, (ix * dims[1] + iy) * dims[2] + iz
+
+
+def surface_distance(points: np.ndarray, verts: np.ndarray, tris: np.ndarray, k: int = 8, budget: int = 2_000_000) -> np.ndarray:
+    """Exact distance from each point to a triangle mesh surface.
+
+    A KD-tree over per-triangle grid proxies picks `k` candidate triangles and
+    yields an upper bound U per point. Triangles are also hashed into the
+    voxels holding a finer grid of their proxies, so every triangle that could
+    lie within U of a point is then checked exactly. Hashing proxies rather
+    than bounding boxes keeps the voxel count of long, tilted triangles
+    proportional to their size. Point/triangle pairs are evaluated vectorized,
+    in batches of at most `budget` pairs.
+    """
+
+    if len(points) == 0 or len(tris) == 0:
+        return np.full(len(points), np.inf)
+    a, b, c = verts[tris[:, 0]], verts[tris[:, 1]], verts[tris[:, 2]]
+    tri_lo = np.minimum(np.minimum(a, b), c)
+    tri_hi = np.maximum(np.maximum(a, b), c)
+    area = 0.5 * np.linalg.norm(np.cross(b - a, c - a), axis=1).sum()
+    cell = max(2.0 * np.sqrt(area / len(tris)), 1e-6)
+
+    # Pass 1: upper bound from the triangles of the nearest proxies
+    proxy_pts, proxy_ids = _triangle_proxies(a, b, c, cell)
+    k = min(k, len(proxy_pts))
+    _, nearest = cKDTree(proxy_pts).query(points, k=k)
+    cand = proxy_ids[nearest.reshape(len(points), k)]
+    upper = _triangle_distance(points[:, None, :], a[cand], b[cand], c[cand]).min(axis=1)
+
+    # Voxel hash of triangles by the cells of their proxies. A grid cell's
+    # first corner always lies on the triangle and its sides are at most
+    # reach/2 long, so every triangle point is within `reach` of a proxy.
+    reach = cell / 2.0
+    fine_pts, fine_ids = _triangle_proxies(a, b, c, reach / 2.0)
+    origin = tri_lo.min(axis=0)
+    dims = np.floor((tri_hi.max(axis=0) - origin) / cell).astype(np.int64) + 1
+    ijk = np.clip(np.floor((fine_pts - origin) / cell).astype(np.int64), 0, dims - 1)
+    pairs = np.unique(((ijk[:, 0] * dims[1] + ijk[:, 1]) * dims[2] + ijk[:, 2]) * len(tris) + fine_ids)
+    keys, owner = pairs // len(tris), pairs % len(tris)
+    cell_keys, cell_start = np.unique(keys, return_index=True)
+    cell_end = np.r_[cell_start[1:], len(keys)]
+
+    # Pass 2: exact minimum over every triangle with a proxy within U + reach
+    p_lo = np.clip(np.floor((points - (upper + reach)[:, None] - origin) / cell).astype(np.int64), 0, dims - 1)
+    p_hi = np.clip(np.floor((points + (upper + reach)[:, None] - origin) / cell).astype(np.int64), 0, dims - 1)
+    n_cells = (p_hi - p_lo + 1).prod(axis=1)
+    out = upper.copy()
+    lo = 0
+    while lo < len(points):
+        # Grow the batch until its cell count reaches a fraction of the pair budget
+        hi = lo + max(1, int(np.searchsorted(np.cumsum(n_cells[lo:]), budget // 16, side="right")))
+        pt_idx, cells = _box_cells(p_lo[lo:hi], p_hi[lo:hi], dims)
+        slot = np.searchsorted(cell_keys, cells)
+        slot = np.minimum(slot, len(cell_keys) - 1)
+        hit = cell_keys[slot] == cells
+        pt_idx, slot = pt_idx[hit], slot[hit]
+        counts = cell_end[slot] - cell_start[slot]
+        rows, local = _expand_ranges(counts)
+        tri = owner[cell_start[slot][rows] + local]
+        pt = pt_idx[rows] + lo
+        # Drop triangles whose box is out of reach, then the repeats of triangles spanning several cells
+        gap = np.maximum(np.maximum(tri_lo[tri] - points[pt], points[pt] - tri_hi[tri]), 0.0)
+        near = np.einsum("ij,ij->i", gap, gap) <= upper[pt] ** 2
+        pairs = np.unique(pt[near] * len(tris) + tri[near])
+        pt, tri = pairs // len(tris), pairs % len(tris)
+        for s in range(0, len(pt), budget):
+            ps, ts = pt[s : s + budget], tri[s : s + budget]
+            d = _triangle_distance(points[ps], a[ts], b[ts], c[ts])
+            np.minimum.at(out, ps, d)
+        lo = hi
+    return out
+
+
+def _mesh_and_volume(item: ShapeOrMesh, tolerance: float) -> Tuple[np.ndarray, np.ndarray, float]:
+    if isinstance(item, tuple):
+        verts, tris = np.asarray(item[0], dtype=float), np.asarray(item[1], dtype=np.int64)
+        return verts, tris, mesh_volume(verts, tris)
+    shape = _to_shape(item)
+    verts, tris = _weld_mesh(shape, tolerance)
+    return verts, tris, float(shape.Volume())
+
+
+def compare_shapes(
+    a: ShapeOrMesh,
+    b: ShapeOrMesh,
+    samples: int = 20000,
+    threshold: float = 0.05,
+    tolerance: float = 0.05,
+    seed: int = 0,
+) -> ShapeDiff:
+    """Compare two versions of a part by sampled surface distances and volume.
+
+    Inputs may be shapes/workplanes (volume is exact) or (vertices, triangles) meshes.
+    Each surface is sampled with `samples` points plus its mesh vertices, and
+    distances to the other surface are measured in both directions.
+    """
+
+    va, ta, vol_a = _mesh_and_volume(a, tolerance)
+    vb, tb, vol_b = _mesh_and_volume(b, tolerance)
+    pa = np.vstack([va, sample_surface(va, ta, samples, seed)])
+    pb = np.vstack([vb, sample_surface(vb, tb, samples, seed + 1)])
+    d_ab = surface_distance(pa, vb, tb)
+    d_ba = surface_distance(pb, va, ta)
+
+    mean_ab = float(d_ab.mean()) if len(d_ab) else 0.0
+    mean_ba = float(d_ba.mean()) if len(d_ba) else 0.0
+    return ShapeDiff(
+        hausdorff=float(max(d_ab.max(initial=0.0), d_ba.max(initial=0.0))),
+        mean_distance=0.5 * (mean_ab + mean_ba),
+        mean_a_to_b=mean_ab,
+        mean_b_to_a=mean_ba,
+        volume_a=vol_a,
+        volume_b=vol_b,
+        points_a=pa,
+        points_b=pb,
+        changed_a=d_ab > threshold,
+        changed_b=d_ba > threshold,
+        threshold=threshold,
+    )
@@ -1,20 +1,27 @@
 import cadquery as cq
+from .cache import cached
+from .modes import is_preview
 
 
+@cached
 def cutout_usb_c(panel_thickness: float, clearance: float = 0.2) -> cq.Workplane:
     """Return a solid to cut a USB-C receptacle panel opening.
 
     Approx opening: 9.0 × 6.0 mm with corner radii; oversized by clearance.
-    Depth equals panel_thickness.
+    Depth equals panel_thickness. Preview mode leaves the corners square.
     """
 
     w = 9.0 + 2 * clearance
     h = 6.0 + 2 * clearance
     r = 0.8
-    # Build rectangle then fillet vertical edges after extrude to get rounded corners
-    return cq.Workplane("XY").rect(w, h).extrude(panel_thickness).edges("|Z").fillet(r)
+    opening = cq.Workplane("XY").rect(w, h).extrude(panel_thickness)
+    if is_preview():
+        return opening
+    # Fillet vertical edges after extrude to get rounded corners
+    return opening.edges("|Z").fillet(r)
 
 
+@cached
 def cutout_rj45(panel_thickness: float, clearance: float = 0.3) -> cq.Workplane:
     """Return a solid to cut an RJ45 jack panel opening.
 
@@ -26,6 +33,7 @@ def cutout_rj45(panel_thickness: float, clearance: float = 0.3) -> cq.Workplane:
     return cq.Workplane("XY").rect(w, h).extrude(panel_thickness)
 
 
+@cached
 def cutout_dc_barrel(panel_thickness: float, clearance: float = 0.2) -> cq.Workplane:
     """Return a solid to cut a DC barrel jack (panel mount) opening.
 
@@ -0,0 +1,507 @@
+import ast
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+
+# Cost units: one unit is roughly one boolean between simple solids (~20 ms)
+BOOLEAN_COST = 1.0
+FILLET_COST = 1.5
+HEAVY_COST = 2.0  # shell, loft, sweep, revolve
+INSTANCE_COST = 0.25  # each extra placed copy or hole inside one batched boolean
+OP_COST = 0.2  # other CadQuery calls: sketches, extrudes, selectors
+ITERATION_COST = 0.005  # each loop or comprehension iteration: interpreter and small numpy work (~0.1 ms)
+
+FAST_COST = 1500.0
+MAX_COST = 6000.0
+MAX_PATTERN = 20000
+MAX_ITERATIONS = 50 * MAX_PATTERN  # loop iterations in one loop nest
+UNKNOWN_COUNT = 10  # trip count assumed for loops and patterns whose size is not static
+UNKNOWN_WHILE = 100
+
+_BOOLEANS = {"cut", "union", "intersect", "fuse", "combine", "cutBlind", "cutThruAll", "split", "clean"}
+_HOLES = {"hole", "cboreHole", "cskHole"}
+_FILLETS = {"fillet", "chamfer", "fillet2D", "chamfer2D"}
+_HEAVY = {"shell", "loft", "sweep", "revolve", "twistExtrude", "offset2D"}
+# Builders with internal booleans and fillets, in cost units (cached after the first call)
+_BUILDERS = {
+    # Revolved from one profile (~5 ms), no booleans
+    "tube": 0.25,
+    "insert_boss": 0.25,
+    "pcb_pocket": 1.0,
+    "cutout_usb_c": 2.0,
+    "cutout_rj45": 1.0,
+    "cutout_dc_barrel": 1.0,
+    "o_ring_gland_face": 0.25,
+    "gasket_channel_rect": 3.0,
+    "rectangular_enclosure_base_and_lid": 10.0,
+    "elliptical_enclosure": 10.0,
+    "d_shaped_enclosure": 10.0,
+    # Helical sweep plus booleans when the runner builds real threads
+    "thread": 100.0,
+    "apply_thread": 100.0,
+}
+# Point generators and patterns: (position, name) of the arguments whose product is the count
+_COUNT_ARGS = {
+    "bolt_circle_points": ((0, "n"),),
+    "spiral_points": ((0, "n"),),
+    "rect_grid_points": ((0, "nx"), (1, "ny")),
+    "staggered_grid_points": ((0, "nx"), (1, "ny")),
+    "linear_array": ((1, "n"),),
+    "circular_array": ((1, "n"),),
+    "grid_array": ((1, "nx"), (2, "ny")),
+    "polarArray": ((3, "count"),),
+    "rarray": ((2, "xCount"), (3, "yCount")),
+}
+_PATTERNS = {"linear_array", "circular_array", "grid_array", "array_at_points"}
+_POINT_SETS = {"bolt_circle_points", "spiral_points", "rect_grid_points", "staggered_grid_points", "hex_grid_points", "poisson_disk_points"}
+
+
+@dataclass
+class _Tally:
+    booleans: float = 0.0
+    fillets: float = 0.0
+    heavy: float = 0.0
+    instances: float = 0.0
+    ops: float = 0.0
+    iterations: float = 0.0
+
+    def add(self, other: "_Tally", times: float = 1.0) -> None:
+        self.booleans += other.booleans * times
+        self.fillets += other.fillets * times
+        self.heavy += other.heavy * times
+        self.instances += other.instances * times
+        self.ops += other.ops * times
+        self.iterations += other.iterations * times
+
+    @property
+    def cost(self) -> float:
+        return (
+            self.booleans * BOOLEAN_COST
+            + self.fillets * FILLET_COST
+            + self.heavy * HEAVY_COST
+            + self.instances * INSTANCE_COST
+            + self.ops * OP_COST
+            + self.iterations * ITERATION_COST
+        )
+
+
+@dataclass(frozen=True)
+class ScriptCost:
+    """Static cost estimate of a generated script, in cost units (~one simple boolean each).
+
+    `issues` lists findings; `fatal` ones (unbounded loops, extreme pattern
+    sizes or loop trip counts, recursion) reject the script regardless of
+    its cost. `iterations` counts loop and comprehension iterations, which
+    cost time even when their bodies make no CadQuery calls.
+    """
+
+    booleans: float
+    fillets: float
+    heavy: float
+    instances: float
+    ops: float
+    cost: float
+    max_pattern: int
+    issues: Tuple[str, ...] = ()
+    fatal: Tuple[str, ...] = ()
+    iterations: float = 0.0
+
+    def tier(self, fast: float = FAST_COST, limit: float = MAX_COST) -> str:
+        """"fast", "slow" (over `fast`) or "reject" (over `limit` or a fatal issue)."""
+
+        if self.fatal or self.cost > limit:
+            return "reject"
+        return "slow" if self.cost > fast else "fast"
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "cost": round(self.cost, 1),
+            "booleans": round(self.booleans, 1),
+            "fillets": round(self.fillets, 1),
+            "heavy": round(self.heavy, 1),
+            "instances": round(self.instances, 1),
+            "ops": round(self.ops, 1),
+            "iterations": round(self.iterations, 1),
+            "max_pattern": self.max_pattern,
+            "issues": list(self.issues),
+            "fatal": list(self.fatal),
+            "tier": self.tier(),
+        }
+
+
+def _call_name(node: ast.Call) -> str:
+    func = node.func
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    if isinstance(func, ast.Name):
+        return func.id
+    return ""
+
+
+def _always_true(test: ast.expr) -> bool:
+    return isinstance(test, ast.Constant) and bool(test.value)
+
+
+def _has_exit(body: List[ast.stmt]) -> bool:
+    """Whether a loop body can leave the loop (break, return or raise outside nested loops)."""
+
+    for stmt in body:
+        for node in _walk_same_loop(stmt):
+            if isinstance(node, (ast.Break, ast.Return, ast.Raise)):
+                return True
+    return False
+
+
+def _walk_same_loop(node: ast.AST):
+    yield node
+    for child in ast.iter_child_nodes(node):
+        if isinstance(child, (ast.For, ast.While, ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
+            continue
+        yield from _walk_same_loop(child)
+
+
+class _Analyzer:
+    def __init__(self, tree: ast.Module):
+        self.consts: Dict[str, float] = {}
+        self.sizes: Dict[str, float] = {}
+        self.functions: Dict[str, ast.FunctionDef] = {}
+        self.function_costs: Dict[str, _Tally] = {}
+        self.active: Set[str] = set()
+        self.issues: List[str] = []
+        self.fatal: List[str] = []
+        self.max_pattern = 0
+        self._collect(tree)
+
+    # Constant folding over simple assignments and defaults
+
+    def _collect(self, tree: ast.Module) -> None:
+        assigned: Dict[str, Optional[float]] = {}
+        for node in ast.walk(tree):
+            if isinstance(node, ast.FunctionDef):
+                self.functions.setdefault(node.name, node)
+                args = node.args
+                for arg, default in zip(args.args[len(args.args) - len(args.defaults) :], args.defaults):
+                    self._bind(assigned, arg.arg, default)
+                for arg, default in zip(args.kwonlyargs, args.kw_defaults):
+                    if default is not None:
+                        self._bind(assigned, arg.arg, default)
+            elif isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+                self._bind(assigned, node.targets[0].id, node.value)
+            elif isinstance(node, ast.AugAssign) and isinstance(node.target, ast.Name):
+                assigned[node.target.id] = None
+        # Names bound to one constant everywhere; the rest are not static
+        self.consts = {k: v for k, v in assigned.items() if v is not None}
+
+    def _bind(self, assigned: Dict[str, Optional[float]], name: str, value: ast.expr) -> None:
+        v = self.const(value, dict((k, x) for k, x in assigned.items() if x is not None))
+        if name in assigned and assigned[name] != v:
+            assigned[name] = None
+        else:
+            assigned[name] = v
+
+    def const(self, node: ast.expr, env: Optional[Dict[str, float]] = None) -> Optional[float]:
+        """Value of a constant expression; None when it is not static or not a finite real number."""
+
+        try:
+            v = self._fold(node, self.consts if env is None else env)
+        except (ArithmeticError, ValueError, TypeError):
+            return None
+        # int(1e400) overflows and (-8) ** 0.5 is complex
+        return v if isinstance(v, float) and math.isfinite(v) else None
+
+    def _fold(self, node: ast.expr, env: Dict[str, float]) -> Optional[float]:
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+            return float(node.value)
+        if isinstance(node, ast.Name):
+            return env.get(node.id)
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+            v = self.const(node.operand, env)
+            return None if v is None else (-v if isinstance(node.op, ast.USub) else v)
+        if isinstance(node, ast.BinOp):
+            a, b = self.const(node.left, env), self.const(node.right, env)
+            if a is None or b is None:
+                return None
+            ops = {
+                ast.Add: lambda: a + b,
+                ast.Sub: lambda: a - b,
+                ast.Mult: lambda: a * b,
+                ast.Div: lambda: a / b,
+                ast.FloorDiv: lambda: a // b,
+                ast.Mod: lambda: a % b,
+                ast.Pow: lambda: a**b if abs(b) <= 64 else None,
+            }
+            fn = ops.get(type(node.op))
+            return None if fn is None else fn()
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and not node.keywords:
+            args = [self.const(a, env) for a in node.args]
+            if node.func.id == "len" and len(node.args) == 1:
+                return self.size(node.args[0])
+            if any(a is None for a in args) or not args:
+                return None
+            fns = {"int": lambda: float(int(args[0])), "float": lambda: args[0], "round": lambda: float(round(args[0])),
+                   "abs": lambda: abs(args[0]), "min": lambda: min(args), "max": lambda: max(args)}
+            fn = fns.get(node.func.id)
+            return None if fn is None else fn()
+        return None
+
+    def size(self, node: ast.expr) -> Optional[float]:
+        """Static element count of a points-like or iterable expression."""
+
+        if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+            return float(len(node.elts))
+        if isinstance(node, ast.Name):
+            return self.sizes.get(node.id)
+        if isinstance(node, ast.Call):
+            name = _call_name(node)
+            if name == "range":
+                bounds = [self.const(a) for a in node.args]
+                if not bounds or any(b is None for b in bounds):
+                    return None
+                start, stop, step = (0.0, bounds[0], 1.0) if len(bounds) == 1 else (bounds[0], bounds[1], bounds[2] if len(bounds) > 2 else 1.0)
+                trips = (stop - start) / step if step else math.nan
+                return float(max(math.ceil(trips), 0)) if math.isfinite(trips) else None
+            if name in ("enumerate", "list", "tuple", "reversed", "sorted") and node.args:
+                return self.size(node.args[0])
+            if name == "zip" and node.args:
+                sizes = [self.size(a) for a in node.args]
+                return None if any(s is None for s in sizes) else min(sizes)
+            if name in _POINT_SETS or name in _COUNT_ARGS:
+                return self.count(node)
+        if isinstance(node, (ast.ListComp, ast.SetComp, ast.GeneratorExp)):
+            total = 1.0
+            for gen in node.generators:
+                n = self.size(gen.iter)
+                if n is None:
+                    return None
+                total *= n
+            return total
+        return None
+
+    def count(self, node: ast.Call) -> Optional[float]:
+        """Instance count of a pattern or point-generator call, when static."""
+
+        name = _call_name(node)
+        if name in ("array_at_points",) and len(node.args) > 1:
+            return self.size(node.args[1])
+        if name in ("hex_grid_points", "poisson_disk_points"):
+            return None
+        params = _COUNT_ARGS.get(name)
+        if params is None:
+            return None
+        total = 1.0
+        keywords = {k.arg: k.value for k in node.keywords if k.arg}
+        for i, param in params:
+            if i < len(node.args):
+                v = self.const(node.args[i])
+            elif param in keywords:
+                v = self.const(keywords[param])
+            else:
+                v = None
+            if v is None:
+                return None
+            total *= max(v, 0.0)
+        return total
+
+    # Cost accumulation
+
+    def block(self, body: List[ast.stmt]) -> _Tally:
+        tally = _Tally()
+        for stmt in body:
+            tally.add(self.stmt(stmt))
+        return tally
+
+    def stmt(self, node: ast.stmt) -> _Tally:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Import, ast.ImportFrom)):
+            return _Tally()
+        if isinstance(node, ast.For):
+            trips = self.size(node.iter)
+            if trips is None:
+                trips = UNKNOWN_COUNT
+                self.issues.append(f"line {node.lineno}: loop bound is not static; assuming {UNKNOWN_COUNT} iterations")
+            tally = self.expr(node.iter)
+            body = self.block(node.body)
+            body.iterations += 1
+            tally.add(body, trips)
+            tally.add(self.block(node.orelse))
+            self._check_iterations(node, tally, body.iterations)
+            return tally
+        if isinstance(node, ast.While):
+            if _always_true(node.test) and not _has_exit(node.body):
+                self.fatal.append(f"line {node.lineno}: infinite loop (while True without break)")
+            else:
+                self.issues.append(f"line {node.lineno}: while loop has no static bound; assuming {UNKNOWN_WHILE} iterations")
+            tally = self.expr(node.test)
+            body = self.block(node.body)
+            body.iterations += 1
+            tally.add(body, UNKNOWN_WHILE)
+            tally.add(self.block(node.orelse))
+            self._check_iterations(node, tally, body.iterations)
+            return tally
+        if isinstance(node, ast.Assign):
+            n = self.size(node.value)
+            for target in node.targets:
+                if isinstance(target, ast.Name) and n is not None:
+                    self.sizes[target.id] = n
+        tally = _Tally()
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.stmt):
+                tally.add(self.stmt(child))
+            elif isinstance(child, ast.expr):
+                tally.add(self.expr(child))
+        return tally
+
+    def expr(self, node: ast.expr) -> _Tally:
+        tally = _Tally()
+        if isinstance(node, (ast.ListComp, ast.SetComp, ast.GeneratorExp, ast.DictComp)):
+            trips = 1.0
+            for gen in node.generators:
+                tally.add(self.expr(gen.iter), trips)
+                n = self.size(gen.iter)
+                if n is None:
+                    n = UNKNOWN_COUNT
+                    self.issues.append(f"line {node.lineno}: comprehension bound is not static; assuming {UNKNOWN_COUNT} iterations")
+                trips *= n
+            parts = [node.key, node.value] if isinstance(node, ast.DictComp) else [node.elt]
+            body = _Tally(iterations=1.0)
+            for part in parts:
+                body.add(self.expr(part))
+            tally.add(body, trips)
+            self._check_iterations(node, tally, body.iterations)
+            return tally
+        if isinstance(node, ast.Lambda):
+            return tally
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.expr):
+                tally.add(self.expr(child))
+        if isinstance(node, ast.Call):
+            tally.add(self.call(node))
+        return tally
+
+    def _check_iterations(self, node: ast.AST, tally: _Tally, inner: float) -> None:
+        """Flag a loop nest over MAX_ITERATIONS once, at its outermost loop over the limit."""
+
+        if tally.iterations > MAX_ITERATIONS >= inner:
+            self.fatal.append(f"line {node.lineno}: loop runs {int(tally.iterations)} iterations (limit {MAX_ITERATIONS})")
+
+    def _chain_points(self, node: ast.Call) -> float:
+        """Points pushed earlier in a method chain (rarray, polarArray, pushPoints)."""
+
+        receiver = node.func.value if isinstance(node.func, ast.Attribute) else None
+        while isinstance(receiver, ast.Call):
+            name = _call_name(receiver)
+            if name in ("rarray", "polarArray"):
+                n = self.count(receiver)
+                return self._pattern(receiver, n)
+            if name == "pushPoints" and receiver.args:
+                return self._pattern(receiver, self.size(receiver.args[0]))
+            if name in _BOOLEANS or name in _HOLES or name in ("workplane", "faces", "Workplane"):
+                break
+            receiver = receiver.func.value if isinstance(receiver.func, ast.Attribute) else None
+        return 1.0
+
+    def _pattern(self, node: ast.Call, n: Optional[float]) -> float:
+        if n is None:
+            self.issues.append(f"line {node.lineno}: {_call_name(node)} size is not static; assuming {UNKNOWN_COUNT}")
+            return float(UNKNOWN_COUNT)
+        self.max_pattern = max(self.max_pattern, int(n))
+        if n > MAX_PATTERN:
+            self.fatal.append(f"line {node.lineno}: {_call_name(node)} places {int(n)} instances (limit {MAX_PATTERN})")
+        return n
+
+    def call(self, node: ast.Call) -> _Tally:
+        name = _call_name(node)
+        tally = _Tally()
+        if isinstance(node.func, ast.Name) and name in self.functions:
+            return self.function(name, node)
+        if name in _BOOLEANS or name in _HOLES:
+            tally.booleans += 1
+            points = self._chain_points(node)
+            tally.instances += points - 1 if points > 1 else 0
+            if name in _BOOLEANS and len(node.args) > 1:
+                tally.instances += len(node.args) - 1
+        elif name in _FILLETS:
+            tally.fillets += 1
+        elif name in _HEAVY:
+            tally.heavy += 1
+        elif name in _PATTERNS:
+            n = self._pattern(node, self.count(node))
+            tally.booleans += 1
+            tally.instances += n
+        elif name == "apply_screw_holes" and len(node.args) > 1:
+            n = self._pattern(node, self.size(node.args[1]))
+            tally.booleans += 1
+            tally.instances += n
+        elif name in ("perforated_panel", "perforation_tool", "louvre_panel"):
+            tally.booleans += 1
+            tally.instances += self._pattern(node, self._panel_openings(node))
+        elif name in _BUILDERS:
+            tally.booleans += _BUILDERS[name]
+        elif name in ("extrude", "box", "cylinder", "sphere", "rect", "circle", "polyline", "polygon", "mirror", "translate", "rotate"):
+            tally.ops += self._chain_points(node) if name == "extrude" else 1
+        return tally
+
+    def _panel_openings(self, node: ast.Call) -> Optional[float]:
+        """Openings in a panel builder, from its length, width and pitch arguments."""
+
+        kw = {k.arg: k.value for k in node.keywords if k.arg}
+        if _call_name(node) == "louvre_panel":
+            width = self.const(node.args[1]) if len(node.args) > 1 else self.const(kw.get("width", ast.Constant(None)))
+            pitch = self.const(node.args[4]) if len(node.args) > 4 else self.const(kw.get("slot_pitch", ast.Constant(None)))
+            return None if width is None or not pitch else max(width // pitch, 0.0)
+        if _call_name(node) == "perforation_tool":
+            region = node.args[0] if node.args else kw.get("region")
+            dims = [self.const(e) for e in region.elts] if isinstance(region, (ast.Tuple, ast.List)) and len(region.elts) == 4 else None
+            length = None if not dims or None in dims else dims[2] - dims[0]
+            width = None if not dims or None in dims else dims[3] - dims[1]
+        else:
+            length = self.const(node.args[0]) if node.args else self.const(kw.get("length", ast.Constant(None)))
+            width = self.const(node.args[1]) if len(node.args) > 1 else self.const(kw.get("width", ast.Constant(None)))
+        pitch = self.const(kw["pitch"]) if "pitch" in kw else 5.0
+        if length is None or width is None or not pitch:
+            return None
+        return max(length // pitch, 0.0) * max(width // pitch, 0.0)
+
+    def function(self, name: str, call: Optional[ast.Call] = None) -> _Tally:
+        if name in self.active:
+            line = call.lineno if call is not None else self.functions[name].lineno
+            self.fatal.append(f"line {line}: recursive call to {name}()")
+            return _Tally()
+        if name not in self.function_costs:
+            self.active.add(name)
+            self.function_costs[name] = self.block(self.functions[name].body)
+            self.active.discard(name)
+        return self.function_costs[name]
+
+
+def analyze_script(src: str) -> ScriptCost:
+    """Estimate the cost of a generated script from its AST, without running it.
+
+    Counts booleans, holes, fillets and heavy operations. Loop trip counts
+    come from constant `range` bounds, literal lists and statically sized
+    point sets; loops and patterns whose size is not static are assumed to
+    have `UNKNOWN_COUNT` items and reported in `issues`. Each iteration
+    also costs `ITERATION_COST`, so long plain-Python or numpy loops count,
+    and a loop nest over `MAX_ITERATIONS` iterations is fatal. Calls to
+    functions defined in the script are costed from their bodies, and
+    `build()` counts once as the runner calls it.
+    """
+
+    tree = ast.parse(src)
+    analyzer = _Analyzer(tree)
+    tally = analyzer.block(tree.body)
+    called = {_call_name(n) for n in ast.walk(tree) if isinstance(n, ast.Call) and isinstance(n.func, ast.Name)}
+    if "build" in analyzer.functions and "build" not in called:
+        tally.add(analyzer.function("build"))
+    return ScriptCost(
+        booleans=tally.booleans,
+        fillets=tally.fillets,
+        heavy=tally.heavy,
+        instances=tally.instances,
+        ops=tally.ops,
+        cost=tally.cost,
+        max_pattern=analyzer.max_pattern,
+        issues=tuple(dict.fromkeys(analyzer.issues)),
+        fatal=tuple(dict.fromkeys(analyzer.fatal)),
+        iterations=tally.iterations,
+    )
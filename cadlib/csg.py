@@ -0,0 +1,270 @@
+from concurrent.futures import Executor
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import cadquery as cq
+
+from .sections import _to_shape
+
+
+Operand = Union["Node", cq.Workplane, cq.Shape]
+
+# (xmin, ymin, zmin, xmax, ymax, zmax); None means provably empty
+Box = Optional[np.ndarray]
+
+
+def _box_of(shape: cq.Shape) -> Box:
+    bb = shape.BoundingBox()
+    return np.array([bb.xmin, bb.ymin, bb.zmin, bb.xmax, bb.ymax, bb.zmax])
+
+
+def _overlaps(a: Box, b: Box) -> bool:
+    if a is None or b is None:
+        return False
+    return bool(np.all(a[:3] <= b[3:]) and np.all(b[:3] <= a[3:]))
+
+
+def _overlap_clusters(boxes: Sequence[Box]) -> List[List[int]]:
+    """Group indices into connected components of overlapping boxes (sort-and-sweep + union-find)."""
+
+    idx = [i for i, b in enumerate(boxes) if b is not None]
+    parent = {i: i for i in idx}
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    if idx:
+        arr = np.array([boxes[i] for i in idx])
+        order = np.argsort(arr[:, 0])
+        lo, hi = arr[order, :3], arr[order, 3:]
+        ends = np.searchsorted(lo[:, 0], hi[:, 0], side="right")
+        for a in range(len(order)):
+            js = np.arange(a + 1, ends[a])
+            hit = js[np.all(lo[js] <= hi[a], axis=1) & np.all(lo[a] <= hi[js], axis=1)]
+            for b in hit:
+                ra, rb = find(idx[order[a]]), find(idx[order[b]])
+                if ra != rb:
+                    parent[rb] = ra
+    clusters: dict = {}
+    for i in idx:
+        clusters.setdefault(find(i), []).append(i)
+    return list(clusters.values())
+
+
+def _empty() -> cq.Shape:
+    return cq.Compound.makeCompound([])
+
+
+def _compound(shapes: List[cq.Shape]) -> cq.Shape:
+    shapes = [s for s in shapes if not _is_empty(s)]
+    if not shapes:
+        return _empty()
+    return shapes[0] if len(shapes) == 1 else cq.Compound.makeCompound(shapes)
+
+
+def _is_empty(shape: cq.Shape) -> bool:
+    return shape.wrapped.IsNull() or not shape.Solids() and not shape.Faces()
+
+
+def as_csg(obj: Operand) -> "Node":
+    """Wrap a Workplane or Shape as a lazy CSG operand (nodes pass through)."""
+
+    if isinstance(obj, Node):
+        return obj
+    return Leaf(_to_shape(obj))
+
+
+class Node:
+    """Lazy CSG expression; booleans run only on `evaluate()`.
+
+    Operands may be nodes, Workplanes or Shapes. `a + b`, `a - b` and `a & b`
+    mirror the cq.Workplane operators.
+    """
+
+    __slots__ = ("_value", "_box")
+
+    def __init__(self) -> None:
+        self._value: Optional[cq.Shape] = None
+        self._box: Optional[Tuple[Box]] = None
+
+    def union(self, *others: Operand) -> "Node":
+        return Fuse([self, *map(as_csg, others)])
+
+    def cut(self, *others: Operand) -> "Node":
+        return Cut(self, [as_csg(o) for o in others])
+
+    def intersect(self, *others: Operand) -> "Node":
+        return Common([self, *map(as_csg, others)])
+
+    def __add__(self, other: Operand) -> "Node":
+        return self.union(other)
+
+    def __sub__(self, other: Operand) -> "Node":
+        return self.cut(other)
+
+    def __and__(self, other: Operand) -> "Node":
+        return self.intersect(other)
+
+    def bbox(self) -> Box:
+        """Conservative axis-aligned box of the result, computed without booleans."""
+
+        if self._box is None:
+            self._box = (self._compute_box(),)
+        return self._box[0]
+
+    def evaluate(self, executor: Optional[Executor] = None) -> cq.Shape:
+        """Run the planned booleans and return the resulting shape.
+
+        Shared subtrees are evaluated once. With an `executor`, sibling
+        subtrees that need booleans are evaluated concurrently; use a process
+        pool, since OCCT booleans hold the GIL.
+        """
+
+        if self._value is None:
+            self._value = self._evaluate(executor)
+        return self._value
+
+    def to_workplane(self, executor: Optional[Executor] = None) -> cq.Workplane:
+        return cq.Workplane("XY").newObject([self.evaluate(executor)])
+
+    def val(self) -> cq.Shape:
+        return self.evaluate()
+
+    def _compute_box(self) -> Box:
+        raise NotImplementedError
+
+    def _evaluate(self, executor: Optional[Executor]) -> cq.Shape:
+        raise NotImplementedError
+
+
+class Leaf(Node):
+    __slots__ = ("shape",)
+
+    def __init__(self, shape: cq.Shape):
+        super().__init__()
+        self.shape = shape
+
+    def _compute_box(self) -> Box:
+        return None if _is_empty(self.shape) else _box_of(self.shape)
+
+    def _evaluate(self, executor: Optional[Executor]) -> cq.Shape:
+        return self.shape
+
+
+def _evaluate_node(node: Node) -> cq.Shape:
+    return node.evaluate()
+
+
+def _evaluate_all(nodes: Sequence[Node], executor: Optional[Executor]) -> List[cq.Shape]:
+    if executor is None:
+        return [n.evaluate() for n in nodes]
+    pending = {i: executor.submit(_evaluate_node, n) for i, n in enumerate(nodes) if n._value is None and not isinstance(n, Leaf)}
+    out = []
+    for i, n in enumerate(nodes):
+        if i in pending:
+            n._value = pending[i].result()
+        out.append(n.evaluate())
+    return out
+
+
+class Fuse(Node):
+    __slots__ = ("children",)
+
+    def __init__(self, children: Sequence[Node]):
+        super().__init__()
+        flat: List[Node] = []
+        for c in children:
+            flat.extend(c.children if isinstance(c, Fuse) and c._value is None else [c])
+        self.children = tuple(flat)
+
+    def _compute_box(self) -> Box:
+        boxes = [b for b in (c.bbox() for c in self.children) if b is not None]
+        if not boxes:
+            return None
+        arr = np.array(boxes)
+        return np.concatenate([arr[:, :3].min(axis=0), arr[:, 3:].max(axis=0)])
+
+    def clusters(self) -> List[List[Node]]:
+        """Children grouped by AABB overlap; distinct clusters never need a boolean."""
+
+        return [[self.children[i] for i in group] for group in _overlap_clusters([c.bbox() for c in self.children])]
+
+    def _evaluate(self, executor: Optional[Executor]) -> cq.Shape:
+        clusters = self.clusters()
+        shapes = _evaluate_all([n for group in clusters for n in group], executor)
+        out, k = [], 0
+        for group in clusters:
+            members, k = shapes[k : k + len(group)], k + len(group)
+            out.append(members[0] if len(members) == 1 else members[0].fuse(*members[1:]).clean())
+        return _compound(out)
+
+
+class Cut(Node):
+    __slots__ = ("base", "tools")
+
+    def __init__(self, base: Node, tools: Sequence[Node]):
+        super().__init__()
+        flat: List[Node] = []
+        # a - (t1 + t2) == a - t1 - t2: union tools never need fusing
+        for t in tools:
+            flat.extend(t.children if isinstance(t, Fuse) and t._value is None else [t])
+        # (a - t1) - t2 == a - (t1, t2): one compound cut
+        if isinstance(base, Cut) and base._value is None:
+            flat = list(base.tools) + flat
+            base = base.base
+        self.base = base
+        self.tools = tuple(flat)
+
+    def _compute_box(self) -> Box:
+        return self.base.bbox()
+
+    def _evaluate(self, executor: Optional[Executor]) -> cq.Shape:
+        base_box = self.base.bbox()
+        tools = [t for t in self.tools if _overlaps(base_box, t.bbox())]
+        if not tools:
+            return self.base.evaluate(executor)
+        clusters = self.base.clusters() if isinstance(self.base, Fuse) and self.base._value is None else []
+        if len(clusters) > 1:
+            # Push each tool into the overlap clusters it touches, so cuts run on
+            # smaller bodies and the clusters still combine without a boolean
+            parts = []
+            for group in clusters:
+                body = group[0] if len(group) == 1 else Fuse(group)
+                mine = [t for t in tools if _overlaps(body.bbox(), t.bbox())]
+                parts.append(Cut(body, mine) if mine else body)
+            return _compound(_evaluate_all(parts, executor))
+        base, *tool_shapes = _evaluate_all([self.base, *tools], executor)
+        return base.cut(*tool_shapes).clean()
+
+
+class Common(Node):
+    __slots__ = ("children",)
+
+    def __init__(self, children: Sequence[Node]):
+        super().__init__()
+        flat: List[Node] = []
+        for c in children:
+            flat.extend(c.children if isinstance(c, Common) and c._value is None else [c])
+        self.children = tuple(flat)
+
+    def _compute_box(self) -> Box:
+        boxes = [c.bbox() for c in self.children]
+        if any(b is None for b in boxes):
+            return None
+        arr = np.array(boxes)
+        box = np.concatenate([arr[:, :3].max(axis=0), arr[:, 3:].min(axis=0)])
+        return None if np.any(box[:3] > box[3:]) else box
+
+    def _evaluate(self, executor: Optional[Executor]) -> cq.Shape:
+        if self.bbox() is None:
+            return _empty()
+        # Smallest operand first keeps every intermediate result small
+        order = sorted(self.children, key=lambda c: float(np.prod(c.bbox()[3:] - c.bbox()[:3])))
+        shapes = _evaluate_all(order, executor)
+        result = shapes[0]
+        for s in shapes[1:]:
+            result = result.intersect(s)
+        return result.clean()
@@ -1,27 +1,31 @@
 import cadquery as cq
 from .validators import RectEnclosureParams
+from .cache import cached
+from .parallel import Call, call, run_parallel
 
 
-def rectangular_enclosure_base_and_lid(params: RectEnclosureParams) -> cq.Compound:
-    """Create a simple rectangular enclosure (base + lid) with a mating lip.
-
-    - Outer dims: length × width × height.
-    - Wall thickness configurable; interior shelled.
-    - Lid has internal recess with clearance for a slip fit.
-    Returns a `cq.Compound` with two solids: base and lid.
-    """
+def _rect_dims(params: RectEnclosureParams):
+    """Corner radius, lip height and lip outline shared by base and lid."""
 
     L = params.length
     W = params.width
-    H = params.height
     t = params.wall_thickness
     lid_h = params.lid_height
-    clearance = params.lid_clearance
-
-    # Base body with optional rounded corners
     r = getattr(params, "corner_radius", 0) or 0
     max_r = max(0.0, min(L, W) / 2.0 - 0.1)
     cr = min(r, max_r)
+    lip_h = min(lid_h * 0.6, max(2.0, lid_h - 1.0))
+    lip_offset = params.lid_clearance
+    inner_lip_L = L - 2 * (t + lip_offset)
+    inner_lip_W = W - 2 * (t + lip_offset)
+    return cr, lip_h, inner_lip_L, inner_lip_W
+
+
+def _rect_base(params: RectEnclosureParams) -> cq.Shape:
+    L, W, H, t = params.length, params.width, params.height, params.wall_thickness
+    cr, lip_h, inner_lip_L, inner_lip_W = _rect_dims(params)
+
+    # Base body with optional rounded corners
     base_profile = cq.Workplane("XY").rect(L, W)
     if cr > 0:
         base_profile = base_profile.vertices().fillet(cr)
@@ -30,11 +34,6 @@ def rectangular_enclosure_base_and_lid(params: RectEnclosureParams) -> cq.Compou
     base = base_outer.faces(">Z").shell(-t)
 
     # Create mating lip on base
-    lip_h = min(lid_h * 0.6, max(2.0, lid_h - 1.0))
-    lip_offset = clearance
-    inner_lip_L = L - 2 * (t + lip_offset)
-    inner_lip_W = W - 2 * (t + lip_offset)
-
     lip = (
         cq.Workplane("XY")
         .workplane(offset=H - lip_h)
@@ -42,13 +41,19 @@ def rectangular_enclosure_base_and_lid(params: RectEnclosureParams) -> cq.Compou
         .extrude(lip_h)
     )
     # Cut lip volume from base interior to leave a standing lip
-    base = base.cut(lip)
+    return base.cut(lip).val()
+
+
+def _rect_lid(params: RectEnclosureParams) -> cq.Shape:
+    L, W, t = params.length, params.width, params.wall_thickness
+    clearance = params.lid_clearance
+    cr, lip_h, inner_lip_L, inner_lip_W = _rect_dims(params)
 
     # Lid body with optional rounded corners
     lid_profile = cq.Workplane("XY").rect(L, W)
     if cr > 0:
         lid_profile = lid_profile.vertices().fillet(cr)
-    lid = lid_profile.extrude(lid_h)
+    lid = lid_profile.extrude(params.lid_height)
     # Shell inward to create lid wall; open the bottom face so thickness does not collide
     lid = lid.faces("<Z").shell(-t)
 
@@ -61,56 +66,74 @@ def rectangular_enclosure_base_and_lid(params: RectEnclosureParams) -> cq.Compou
         .rect(recess_L, recess_W)
         .extrude(lip_h)
     )
-    lid = lid.cut(recess)
+    return lid.cut(recess).val()
 
-    return cq.Compound.makeCompound([b.val() for b in (base, lid)])
 
-
-def elliptical_enclosure(length: float, width: float, height: float, wall_thickness: float, lid_height: float) -> cq.Compound:
-    """Simple oval enclosure (capsule shape) base + lid.
-
-    Uses rounded rectangle profile as an approximation to ellipse for printable stability.
-    """
-
-    # Rounded rectangle profile extruded
+def _capsule_shell(length: float, width: float, height: float, wall_thickness: float) -> cq.Shape:
     # Build a 2D capsule (racetrack) using slot2D for robust rounded ends
     # slot2D requires straight section > 0; when length <= width, fall back to a circle
     if length <= width:
-        r = width / 2.0
-        profile_base = cq.Workplane("XY").circle(r)
+        profile = cq.Workplane("XY").circle(width / 2.0)
     else:
-        profile_base = cq.Workplane("XY").slot2D(length, width)
-    base_outer = profile_base.extrude(height)
-    base = base_outer.shell(-wall_thickness)
+        profile = cq.Workplane("XY").slot2D(length, width)
+    return profile.extrude(height).shell(-wall_thickness).val()
 
-    if length <= width:
-        profile_lid = cq.Workplane("XY").circle(width / 2.0)
-    else:
-        profile_lid = cq.Workplane("XY").slot2D(length, width)
-    lid_outer = profile_lid.extrude(lid_height)
-    lid = lid_outer.shell(-wall_thickness)
-    return cq.Compound.makeCompound([base.val(), lid.val()])
-
-
-def d_shaped_enclosure(diameter: float, flat_width: float, height: float, wall_thickness: float, lid_height: float) -> cq.Compound:
-    """D-shaped enclosure base + lid.
-
-    Constructed by union of a circle and a rectangle to form a D profile.
-    """
 
+def _d_shell(diameter: float, flat_width: float, height: float, wall_thickness: float) -> cq.Shape:
     r = diameter / 2.0
     rect_w = flat_width
     rect_l = diameter
     # Build 3D solids first, then union
-    base_cyl = cq.Workplane("XY").circle(r).extrude(height)
-    base_rect = cq.Workplane("XY").rect(rect_l, rect_w).translate((0, -rect_w / 2.0, 0)).extrude(height)
-    base_outer = base_cyl.union(base_rect)
-    base = base_outer.shell(-wall_thickness)
+    cyl = cq.Workplane("XY").circle(r).extrude(height)
+    rect = cq.Workplane("XY").rect(rect_l, rect_w).translate((0, -rect_w / 2.0, 0)).extrude(height)
+    return cyl.union(rect).shell(-wall_thickness).val()
+
+
+def _base_and_lid(base: Call, lid: Call, parallel: bool) -> cq.Compound:
+    # Base and lid share nothing, so they can be built on two worker processes
+    parts = run_parallel([base, lid], max_workers=None if parallel else 1)
+    return cq.Compound.makeCompound(parts)
 
-    lid_cyl = cq.Workplane("XY").circle(r).extrude(lid_height)
-    lid_rect = cq.Workplane("XY").rect(rect_l, rect_w).translate((0, -rect_w / 2.0, 0)).extrude(lid_height)
-    lid_outer = lid_cyl.union(lid_rect)
-    lid = lid_outer.shell(-wall_thickness)
-    return cq.Compound.makeCompound([base.val(), lid.val()])
 
+@cached
+def rectangular_enclosure_base_and_lid(params: RectEnclosureParams, parallel: bool = False) -> cq.Compound:
+    """Create a simple rectangular enclosure (base + lid) with a mating lip.
+
+    - Outer dims: length × width × height.
+    - Wall thickness configurable; interior shelled.
+    - Lid has internal recess with clearance for a slip fit.
+    - parallel: build base and lid on separate worker processes.
+    Returns a `cq.Compound` with two solids: base and lid.
+    """
+
+    return _base_and_lid(call(_rect_base, params), call(_rect_lid, params), parallel)
 
+
+@cached
+def elliptical_enclosure(length: float, width: float, height: float, wall_thickness: float, lid_height: float, parallel: bool = False) -> cq.Compound:
+    """Simple oval enclosure (capsule shape) base + lid.
+
+    Uses rounded rectangle profile as an approximation to ellipse for printable stability.
+    With `parallel`, base and lid are built on separate worker processes.
+    """
+
+    return _base_and_lid(
+        call(_capsule_shell, length, width, height, wall_thickness),
+        call(_capsule_shell, length, width, lid_height, wall_thickness),
+        parallel,
+    )
+
+
+@cached
+def d_shaped_enclosure(diameter: float, flat_width: float, height: float, wall_thickness: float, lid_height: float, parallel: bool = False) -> cq.Compound:
+    """D-shaped enclosure base + lid.
+
+    Constructed by union of a circle and a rectangle to form a D profile.
+    With `parallel`, base and lid are built on separate worker processes.
+    """
+
+    return _base_and_lid(
+        call(_d_shell, diameter, flat_width, height, wall_thickness),
+        call(_d_shell, diameter, flat_width, lid_height, wall_thickness),
+        parallel,
+    )
@@ -0,0 +1,260 @@
+import inspect
+from dataclasses import dataclass
+from math import pi
+from typing import Any, Callable, Dict, Iterable, Mapping, Union
+
+import numpy as np
+
+from .modes import is_preview
+from .utils import HEAT_SET_INSERTS_MM, MATERIAL_DENSITY_G_CM3
+
+
+ArrayLike = Union[float, str, bool, Iterable[Any], np.ndarray]
+
+# Corner radius of the USB-C opening (see `connectors.cutout_usb_c`)
+_USB_C_CORNER_R = 0.8
+
+
+@dataclass(frozen=True)
+class Estimate:
+    """Closed-form volumes (mm³) and bounding boxes of a batch of parts.
+
+    `volume` has shape (N,); `bbox` rows are (xmin, ymin, zmin, xmax, ymax, zmax)
+    in the builder's own coordinates.
+    """
+
+    volume: np.ndarray
+    bbox: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.volume)
+
+    @property
+    def size(self) -> np.ndarray:
+        """(N,3) bounding-box extents."""
+
+        return self.bbox[:, 3:] - self.bbox[:, :3]
+
+    def mass(self, material: str = "PLA", infill: float = 1.0) -> np.ndarray:
+        """Grams per part at `infill` (0–1) of the material's solid density."""
+
+        return self.volume * 1e-3 * MATERIAL_DENSITY_G_CM3[material] * infill
+
+
+def _columns(*args: ArrayLike) -> list:
+    """Broadcast scalar and per-part arguments to equal-length 1-D arrays."""
+
+    arrays = [np.atleast_1d(np.asarray(a)) for a in args]
+    return [a.ravel() for a in np.broadcast_arrays(*arrays)]
+
+
+def _floats(*args: ArrayLike) -> list:
+    return [a.astype(float) for a in _columns(*args)]
+
+
+def _none_to_nan(values: ArrayLike) -> np.ndarray:
+    arr = np.asarray(values, dtype=object)
+    return np.where(np.equal(arr, None), np.nan, arr).astype(float)
+
+
+def _centered_bbox(half_x: np.ndarray, half_y: np.ndarray, zmin: np.ndarray, zmax: np.ndarray) -> np.ndarray:
+    return np.column_stack(np.broadcast_arrays(-half_x, -half_y, zmin, half_x, half_y, zmax))
+
+
+def _ring_area(outer_r: np.ndarray, inner_r: np.ndarray) -> np.ndarray:
+    return pi * (outer_r**2 - inner_r**2)
+
+
+def estimate_tube(
+    outer_diameter: ArrayLike = 20.0,
+    wall_thickness: ArrayLike = 2.4,
+    height: ArrayLike = 40.0,
+    end_style: ArrayLike = "open",
+    end_cap_thickness: ArrayLike = 2.0,
+) -> Estimate:
+    """`cylinders.tube`: the body is extruded both ways, spanning z ∈ [−height, height]."""
+
+    od, wall, h, cap = _floats(outer_diameter, wall_thickness, height, end_cap_thickness)
+    (style,) = _columns(end_style)
+    style = np.broadcast_to(style, od.shape)
+    R = od / 2.0
+    r = np.maximum(R - wall, 0.0)
+    void_h = np.select(
+        [style == "open", style == "one_end_closed", style == "both_closed"],
+        [2.0 * h, h - cap, h - 2.0 * cap],
+        0.0,
+    )
+    volume = pi * R**2 * 2.0 * h - pi * r**2 * np.maximum(void_h, 0.0)
+    return Estimate(volume, _centered_bbox(R, R, -h, h))
+
+
+def estimate_insert_boss(
+    size: ArrayLike = "M3", height: ArrayLike = 6.0, wall: ArrayLike = 1.2, through_hole: ArrayLike = True
+) -> Estimate:
+    """`inserts.insert_boss`; the relief groove is left out in preview mode.
+
+    The hole is bored from mid-height down, so it removes height/2 (less
+    0.8 mm of floor for short blind holes).
+    """
+
+    sizes, h, w, through = _columns(size, height, wall, through_hole)
+    h, w, through = h.astype(float), w.astype(float), through.astype(bool)
+    insert_od = np.array([HEAT_SET_INSERTS_MM[str(s)]["od"] for s in sizes])
+    R = insert_od / 2.0 + w
+    hole_r = (insert_od - 0.2) / 2.0
+    hole_len = np.where(through, h / 2.0, np.minimum(np.maximum(h - 0.8, 0.0), h / 2.0))
+    volume = pi * R**2 * h - pi * hole_r**2 * hole_len
+    if not is_preview():
+        groove_h = np.clip(np.minimum(0.6, 0.4 * h), 0.0, None)
+        volume = volume - _ring_area(R, R - 0.3) * groove_h
+    return Estimate(volume, _centered_bbox(R, R, 0.0, h))
+
+
+def estimate_rectangular_enclosure_base_and_lid(
+    length: ArrayLike = 100.0,
+    width: ArrayLike = 60.0,
+    height: ArrayLike = 40.0,
+    wall_thickness: ArrayLike = 2.4,
+    lid_height: ArrayLike = 4.0,
+    lid_clearance: ArrayLike = 0.2,
+) -> Estimate:
+    """`enclosures.rectangular_enclosure_base_and_lid`: base plus lid.
+
+    Both are open shells; the lid's lip recess only adds material removal
+    where it reaches below the lid's top plate.
+    """
+
+    L, W, H, t, lh, _ = _floats(length, width, height, wall_thickness, lid_height, lid_clearance)
+    inner = (L - 2.0 * t) * (W - 2.0 * t)
+    lip_h = np.minimum(0.6 * lh, np.maximum(2.0, lh - 1.0))
+    base = L * W * H - inner * (H - t)
+    lid = L * W * lh - inner * (lh - t) - inner * np.maximum(0.0, lip_h - (lh - t))
+    return Estimate(base + lid, _centered_bbox(L / 2.0, W / 2.0, 0.0, H))
+
+
+def estimate_elliptical_enclosure(
+    length: ArrayLike, width: ArrayLike, height: ArrayLike, wall_thickness: ArrayLike, lid_height: ArrayLike
+) -> Estimate:
+    """`enclosures.elliptical_enclosure`: two closed capsule shells (base and lid)."""
+
+    L, W, H, t, lh = _floats(length, width, height, wall_thickness, lid_height)
+
+    def capsule_area(length: np.ndarray, width: np.ndarray) -> np.ndarray:
+        return np.maximum(length - width, 0.0) * width + pi * (width / 2.0) ** 2
+
+    outer = capsule_area(L, W)
+    # Inward offset of a capsule is a capsule; a circle profile stays a circle
+    inner = capsule_area(np.maximum(L, W) - 2.0 * t, W - 2.0 * t)
+    volume = outer * (H + lh) - inner * (np.maximum(H - 2.0 * t, 0.0) + np.maximum(lh - 2.0 * t, 0.0))
+    half_l = np.maximum(L, W) / 2.0
+    return Estimate(volume, _centered_bbox(half_l, W / 2.0, 0.0, np.maximum(H, lh)))
+
+
+def estimate_pcb_pocket(
+    board_length: ArrayLike, board_width: ArrayLike, thickness: ArrayLike, clearance: ArrayLike = 0.2, depth: ArrayLike = None
+) -> Estimate:
+    """`pcb.pcb_pocket`; a `depth` of None (or NaN per row) means the board thickness."""
+
+    bl, bw, th, c, d = _floats(board_length, board_width, thickness, clearance, _none_to_nan(depth))
+    d = np.where(np.isnan(d), th, d)
+    L, W = bl + 2.0 * c, bw + 2.0 * c
+    return Estimate(L * W * d, _centered_bbox(L / 2.0, W / 2.0, 0.0, d))
+
+
+def estimate_cutout_usb_c(panel_thickness: ArrayLike, clearance: ArrayLike = 0.2) -> Estimate:
+    """`connectors.cutout_usb_c`; corners are square in preview mode."""
+
+    t, c = _floats(panel_thickness, clearance)
+    w, h = 9.0 + 2.0 * c, 6.0 + 2.0 * c
+    area = w * h
+    if not is_preview():
+        area = area - (4.0 - pi) * _USB_C_CORNER_R**2
+    return Estimate(area * t, _centered_bbox(w / 2.0, h / 2.0, 0.0, t))
+
+
+def estimate_cutout_rj45(panel_thickness: ArrayLike, clearance: ArrayLike = 0.3) -> Estimate:
+    """`connectors.cutout_rj45`."""
+
+    t, c = _floats(panel_thickness, clearance)
+    w, h = 14.5 + 2.0 * c, 12.5 + 2.0 * c
+    return Estimate(w * h * t, _centered_bbox(w / 2.0, h / 2.0, 0.0, t))
+
+
+def estimate_cutout_dc_barrel(panel_thickness: ArrayLike, clearance: ArrayLike = 0.2) -> Estimate:
+    """`connectors.cutout_dc_barrel`."""
+
+    t, c = _floats(panel_thickness, clearance)
+    r = (8.0 + 2.0 * c) / 2.0
+    return Estimate(pi * r**2 * t, _centered_bbox(r, r, 0.0, t))
+
+
+def estimate_o_ring_gland_face(
+    diameter: ArrayLike, cross_section: ArrayLike, squeeze: ArrayLike = 0.15, groove_depth_factor: ArrayLike = 0.85
+) -> Estimate:
+    """`sealing.o_ring_gland_face`."""
+
+    d, cs, sq, f = _floats(diameter, cross_section, squeeze, groove_depth_factor)
+    ro = (d + cs * (1.0 - sq)) / 2.0
+    ri = (d - cs * (1.0 - sq)) / 2.0
+    depth = cs * f
+    return Estimate(_ring_area(ro, ri) * depth, _centered_bbox(ro, ro, 0.0, depth))
+
+
+def estimate_gasket_channel_rect(
+    length: ArrayLike, width: ArrayLike, channel_width: ArrayLike, depth: ArrayLike, corner_radius: ArrayLike = 1.0
+) -> Estimate:
+    """`sealing.gasket_channel_rect`.
+
+    The builder's corner fillet never succeeds on the ring's vertical edges,
+    so the channel is a plain rectangular ring whatever `corner_radius` is.
+    """
+
+    L, W, cw, d, _ = _floats(length, width, channel_width, depth, corner_radius)
+    area = L * W - (L - 2.0 * cw) * (W - 2.0 * cw)
+    return Estimate(area * d, _centered_bbox(L / 2.0, W / 2.0, 0.0, d))
+
+
+ESTIMATORS: Dict[str, Callable[..., Estimate]] = {
+    "tube": estimate_tube,
+    "insert_boss": estimate_insert_boss,
+    "rectangular_enclosure_base_and_lid": estimate_rectangular_enclosure_base_and_lid,
+    "elliptical_enclosure": estimate_elliptical_enclosure,
+    "pcb_pocket": estimate_pcb_pocket,
+    "cutout_usb_c": estimate_cutout_usb_c,
+    "cutout_rj45": estimate_cutout_rj45,
+    "cutout_dc_barrel": estimate_cutout_dc_barrel,
+    "o_ring_gland_face": estimate_o_ring_gland_face,
+    "gasket_channel_rect": estimate_gasket_channel_rect,
+}
+
+
+def _row_dict(row: Any) -> Mapping[str, Any]:
+    return row.model_dump() if hasattr(row, "model_dump") else row
+
+
+def estimate(builder: Union[str, Callable[..., Any]], rows: Iterable[Any]) -> Estimate:
+    """Estimate a batch of `builder` parts from parameter rows (dicts or pydantic params).
+
+    `builder` is a builder function or its name (a key of `ESTIMATORS`).
+    Missing keys take the builder's defaults; unknown keys raise TypeError.
+    """
+
+    name = builder if isinstance(builder, str) else builder.__name__
+    if name not in ESTIMATORS:
+        raise KeyError(f"no estimator for builder {name!r}")
+    func = ESTIMATORS[name]
+    rows = [_row_dict(r) for r in rows]
+    if not rows:
+        return Estimate(np.zeros(0), np.zeros((0, 6)))
+    params = inspect.signature(func).parameters
+    unknown = sorted({k for r in rows for k in r} - set(params))
+    if unknown:
+        raise TypeError(f"{name} has no parameter(s) {', '.join(unknown)}")
+    columns = {}
+    for key, p in params.items():
+        if any(key in r for r in rows):
+            if p.default is inspect.Parameter.empty and not all(key in r for r in rows):
+                raise TypeError(f"{name} requires {key!r} in every row")
+            column = [r.get(key, p.default) for r in rows]
+            columns[key] = np.array(column, dtype=object if any(v is None for v in column) else None)
+    return func(**columns)
@@ -1,83 +1,54 @@
-from typing import Dict, Tuple, List
+from typing import List
+import numpy as np
 import cadquery as cq
 from .validators import HoleSpec
-from .utils import Fit, apply_fit_to_hole
+from .hole_tools import hole_tool
+# The size tables live with the tool library; still importable from here
+from .hole_tools import HEAD_DIMENSIONS_MM, ISO_CLEARANCE_DIAMETERS_MM, UNC_CLEARANCE_DIAMETERS_MM  # noqa: F401
+from .points import PointsLike, as_points
 
 
-ISO_CLEARANCE_DIAMETERS_MM: Dict[str, float] = {
-    # Close/normal clearance approximations; will be adjusted by Fit
-    "M2": 2.4,
-    "M2_5": 3.0,
-    "M3": 3.4,
-    "M4": 4.5,
-    "M5": 5.5,
-    "M6": 6.6,
-}
+def _hole_planes(target: cq.Workplane, locations_xyz_mm: PointsLike) -> List[cq.Plane]:
+    """Workplane for each hole: the target's workplane offset by (x, y, z)."""
 
-
-HEAD_DIMENSIONS_MM: Dict[str, Dict[str, Dict[str, float]]] = {
-    # Approximate head diameter/height for common screws
-    "M3": {
-        "pan": {"d": 6.0, "h": 2.4},
-        "socket": {"d": 5.5, "h": 3.0},
-        "flat": {"d": 6.0, "angle": 90.0},
-    },
-    "M4": {
-        "pan": {"d": 8.0, "h": 3.1},
-        "socket": {"d": 7.0, "h": 4.0},
-        "flat": {"d": 8.5, "angle": 90.0},
-    },
-}
-
-
-def _hole_diameter_for_spec(spec: HoleSpec) -> float:
-    base = ISO_CLEARANCE_DIAMETERS_MM[spec.size]
-    # Map text fit to enum for numbers
-    fit_enum = Fit[spec.fit]
-    return apply_fit_to_hole(base, fit_enum)
+    base = target.workplane(offset=0).plane
+    local = as_points(locations_xyz_mm)
+    # Local offsets to world origins for all holes at once
+    axes = np.array([base.xDir.toTuple(), base.yDir.toTuple(), base.zDir.toTuple()])
+    origins = np.asarray(base.origin.toTuple()) + local @ axes
+    return [cq.Plane(cq.Vector(*o), base.xDir, base.zDir) for o in origins.tolist()]
 
 
 def apply_screw_holes(
     target: cq.Workplane,
-    locations_xyz_mm: List[Tuple[float, float, float]],
+    locations_xyz_mm: PointsLike,
     spec: HoleSpec,
+    batched: bool = True,
 ) -> cq.Workplane:
     """Apply screw holes (through or blind) at given locations on the target solid.
 
-    For through holes without counterbore/countersink we use `hole`.
-    For counterbore: `cboreHole` with head dimensions.
-    For countersink: `cskHole` with angle.
+    Each location offsets the target's workplane by (x, y, z); the hole surface
+    sits there and the hole bores along -Z. Locations may be a list of tuples
+    or an (N,2)/(N,3) array such as the `points` generators return.
+    Counterbores use head dimensions for pan/socket heads; countersinks use the flat head angle.
     Depth must be provided for blind holes.
-    """
-
-    hole_d = _hole_diameter_for_spec(spec)
-    result = target
-
-    # If head features requested, fetch dimensions (only for sizes we know)
-    head_dims = HEAD_DIMENSIONS_MM.get(spec.size, {})
-    head = head_dims.get(spec.head_type or "", {}) if (spec.counterbore or spec.countersink) else {}
-
-    for (x, y, z) in locations_xyz_mm:
-        wp = result.workplane(offset=0).transformed(offset=(x, y, z))
-        if spec.countersink and spec.head_type == "flat" and "angle" in head:
-            angle = float(head["angle"])  # typically 90 deg
-            depth = None if spec.through else float(spec.depth)
-            # cskHole signature: (d, cskDiameter, cskAngle, depth=None)
-            # Estimate cskDiameter using head diameter if available, else ~2× hole
-            csk_d = float(head.get("d", hole_d * 2.0))
-            wp = wp.cskHole(hole_d, csk_d, angle, depth)
-        elif spec.counterbore and spec.head_type in ("pan", "socket") and "d" in head and "h" in head:
-            cbore_d = float(head["d"]) + 0.2  # small clearance
-            cbore_h = float(head["h"]) + 0.3
-            depth = None if spec.through else float(spec.depth)
-            wp = wp.cboreHole(hole_d, cbore_d, cbore_h, depth)
-        else:
-            if spec.through:
-                wp = wp.hole(hole_d)
-            else:
-                wp = wp.hole(hole_d, depth=float(spec.depth))
-        result = wp
-
-    return result
 
+    The hole tool comes from the shared tool library (`hole_tools`), built
+    once per process. With `batched` (default) it is placed at every
+    location and subtracted in a single boolean. `batched=False` cuts the
+    holes one by one.
+    """
 
+    planes = _hole_planes(target, locations_xyz_mm)
+    if not planes:
+        return target
+    solid = target.findSolid()
+    tool = hole_tool(spec, solid.BoundingBox().DiagonalLength)
+
+    if batched:
+        result = solid.cut(*[tool.moved(cq.Location(p)) for p in planes]).clean()
+    else:
+        result = solid
+        for p in planes:
+            result = result.cut(tool.moved(cq.Location(p))).clean()
+    return target.newObject([result])
@@ -0,0 +1,156 @@
+import hashlib
+from typing import List, Sequence, Tuple, Union
+
+import numpy as np
+import cadquery as cq
+from OCP.Bnd import Bnd_Box
+from OCP.BRepAdaptor import BRepAdaptor_CompCurve, BRepAdaptor_Surface
+from OCP.BRepBndLib import BRepBndLib
+from OCP.BRepGProp import BRepGProp
+from OCP.GCPnts import GCPnts_TangentialDeflection
+from OCP.GProp import GProp_GProps
+
+from .sections import _to_shape, _weld_mesh
+
+
+ShapeLike = Union[cq.Workplane, cq.Shape]
+
+# Bumped whenever the signature changes, so stored fingerprints never match stale ones
+FINGERPRINT_VERSION = 2
+
+# Strang-Fix rule, exact for cubic polynomials on a triangle: barycentric points and weights
+_CUBIC_POINTS = np.array([[1 / 3, 1 / 3, 1 / 3], [0.6, 0.2, 0.2], [0.2, 0.6, 0.2], [0.2, 0.2, 0.6]])
+_CUBIC_WEIGHTS = np.array([-27.0, 25.0, 25.0, 25.0]) / 48.0
+# Unique (i, j, k) index triples of a symmetric third-order tensor
+_TRIPLES = [(i, j, k) for i in range(3) for j in range(i, 3) for k in range(j, 3)]
+
+
+def _quantize(values: Sequence[float], scale: float, digits: int) -> List[int]:
+    step = max(scale, 1e-12) * 10.0 ** -digits
+    return [int(round(v / step)) for v in values]
+
+
+def _wire_polygon(wire: cq.Wire, size: float) -> np.ndarray:
+    curve = BRepAdaptor_CompCurve(wire.wrapped)
+    pts = GCPnts_TangentialDeflection(curve, 0.2, size * 1e-3)
+    return np.array([pts.Value(i).Coord() for i in range(1, pts.NbPoints() + 1)])
+
+
+def _planar_triangles(face: cq.Face, size: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Signed fan triangles whose sum is the planar face, from its discretized wires.
+
+    The cubic rule is exact on each triangle, so a fan from one apex over
+    every boundary segment integrates the face exactly up to the boundary
+    discretization, with no 2D triangulation of the face. Outer wires count
+    positive and holes negative whatever their orientation.
+    """
+
+    normal = face.normalAt().toTuple()
+    polys = [_wire_polygon(face.outerWire(), size)] + [_wire_polygon(w, size) for w in face.innerWires()]
+    apex = polys[0][0]
+    corners, areas = [], []
+    for sign, poly in zip([1.0] + [-1.0] * (len(polys) - 1), polys):
+        b, c = poly, np.roll(poly, -1, axis=0)
+        a = np.broadcast_to(apex, b.shape)
+        area = 0.5 * np.cross(b - a, c - a) @ normal
+        corners.append(np.stack([a, b, c], axis=1))
+        areas.append(area * sign * (1.0 if area.sum() >= 0 else -1.0))
+    return np.concatenate(corners), np.concatenate(areas)
+
+
+def _surface_third_moments(shape: cq.Shape, size: float) -> np.ndarray:
+    """Central third moments of the surface, independent of any triangulation the shape carries.
+
+    Planar faces are integrated from their boundaries; only curved faces are
+    meshed, as fresh copies at a size-relative tolerance. Meshing a large
+    flat face with many holes would cost seconds and add nothing.
+    """
+
+    corners, areas = [np.empty((0, 3, 3))], [np.empty(0)]
+    curved = []
+    for face in shape.Faces():
+        if face.geomType() == "PLANE":
+            tri, area = _planar_triangles(face, size)
+            corners.append(tri)
+            areas.append(area)
+        else:
+            curved.append(face.copy())
+    if curved:
+        verts, tris = _weld_mesh(cq.Compound.makeCompound(curved), size * 1e-3, 0.2)
+        if len(tris):
+            a, b, c = verts[tris[:, 0]], verts[tris[:, 1]], verts[tris[:, 2]]
+            corners.append(np.stack([a, b, c], axis=1))
+            areas.append(0.5 * np.linalg.norm(np.cross(b - a, c - a), axis=1))
+    corners, area = np.concatenate(corners), np.concatenate(areas)
+    if len(area) == 0 or abs(area.sum()) < 1e-300:
+        return np.zeros(len(_TRIPLES))
+    pts = np.einsum("qk,tkd->tqd", _CUBIC_POINTS, corners)
+    w = area[:, None] * _CUBIC_WEIGHTS[None, :]
+    total = w.sum()
+    center = np.einsum("tq,tqd->d", w, pts) / total
+    d = pts - center
+    return np.array([np.einsum("tq,tq->", w, d[..., i] * d[..., j] * d[..., k]) for i, j, k in _TRIPLES]) / total
+
+
+def _signature(shape: cq.Shape, digits: int, anchored: bool) -> Tuple[tuple, np.ndarray]:
+    """Quantized geometry signature and the centroid; `anchored` adds the position."""
+
+    vol, surf = GProp_GProps(), GProp_GProps()
+    BRepGProp.SurfaceProperties_s(shape.wrapped, surf)
+    props = surf
+    if shape.Solids():
+        BRepGProp.VolumeProperties_s(shape.wrapped, vol)
+        props = vol
+    c, m = props.CentreOfMass(), props.MatrixOfInertia()
+    centroid = np.array([c.X(), c.Y(), c.Z()])
+    size = max(abs(props.Mass()), 1e-12) ** (1.0 / (3.0 if props is vol else 2.0))
+    # Exact box (no triangulation) relative to the centroid
+    box = Bnd_Box()
+    BRepBndLib.AddOptimal_s(shape.wrapped, box, False, False)
+    extents = (np.array(box.Get()).reshape(2, 3) - centroid).ravel()
+    # Inertia is taken about the centroid, so it does not depend on position
+    inertia = [m.Value(i, j) for i in range(1, 4) for j in range(i, 4)]
+    face_types = sorted(str(BRepAdaptor_Surface(f.wrapped).GetType()) for f in shape.Faces())
+    moments = _surface_third_moments(shape, size)
+    key = (
+        # Counts rather than the top-level type: a one-solid compound matches its solid
+        FINGERPRINT_VERSION,
+        len(shape.Solids()),
+        len(shape.Shells()),
+        len(shape.Faces()),
+        len(shape.Edges()),
+        len(shape.Vertices()),
+        tuple((t, face_types.count(t)) for t in sorted(set(face_types))),
+        _quantize([props.Mass()], abs(props.Mass()), digits),
+        _quantize([surf.Mass()], abs(surf.Mass()), digits),
+        _quantize(inertia, max(abs(v) for v in inertia), digits),
+        _quantize(extents, size, digits - 2),
+        # Mesh-based, so kept coarser; their signs tell mirror images apart
+        _quantize(moments, size**3, max(digits - 4, 1)),
+    )
+    if anchored:
+        key += (_quantize(centroid, size, digits - 2),)
+    return key, centroid
+
+
+def _digest(key: tuple) -> str:
+    return hashlib.sha256(repr(key).encode()).hexdigest()
+
+
+def fingerprint(shape: ShapeLike, digits: int = 6) -> str:
+    """Canonical hex fingerprint of a part's geometry where it stands.
+
+    Combines topology counts, a face-type histogram, exact mass properties
+    (volume, area, centroid, inertia), the exact bounding box and third
+    moments of the surface, each rounded to `digits` significant digits of
+    the part's size. It does not depend on face order or on any tessellation
+    the shape carries, so parts regenerated by different scripts match when
+    their topology and geometry do, and a previous export or measurement
+    can be reused.
+    """
+
+    return _digest(_signature(_to_shape(shape), digits, anchored=True)[0])
+
+
+def same_geometry(a: ShapeLike, b: ShapeLike, digits: int = 6) -> bool:
+    return fingerprint(a, digits) == fingerprint(b, digits)
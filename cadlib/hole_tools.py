@@ -0,0 +1,147 @@
+import functools
+from math import ceil, log2, radians, tan
+from typing import Any, Callable, Dict, Optional
+
+import cadquery as cq
+
+from .utils import Fit, HEAT_SET_INSERTS_MM, apply_fit_to_hole
+from .validators import HoleSpec
+
+
+ISO_CLEARANCE_DIAMETERS_MM: Dict[str, float] = {
+    # ISO 273 medium clearance; adjusted by Fit
+    "M2": 2.4,
+    "M2_5": 3.0,
+    "M3": 3.4,
+    "M4": 4.5,
+    "M5": 5.5,
+    "M6": 6.6,
+    "M8": 9.0,
+}
+
+UNC_CLEARANCE_DIAMETERS_MM: Dict[str, float] = {
+    # ASME B18.2.8 normal clearance for #2..1/4"
+    "UNC_2": 2.44,
+    "UNC_4": 2.95,
+    "UNC_6": 3.66,
+    "UNC_8": 4.31,
+    "UNC_10": 4.98,
+    "UNC_1_4": 6.53,
+}
+
+HEAD_DIMENSIONS_MM: Dict[str, Dict[str, Dict[str, float]]] = {
+    # Approximate head diameter/height: pan ISO 7045, socket ISO 4762, flat ISO 10642
+    "M2": {"pan": {"d": 4.0, "h": 1.6}, "socket": {"d": 3.8, "h": 2.0}, "flat": {"d": 3.8, "angle": 90.0}},
+    "M2_5": {"pan": {"d": 5.0, "h": 1.8}, "socket": {"d": 4.5, "h": 2.5}, "flat": {"d": 4.7, "angle": 90.0}},
+    "M3": {"pan": {"d": 6.0, "h": 2.4}, "socket": {"d": 5.5, "h": 3.0}, "flat": {"d": 6.0, "angle": 90.0}},
+    "M4": {"pan": {"d": 8.0, "h": 3.1}, "socket": {"d": 7.0, "h": 4.0}, "flat": {"d": 8.5, "angle": 90.0}},
+    "M5": {"pan": {"d": 9.5, "h": 3.7}, "socket": {"d": 8.5, "h": 5.0}, "flat": {"d": 10.0, "angle": 90.0}},
+    "M6": {"pan": {"d": 12.0, "h": 4.6}, "socket": {"d": 10.0, "h": 6.0}, "flat": {"d": 12.0, "angle": 90.0}},
+    "M8": {"pan": {"d": 16.0, "h": 6.0}, "socket": {"d": 13.0, "h": 8.0}, "flat": {"d": 16.0, "angle": 90.0}},
+    # Inch heads (ASME B18.6.3 pan and flat, B18.3 socket); flat heads are 82°
+    "UNC_2": {"pan": {"d": 4.24, "h": 1.57}, "socket": {"d": 3.56, "h": 2.18}, "flat": {"d": 4.37, "angle": 82.0}},
+    "UNC_4": {"pan": {"d": 5.56, "h": 2.03}, "socket": {"d": 4.65, "h": 2.84}, "flat": {"d": 5.72, "angle": 82.0}},
+    "UNC_6": {"pan": {"d": 6.86, "h": 2.46}, "socket": {"d": 5.74, "h": 3.51}, "flat": {"d": 7.09, "angle": 82.0}},
+    "UNC_8": {"pan": {"d": 8.18, "h": 2.92}, "socket": {"d": 6.86, "h": 4.17}, "flat": {"d": 8.43, "angle": 82.0}},
+    "UNC_10": {"pan": {"d": 9.47, "h": 3.38}, "socket": {"d": 7.92, "h": 4.83}, "flat": {"d": 9.78, "angle": 82.0}},
+    "UNC_1_4": {"pan": {"d": 12.5, "h": 4.45}, "socket": {"d": 9.53, "h": 6.35}, "flat": {"d": 12.88, "angle": 82.0}},
+}
+
+# Heat-set inserts are pressed into a hole slightly under their outer diameter
+INSERT_UNDERSIZE_MM = 0.2
+# Smallest through-tool length; longer ones round up to the next power of two
+_MIN_DEPTH_CLASS = 8.0
+# Distinct tools kept per builder; a part rarely uses more than a handful
+_MAX_TOOLS = 256
+
+
+def _shared(func: Callable[..., cq.Solid]) -> Callable[..., cq.Solid]:
+    """Build each tool once per process; every call gets its own copy.
+
+    Booleans keep the tool's faces, so a shared tool would pick up the mesh
+    of every result it cut. A topology copy is ~100x cheaper than rebuilding
+    a fused tool. Tools are cheap enough to rebuild in a fresh process that
+    they stay out of the shape cache and its disk tier.
+    """
+
+    build = functools.lru_cache(maxsize=_MAX_TOOLS)(func)
+
+    @functools.wraps(func)
+    def wrapper(*args: Any) -> cq.Solid:
+        return build(*args).copy()
+
+    wrapper.cache_info = build.cache_info  # type: ignore[attr-defined]
+    wrapper.cache_clear = build.cache_clear  # type: ignore[attr-defined]
+    return wrapper
+
+
+def clearance_diameter(size: str, fit: str = "SNAP") -> float:
+    """Clearance hole diameter for an ISO or UNC screw size with the given fit."""
+
+    table = UNC_CLEARANCE_DIAMETERS_MM if size.startswith("UNC") else ISO_CLEARANCE_DIAMETERS_MM
+    return apply_fit_to_hole(table[size], Fit[fit])
+
+
+def depth_class(depth: float) -> float:
+    """Tool length that covers `depth`, rounded up so targets of similar size share a tool."""
+
+    return max(_MIN_DEPTH_CLASS, 2.0 ** ceil(log2(max(depth, 1.0))))
+
+
+@_shared
+def _screw_tool(size: str, fit: str, head: Optional[str], head_type: Optional[str], depth: float) -> cq.Solid:
+    hole_d = clearance_diameter(size, fit)
+    bore_dir = cq.Vector(0, 0, -1)
+    tool = cq.Solid.makeCylinder(hole_d / 2.0, depth, cq.Vector(), bore_dir)
+    dims = HEAD_DIMENSIONS_MM[size][head_type] if head else {}
+    if head == "countersink":
+        csk_r = dims["d"] / 2.0
+        csk_h = csk_r / tan(radians(dims["angle"] / 2.0))
+        tool = tool.fuse(cq.Solid.makeCone(csk_r, 0.0, csk_h, cq.Vector(), bore_dir))
+    elif head == "counterbore":
+        cbore_d = dims["d"] + 0.2  # small clearance
+        cbore_h = dims["h"] + 0.3
+        tool = tool.fuse(cq.Solid.makeCylinder(cbore_d / 2.0, cbore_h, cq.Vector(), bore_dir))
+    return tool
+
+
+def hole_tool(spec: HoleSpec, through_depth: float) -> cq.Solid:
+    """Cutting tool for one screw hole in local coordinates, shared per process.
+
+    The tool starts at the origin (hole surface) and bores along -Z, matching
+    the geometry of `hole`, `cboreHole` and `cskHole`. Counterbores use the
+    pan/socket head table and countersinks the flat head angle; other head
+    requests get a plain hole. Tools are cached per size, fit, head and depth
+    class, so callers only place located copies.
+    """
+
+    head = None
+    if spec.countersink and spec.head_type == "flat":
+        head = "countersink"
+    elif spec.counterbore and spec.head_type in ("pan", "socket"):
+        head = "counterbore"
+    depth = depth_class(through_depth) if spec.through else float(spec.depth)
+    return _screw_tool(spec.size, spec.fit, head, spec.head_type if head else None, float(depth))
+
+
+def insert_tool(size: str, depth: float) -> cq.Solid:
+    """Heat-set insert pocket boring `depth` along -Z from the origin, slightly under the insert OD."""
+
+    return _insert_tool(size, float(depth))
+
+
+@_shared
+def _insert_tool(size: str, depth: float) -> cq.Solid:
+    hole_d = HEAT_SET_INSERTS_MM[size]["od"] - INSERT_UNDERSIZE_MM
+    return cq.Solid.makeCylinder(hole_d / 2.0, depth, cq.Vector(), cq.Vector(0, 0, -1))
+
+
+def bore_tool(diameter: float, depth: float) -> cq.Solid:
+    """Plain cylindrical bore of `depth` along -Z from the origin."""
+
+    return _bore_tool(float(diameter), float(depth))
+
+
+@_shared
+def _bore_tool(diameter: float, depth: float) -> cq.Solid:
+    return cq.Solid.makeCylinder(diameter / 2.0, depth, cq.Vector(), cq.Vector(0, 0, -1))
@@ -1,15 +1,12 @@
-from typing import Dict
 import cadquery as cq
+from .cache import cached
+from .hole_tools import INSERT_UNDERSIZE_MM
+from .modes import is_preview
+from .profiles import bored, revolve_profile
+from .utils import HEAT_SET_INSERTS_MM
 
 
-HEAT_SET_INSERTS_MM: Dict[str, Dict[str, float]] = {
-    "M2": {"od": 3.0, "len": 3.0},
-    "M2_5": {"od": 3.5, "len": 4.0},
-    "M3": {"od": 4.6, "len": 5.0},
-    "M4": {"od": 6.0, "len": 6.0},
-}
-
-
+@cached
 def insert_boss(size: str = "M3", height: float = 6.0, wall: float = 1.2, through_hole: bool = True) -> cq.Workplane:
     """Create a cylindrical boss for a heat-set insert with relief.
 
@@ -17,24 +14,20 @@ def insert_boss(size: str = "M3", height: float = 6.0, wall: float = 1.2, throug
     - height: boss height
     - wall: radial wall thickness around insert OD
     - through_hole: if True, create a through hole; else blind
+    The relief groove is omitted in preview mode. Wall, groove and pocket
+    are one revolved profile.
     """
 
     spec = HEAT_SET_INSERTS_MM[size]
-    od = spec["od"] + 2 * wall
-    boss = cq.Workplane("XY").circle(od / 2.0).extrude(height)
-    hole_d = spec["od"] - 0.2  # slightly undersized for press fit with heat
-    if through_hole:
-        boss = boss.hole(hole_d)
-    else:
-        boss = boss.hole(hole_d, depth=height - 0.8)
-    # Add small relief groove near top to ease insertion
-    groove = (
-        cq.Workplane("XY")
-        .workplane(offset=height * 0.6)
-        .circle(od / 2.0)
-        .circle((od / 2.0) - 0.3)
-        .extrude(0.6)
-    )
-    return boss.cut(groove)
-
-
+    radius = spec["od"] / 2.0 + wall
+    wall_profile = [(radius, 0.0), (radius, height)]
+    if not is_preview():
+        # Small relief groove near the top to ease insertion
+        g0, g1 = height * 0.6, min(height * 0.6 + 0.6, height)
+        wall_profile[1:1] = [(radius, g0), (radius - 0.3, g0), (radius - 0.3, g1), (radius, g1)]
+    # The pocket is bored from mid-height down (as Workplane.hole on an
+    # extruded body did); blind pockets leave 0.8 mm of floor on short bosses
+    depth = height / 2.0 if through_hole else min(height - 0.8, height / 2.0)
+    pocket_radius = (spec["od"] - INSERT_UNDERSIZE_MM) / 2.0
+    outline, voids = bored(wall_profile, pocket_radius, height / 2.0 - depth, height / 2.0)
+    return cq.Workplane("XY").newObject([revolve_profile(outline, voids)])
@@ -0,0 +1,221 @@
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import cadquery as cq
+from OCP.gp import gp_Trsf
+
+from .modes import tessellation
+from .points import PointsLike, as_points
+from .sections import _to_shape, _weld_mesh
+
+
+def _aabbs_disjoint(shapes: List[cq.Shape], gap: float = 0.0) -> bool:
+    """True if no two bounding boxes touch (within `gap`), via sort-and-sweep on X."""
+
+    boxes = np.array([[bb.xmin, bb.ymin, bb.zmin, bb.xmax, bb.ymax, bb.zmax] for bb in (s.BoundingBox() for s in shapes)])
+    lo, hi = boxes[:, :3] - gap, boxes[:, 3:] + gap
+    order = np.argsort(lo[:, 0])
+    lo, hi = lo[order], hi[order]
+    ends = np.searchsorted(lo[:, 0], hi[:, 0], side="right")
+    for i in range(len(shapes)):
+        j = slice(i + 1, ends[i])
+        if np.any((lo[j, 1] <= hi[i, 1]) & (hi[j, 1] >= lo[i, 1]) & (lo[j, 2] <= hi[i, 2]) & (hi[j, 2] >= lo[i, 2])):
+            return False
+    return True
+
+
+def _fuse_shapes(shapes: Iterable[cq.Shape], fuzzy: float = 0.0) -> cq.Workplane:
+    """Fuse pattern instances in one multi-argument boolean.
+
+    Instances whose bounding boxes are provably disjoint are returned as a
+    compound without running any boolean. Otherwise all instances go through a
+    single general fuse (OCCT parallel mode) with optional fuzzy tolerance.
+    """
+
+    items = list(shapes)
+    if not items:
+        return cq.Workplane("XY").add(cq.Compound.makeCompound([]))
+    if len(items) == 1:
+        return cq.Workplane("XY").add(items[0])
+    if _aabbs_disjoint(items, gap=fuzzy):
+        return cq.Workplane("XY").add(cq.Compound.makeCompound(items))
+    fused = items[0].fuse(*items[1:], tol=fuzzy if fuzzy > 0 else None)
+    return cq.Workplane("XY").add(fused.clean())
+
+
+@dataclass(frozen=True)
+class Instances:
+    """One prototype shape placed at many locations without copying its geometry.
+
+    Every placement is a located reference to the prototype's BRep; real
+    copies are only made by `materialize()` when instances overlap and must be
+    fused.
+    """
+
+    prototype: cq.Shape
+    locations: Tuple[cq.Location, ...]
+
+    @classmethod
+    def at_points(cls, prototype: Union[cq.Shape, cq.Workplane], points: PointsLike) -> "Instances":
+        """Place `prototype` translated to each (x, y) or (x, y, z) point (tuples or an array)."""
+
+        locs = tuple(cq.Location(cq.Vector(*p)) for p in as_points(points).tolist())
+        return cls(_to_shape(prototype), locs)
+
+    def __len__(self) -> int:
+        return len(self.locations)
+
+    def shapes(self) -> List[cq.Shape]:
+        return [self.prototype.moved(loc) for loc in self.locations]
+
+    def compound(self) -> cq.Compound:
+        """All placements as one compound sharing the prototype geometry."""
+
+        return cq.Compound.makeCompound(self.shapes())
+
+    def materialize(self, fuzzy: float = 0.0) -> cq.Workplane:
+        """Fuse overlapping placements into real geometry; disjoint ones stay instanced."""
+
+        return _fuse_shapes(self.shapes(), fuzzy)
+
+
+def _instance_groups(shape: cq.Shape) -> List[Tuple[cq.Shape, List[cq.Shape]]]:
+    """Group the solids of `shape` by shared BRep data (same TShape, any location)."""
+
+    solids = shape.Solids() or [shape]
+    groups: List[Tuple[cq.Shape, List[cq.Shape]]] = []
+    for s in solids:
+        for rep, members in groups:
+            if rep.wrapped.IsPartner(s.wrapped):
+                members.append(s)
+                break
+        else:
+            groups.append((s, [s]))
+    return groups
+
+
+def _trsf_matrix(loc: cq.Location) -> np.ndarray:
+    t = loc.wrapped.Transformation()
+    return np.array([[t.Value(i, j) for j in range(1, 5)] for i in range(1, 4)])
+
+
+def _matrix_location(matrix: np.ndarray) -> cq.Location:
+    """Inverse of `_trsf_matrix`: a 3×4 rigid transform as a `cq.Location`."""
+
+    t = gp_Trsf()
+    t.SetValues(*np.asarray(matrix, dtype=float).reshape(-1).tolist())
+    return cq.Location(t)
+
+
+def _prototype_meshes(
+    shape: Union[cq.Shape, cq.Workplane, Instances], tolerance: Optional[float]
+) -> List[Tuple[np.ndarray, np.ndarray, List[Tuple[np.ndarray, bool]]]]:
+    """(vertices, triangles, [(3x4 placement, reversed orientation)]) per distinct prototype."""
+
+    # An unset tolerance follows the quality mode: 0.05 mm / 0.1 rad in final
+    linear, angular = tessellation(0.05, 0.1)
+    if tolerance is not None:
+        linear = tolerance
+    if isinstance(shape, Instances):
+        shape = shape.compound()
+    shape = _to_shape(shape)
+    meshes = []
+    for rep, members in _instance_groups(shape):
+        proto = cq.Shape.cast(rep.wrapped.Located(cq.Location().wrapped))
+        verts, tris = _weld_mesh(proto, linear, angular)
+        placements = []
+        for m in members:
+            mat = _trsf_matrix(cq.Location(m.wrapped.Location()))
+            placements.append((mat, m.wrapped.Orientation() != rep.wrapped.Orientation()))
+        meshes.append((verts, tris, placements))
+    return meshes
+
+
+def instanced_mesh(
+    shape: Union[cq.Shape, cq.Workplane, Instances],
+    tolerance: Optional[float] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Triangle mesh of `shape` that tessellates each distinct prototype once.
+
+    Solids sharing BRep data (instances from patterns, standoffs or
+    `Instances`) reuse the prototype's triangles, transformed per placement.
+    `tolerance` defaults to 0.05 mm; preview mode meshes coarser.
+    Returns (vertices (N,3), triangles (M,3)).
+    """
+
+    all_verts: List[np.ndarray] = []
+    all_tris: List[np.ndarray] = []
+    offset = 0
+    for verts, tris, placements in _prototype_meshes(shape, tolerance):
+        for mat, reversed_ in placements:
+            # Mirroring placements and reversed copies each flip the winding
+            flip = reversed_ != (np.linalg.det(mat[:, :3]) < 0)
+            all_verts.append(verts @ mat[:, :3].T + mat[:, 3])
+            all_tris.append((tris[:, ::-1] if flip else tris) + offset)
+            offset += len(verts)
+    if not all_verts:
+        return np.zeros((0, 3)), np.zeros((0, 3), dtype=np.int64)
+    return np.concatenate(all_verts), np.concatenate(all_tris)
+
+
+_3MF_CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="model" ContentType="application/vnd.ms-package.3dmanufacturing-3dmodel+xml"/>
+</Types>"""
+_3MF_RELS = """<?xml version="1.0" encoding="UTF-8"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Target="/3D/3dmodel.model" Id="rel0" Type="http://schemas.microsoft.com/3dmanufacturing/2013/01/3dmodel"/>
+</Relationships>"""
+
+
+def _3mf_object(obj_id: int, verts: np.ndarray, tris: np.ndarray) -> str:
+    vs = "".join(f'<vertex x="{x:.6f}" y="{y:.6f}" z="{z:.6f}"/>' for x, y, z in verts.tolist())
+    ts = "".join(f'<triangle v1="{a}" v2="{b}" v3="{c}"/>' for a, b, c in tris.tolist())
+    return f'<object id="{obj_id}" type="model"><mesh><vertices>{vs}</vertices><triangles>{ts}</triangles></mesh></object>'
+
+
+def export_3mf(
+    shape: Union[cq.Shape, cq.Workplane, Instances],
+    path: str,
+    tolerance: Optional[float] = None,
+) -> int:
+    """Write a 3MF file storing each distinct prototype mesh once.
+
+    Every placement becomes a build item referencing the prototype with its
+    transform, so file size and export time stay flat as instance counts grow.
+    `tolerance` defaults to 0.05 mm; preview mode meshes coarser.
+    Returns the number of build items written.
+    """
+
+    return _write_3mf(path, _prototype_meshes(shape, tolerance))
+
+
+def _write_3mf(path: str, meshes: List[Tuple[np.ndarray, np.ndarray, List[Tuple[np.ndarray, bool]]]]) -> int:
+    """Write (vertices, triangles, placements) meshes as 3MF objects and build items."""
+
+    import zipfile
+
+    objects: List[str] = []
+    items: List[str] = []
+    for verts, tris, placements in meshes:
+        ids = {}
+        for mat, reversed_ in placements:
+            # Readers flip the winding of mirroring transforms themselves; only reversed copies need their own object
+            if reversed_ not in ids:
+                ids[reversed_] = len(objects) + 1
+                objects.append(_3mf_object(ids[reversed_], verts, tris[:, ::-1] if reversed_ else tris))
+            # 3MF multiplies row vectors: the rotation is transposed, translation is the last row
+            m = np.vstack([mat[:, :3].T, mat[:, 3]]).reshape(-1)
+            items.append(f'<item objectid="{ids[reversed_]}" transform="{" ".join(f"{v:.9g}" for v in m)}"/>')
+    model = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<model unit="millimeter" xml:lang="en-US" xmlns="http://schemas.microsoft.com/3dmanufacturing/core/2015/02">'
+        f'<resources>{"".join(objects)}</resources><build>{"".join(items)}</build></model>'
+    )
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", _3MF_CONTENT_TYPES)
+        zf.writestr("_rels/.rels", _3MF_RELS)
+        zf.writestr("3D/3dmodel.model", model)
+    return len(items)
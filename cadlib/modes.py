@@ -0,0 +1,85 @@
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Literal, Tuple, cast
+
+Quality = Literal["preview", "final"]
+QUALITIES: Tuple[Quality, ...] = ("preview", "final")
+
+# Preview tessellation is this much coarser than the caller's final tolerance
+PREVIEW_TOLERANCE_SCALE = 5.0
+PREVIEW_ANGULAR_TOLERANCE = 0.5
+
+
+def _check(mode: str) -> Quality:
+    if mode not in QUALITIES:
+        raise ValueError(f"quality must be one of {QUALITIES}, got {mode!r}")
+    return cast(Quality, mode)
+
+
+_QUALITY: ContextVar[Quality] = ContextVar("cadlib_quality", default=_check(os.environ.get("CADLIB_QUALITY", "final")))
+_THREADS: ContextVar[bool] = ContextVar("cadlib_thread_geometry", default=os.environ.get("CADLIB_THREADS", "cosmetic") == "real")
+
+
+def current_quality() -> Quality:
+    """Active quality mode ("final" unless changed by `quality` or CADLIB_QUALITY)."""
+
+    return _QUALITY.get()
+
+
+def is_preview() -> bool:
+    return _QUALITY.get() == "preview"
+
+
+def set_quality(mode: Quality) -> None:
+    """Set the quality mode for the current context (thread or task) until changed."""
+
+    _QUALITY.set(_check(mode))
+
+
+@contextmanager
+def quality(mode: Quality) -> Iterator[Quality]:
+    """Build with the given quality mode inside a `with` block.
+
+    In "preview" builders skip cosmetic fillets and relief grooves and
+    tessellation is coarser; "final" reproduces the full geometry. Cached
+    results are keyed by mode.
+    """
+
+    token = _QUALITY.set(_check(mode))
+    try:
+        yield mode
+    finally:
+        _QUALITY.reset(token)
+
+
+def tessellation(tolerance: float = 0.1, angular_tolerance: float = 0.1) -> Tuple[float, float]:
+    """(linear, angular) tessellation tolerances for the active mode.
+
+    Final returns the arguments unchanged; preview coarsens them.
+    """
+
+    if is_preview():
+        return tolerance * PREVIEW_TOLERANCE_SCALE, max(angular_tolerance, PREVIEW_ANGULAR_TOLERANCE)
+    return tolerance, angular_tolerance
+
+
+def real_threads() -> bool:
+    """Whether threads are built as helical geometry: switched on and not in preview."""
+
+    return _THREADS.get() and not is_preview()
+
+
+@contextmanager
+def thread_geometry(enabled: bool = True) -> Iterator[bool]:
+    """Build threads as real helical geometry inside a `with` block.
+
+    Threads are cosmetic cylinders by default (or when CADLIB_THREADS is not
+    "real"), and always in preview. Cached results are keyed by this switch.
+    """
+
+    token = _THREADS.set(bool(enabled))
+    try:
+        yield bool(enabled)
+    finally:
+        _THREADS.reset(token)
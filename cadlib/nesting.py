@@ -0,0 +1,304 @@
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import cadquery as cq
+from scipy.spatial import ConvexHull, QhullError
+
+from .compare import load_stl, write_stl
+from .instances import _matrix_location, _write_3mf
+from .modes import tessellation
+from .sections import _signed_area, _to_shape, _weld_mesh
+
+
+Mesh = Tuple[np.ndarray, np.ndarray]
+PartLike = Union[cq.Workplane, cq.Shape, Mesh, str]
+
+# Rotation taking each candidate "down" direction to -Z
+_DOWN_ROTATIONS: Dict[Tuple[int, int, int], np.ndarray] = {
+    (0, 0, -1): np.eye(3),
+    (0, 0, 1): np.diag([1.0, -1.0, -1.0]),
+    (1, 0, 0): np.array([[0.0, 0.0, 1.0], [0.0, 1.0, 0.0], [-1.0, 0.0, 0.0]]),
+    (-1, 0, 0): np.array([[0.0, 0.0, -1.0], [0.0, 1.0, 0.0], [1.0, 0.0, 0.0]]),
+    (0, 1, 0): np.array([[1.0, 0.0, 0.0], [0.0, 0.0, 1.0], [0.0, -1.0, 0.0]]),
+    (0, -1, 0): np.array([[1.0, 0.0, 0.0], [0.0, 0.0, -1.0], [0.0, 1.0, 0.0]]),
+}
+
+
+class _Part(NamedTuple):
+    name: str
+    verts: np.ndarray
+    tris: np.ndarray
+    shape: Optional[cq.Shape]
+
+
+def _rz(angle: float) -> np.ndarray:
+    c, s = np.cos(angle), np.sin(angle)
+    return np.array([[c, -s, 0.0], [s, c, 0.0], [0.0, 0.0, 1.0]])
+
+
+def _load_part(name: str, part: PartLike, tolerance: float, angular: float) -> _Part:
+    if isinstance(part, (str, os.PathLike)):
+        path = os.fspath(part)
+        ext = os.path.splitext(path)[1].lower()
+        if ext == ".stl":
+            verts, tris = load_stl(path)
+            return _Part(name, verts, tris, None)
+        if ext in (".step", ".stp"):
+            part = cq.importers.importStep(path)
+        elif ext == ".brep":
+            part = cq.importers.importBrep(path)
+        else:
+            raise ValueError(f"unsupported part file {path!r}; expected .stl, .step or .brep")
+    if isinstance(part, tuple):
+        return _Part(name, np.asarray(part[0], dtype=float), np.asarray(part[1], dtype=np.int64), None)
+    shape = _to_shape(part)
+    verts, tris = _weld_mesh(shape, tolerance, angular)
+    return _Part(name, verts, tris, shape)
+
+
+def print_orientation(verts: np.ndarray, tris: np.ndarray, tolerance: float = 0.05) -> np.ndarray:
+    """3×3 rotation that puts the part on its best axis-aligned face.
+
+    Each of the six axis directions is scored by the area of triangles lying
+    flat on that extreme plane (bed contact); ties go to the lower part,
+    then to the current orientation.
+    """
+
+    a, b, c = verts[tris[:, 0]], verts[tris[:, 1]], verts[tris[:, 2]]
+    n = np.cross(b - a, c - a)
+    area2 = np.linalg.norm(n, axis=1)
+    unit = n / np.maximum(area2, 1e-300)[:, None]
+    best, best_score = (0, 0, -1), None
+    for d in _DOWN_ROTATIONS:
+        dv = np.asarray(d, dtype=float)
+        h = verts @ dv
+        top = h.max()
+        flat = (unit @ dv > 0.999) & (np.minimum(np.minimum(h[tris[:, 0]], h[tris[:, 1]]), h[tris[:, 2]]) >= top - tolerance)
+        contact = 0.5 * float(area2[flat].sum())
+        score = (round(contact, 3), -round(float(top - h.min()), 3))
+        if best_score is None or score > best_score:
+            best, best_score = d, score
+    return _DOWN_ROTATIONS[best]
+
+
+def _hull(xy: np.ndarray) -> np.ndarray:
+    """Counter-clockwise convex hull; the bounding rectangle for degenerate input."""
+
+    try:
+        return xy[ConvexHull(xy).vertices]
+    except (QhullError, ValueError):
+        lo, hi = xy.min(axis=0), xy.max(axis=0)
+        return np.array([lo, [hi[0], lo[1]], hi, [lo[0], hi[1]]])
+
+
+def _min_area_angle(hull: np.ndarray) -> float:
+    """Z rotation aligning the hull's minimum-area bounding rectangle with the axes (rotating calipers)."""
+
+    edges = np.roll(hull, -1, axis=0) - hull
+    theta = np.unique(np.round(np.mod(np.arctan2(edges[:, 1], edges[:, 0]), np.pi / 2.0), 9))
+    c, s = np.cos(theta)[:, None], np.sin(theta)[:, None]
+    x = hull[:, 0] * c + hull[:, 1] * s
+    y = -hull[:, 0] * s + hull[:, 1] * c
+    area = (x.max(axis=1) - x.min(axis=1)) * (y.max(axis=1) - y.min(axis=1))
+    return -float(theta[np.argmin(area)])
+
+
+class _MaxRects:
+    """MaxRects bin with best-short-side-fit placement."""
+
+    def __init__(self, width: float, height: float):
+        self.free: List[Tuple[float, float, float, float]] = [(0.0, 0.0, width, height)]
+
+    def find(self, w: float, h: float, rotate: bool) -> Optional[Tuple[tuple, float, float, bool]]:
+        best = None
+        for fx, fy, fw, fh in self.free:
+            for rw, rh, rotated in ((w, h, False), (h, w, True)) if rotate else ((w, h, False),):
+                if rw <= fw + 1e-9 and rh <= fh + 1e-9:
+                    score = (min(fw - rw, fh - rh), max(fw - rw, fh - rh), fy, fx)
+                    if best is None or score < best[0]:
+                        best = (score, fx, fy, rotated)
+        return best
+
+    def place(self, x: float, y: float, w: float, h: float) -> None:
+        split: List[Tuple[float, float, float, float]] = []
+        for fx, fy, fw, fh in self.free:
+            if x >= fx + fw or x + w <= fx or y >= fy + fh or y + h <= fy:
+                split.append((fx, fy, fw, fh))
+                continue
+            if x > fx:
+                split.append((fx, fy, x - fx, fh))
+            if x + w < fx + fw:
+                split.append((x + w, fy, fx + fw - x - w, fh))
+            if y > fy:
+                split.append((fx, fy, fw, y - fy))
+            if y + h < fy + fh:
+                split.append((fx, y + h, fw, fy + fh - y - h))
+        # Drop free rectangles contained in another
+        self.free = [
+            r
+            for i, r in enumerate(split)
+            if not any(
+                j != i
+                and o[0] <= r[0]
+                and o[1] <= r[1]
+                and o[0] + o[2] >= r[0] + r[2]
+                and o[1] + o[3] >= r[1] + r[3]
+                and (o != r or j < i)
+                for j, o in enumerate(split)
+            )
+        ]
+
+
+@dataclass(frozen=True)
+class Placement:
+    """Where one part lands: `matrix` (3×4) maps part coordinates to bed coordinates."""
+
+    name: str
+    part: int
+    plate: int
+    matrix: np.ndarray
+    footprint: np.ndarray
+
+    @property
+    def location(self) -> cq.Location:
+        return _matrix_location(self.matrix)
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "plate": self.plate,
+            "matrix": np.vstack([self.matrix, [0.0, 0.0, 0.0, 1.0]]).tolist(),
+        }
+
+
+@dataclass(frozen=True)
+class PlateLayout:
+    """Parts arranged on one or more print beds of size `bed` (X, Y mm)."""
+
+    bed: Tuple[float, float]
+    placements: Tuple[Placement, ...]
+    parts: Tuple[_Part, ...] = field(repr=False)
+
+    @property
+    def plate_count(self) -> int:
+        return 1 + max((p.plate for p in self.placements), default=-1)
+
+    def on_plate(self, plate: int = 0) -> List[Placement]:
+        return [p for p in self.placements if p.plate == plate]
+
+    def utilization(self, plate: int = 0) -> float:
+        """Fraction of the bed covered by footprints."""
+
+        area = sum(abs(_signed_area(p.footprint)) for p in self.on_plate(plate))
+        return area / (self.bed[0] * self.bed[1])
+
+    def compound(self, plate: int = 0) -> cq.Compound:
+        """Placed solids of one plate; needs parts given as shapes or STEP/BREP files."""
+
+        shapes = []
+        for p in self.on_plate(plate):
+            shape = self.parts[p.part].shape
+            if shape is None:
+                raise ValueError(f"part {p.name!r} is a mesh; export the plate as .stl or .3mf")
+            shapes.append(shape.moved(p.location))
+        return cq.Compound.makeCompound(shapes)
+
+    def mesh(self, plate: int = 0) -> Mesh:
+        verts, tris, offset = [], [], 0
+        for p in self.on_plate(plate):
+            part = self.parts[p.part]
+            verts.append(part.verts @ p.matrix[:, :3].T + p.matrix[:, 3])
+            tris.append(part.tris + offset)
+            offset += len(part.verts)
+        if not verts:
+            return np.zeros((0, 3)), np.zeros((0, 3), dtype=np.int64)
+        return np.concatenate(verts), np.concatenate(tris)
+
+    def export(self, path: str, plate: int = 0) -> None:
+        """Write one plate as .stl, .3mf (one object per part plus its transform), or .step/.brep."""
+
+        ext = os.path.splitext(path)[1].lower()
+        if ext == ".stl":
+            write_stl(path, *self.mesh(plate))
+        elif ext == ".3mf":
+            meshes = [(self.parts[p.part].verts, self.parts[p.part].tris, [(p.matrix, False)]) for p in self.on_plate(plate)]
+            _write_3mf(path, meshes)
+        else:
+            cq.exporters.export(self.compound(plate), path)
+
+    def transforms(self) -> List[dict]:
+        """Per-part name, plate and 4×4 bed transform, JSON-ready."""
+
+        return [p.to_dict() for p in sorted(self.placements, key=lambda p: p.part)]
+
+
+def nest(
+    parts: Union[Sequence[PartLike], Mapping[str, PartLike]],
+    bed: Tuple[float, float] = (220.0, 220.0),
+    spacing: float = 2.0,
+    margin: float = 5.0,
+    orient: bool = True,
+    rotate: bool = True,
+    tolerance: Optional[float] = None,
+) -> PlateLayout:
+    """Arrange parts on print beds.
+
+    Parts are solids, (vertices, triangles) meshes or .stl/.step/.brep paths,
+    as a list or a {name: part} dict. Each part is laid on its best flat
+    face (`orient`), turned so its convex footprint has the smallest bounding
+    rectangle, and packed MaxRects-style with optional 90° turns (`rotate`).
+    Parts keep `spacing` between footprints and `margin` from the bed edge;
+    extra plates are opened as needed. `tolerance` is the tessellation used
+    for solids (0.05 mm by default; coarser in preview mode).
+    """
+
+    items = list(parts.items()) if isinstance(parts, Mapping) else [
+        (os.path.splitext(os.path.basename(p))[0] if isinstance(p, (str, os.PathLike)) else f"part{i + 1}", p)
+        for i, p in enumerate(parts)
+    ]
+    linear, angular = tessellation(0.05, 0.1)
+    if tolerance is not None:
+        linear = tolerance
+    loaded = tuple(_load_part(name, part, linear, angular) for name, part in items)
+
+    prepared = []
+    for part in loaded:
+        rot = print_orientation(part.verts, part.tris, linear) if orient else np.eye(3)
+        hull = _hull((part.verts @ rot.T)[:, :2])
+        rot = _rz(_min_area_angle(hull)) @ rot
+        xy = (part.verts @ rot.T)[:, :2]
+        size = xy.max(axis=0) - xy.min(axis=0)
+        prepared.append((rot, size))
+
+    usable = (bed[0] - 2.0 * margin + spacing, bed[1] - 2.0 * margin + spacing)
+    bins: List[_MaxRects] = []
+    placements: List[Placement] = []
+    # Largest footprints first
+    order = sorted(range(len(loaded)), key=lambda i: (-float(np.prod(prepared[i][1])), -float(prepared[i][1].max())))
+    for i in order:
+        part, (rot, size) = loaded[i], prepared[i]
+        w, h = float(size[0]) + spacing, float(size[1]) + spacing
+        spot = None
+        for plate, b in enumerate(bins):
+            spot = b.find(w, h, rotate)
+            if spot is not None:
+                break
+        if spot is None:
+            b = _MaxRects(*usable)
+            spot = b.find(w, h, rotate)
+            if spot is None:
+                raise ValueError(f"part {part.name!r} ({size[0]:.1f} × {size[1]:.1f} mm) does not fit the bed")
+            bins.append(b)
+            plate = len(bins) - 1
+        _, x, y, rotated = spot
+        b.place(x, y, h if rotated else w, w if rotated else h)
+        if rotated:
+            rot = _rz(np.pi / 2.0) @ rot
+        placed = part.verts @ rot.T
+        lo = placed.min(axis=0)
+        shift = np.array([x + margin - lo[0], y + margin - lo[1], -lo[2]])
+        footprint = _hull(placed[:, :2]) + shift[:2]
+        placements.append(Placement(part.name, i, plate, np.column_stack([rot, shift]), footprint))
+    return PlateLayout((float(bed[0]), float(bed[1])), tuple(sorted(placements, key=lambda p: p.part)), loaded)
@@ -0,0 +1,158 @@
+import atexit
+import io
+import multiprocessing
+import os
+import sys
+import types
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+import cadquery as cq
+
+from .modes import Quality, current_quality, quality, real_threads, thread_geometry
+
+
+@dataclass(frozen=True)
+class Call:
+    """A deferred builder call: a module-level function and its arguments."""
+
+    func: Callable[..., Any]
+    args: Tuple[Any, ...] = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+    def run(self) -> Any:
+        return self.func(*self.args, **self.kwargs)
+
+
+def call(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Call:
+    """Describe `func(*args, **kwargs)` for `run_parallel`."""
+
+    return Call(func, args, kwargs)
+
+
+def shape_to_bytes(shape: cq.Shape) -> bytes:
+    """Serialize a shape as binary BRep."""
+
+    buf = io.BytesIO()
+    shape.exportBin(buf)
+    return buf.getvalue()
+
+
+def shape_from_bytes(data: bytes) -> cq.Shape:
+    """Rebuild a shape from binary BRep bytes."""
+
+    return cq.Shape.importBin(io.BytesIO(data))
+
+
+def _pack(result: Any) -> Tuple[str, Any]:
+    if isinstance(result, cq.Workplane):
+        vals = result.vals()
+        if vals and all(isinstance(v, cq.Shape) for v in vals):
+            p = result.plane
+            plane = (p.origin.toTuple(), p.xDir.toTuple(), p.zDir.toTuple())
+            return "workplane", ([shape_to_bytes(v) for v in vals], plane)
+    if isinstance(result, cq.Shape):
+        return "shape", shape_to_bytes(result)
+    return "object", result
+
+
+def _unpack(packed: Tuple[str, Any]) -> Any:
+    kind, payload = packed
+    if kind == "workplane":
+        blobs, (origin, x_dir, normal) = payload
+        plane = cq.Plane(cq.Vector(*origin), cq.Vector(*x_dir), cq.Vector(*normal))
+        return cq.Workplane(plane).newObject([shape_from_bytes(b) for b in blobs])
+    if kind == "shape":
+        return shape_from_bytes(payload)
+    return payload
+
+
+def _run_packed(c: Call, mode: Quality, threads: bool = False) -> Tuple[str, Any]:
+    with quality(mode), thread_geometry(threads):
+        return _pack(c.run())
+
+
+_POOL: Optional[ProcessPoolExecutor] = None
+_POOL_WORKERS = 0
+
+
+def _context() -> multiprocessing.context.BaseContext:
+    # Workers fork from a clean server that has cadquery preloaded: fast start,
+    # and no OCCT worker threads are inherited mid-operation as with plain fork.
+    if sys.platform.startswith("linux"):
+        ctx = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload(["cadquery", "cadlib"])
+        return ctx
+    return multiprocessing.get_context("spawn")
+
+
+@contextmanager
+def _detached_main() -> Iterator[None]:
+    """Hide the running script from multiprocessing while workers start.
+
+    Spawned and forkserver workers otherwise re-execute `__main__` (for the
+    runner: the generated part script). Calls only reference importable
+    functions, so workers never need it.
+    """
+
+    main = sys.modules.get("__main__")
+    sys.modules["__main__"] = types.ModuleType("__main__")
+    try:
+        yield
+    finally:
+        if main is not None:
+            sys.modules["__main__"] = main
+
+
+def get_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Shared process pool, created on first use and resized on demand."""
+
+    global _POOL, _POOL_WORKERS
+    workers = max_workers or os.cpu_count() or 1
+    if _POOL is None or _POOL_WORKERS != workers:
+        shutdown_pool()
+        _POOL = ProcessPoolExecutor(max_workers=workers, mp_context=_context())
+        _POOL_WORKERS = workers
+    return _POOL
+
+
+def shutdown_pool() -> None:
+    """Stop the shared worker processes (they restart on the next parallel call)."""
+
+    global _POOL, _POOL_WORKERS
+    if _POOL is not None:
+        _POOL.shutdown(wait=True, cancel_futures=True)
+    _POOL, _POOL_WORKERS = None, 0
+
+
+atexit.register(shutdown_pool)
+
+
+def run_parallel(
+    calls: Union[Sequence[Call], Mapping[str, Call]],
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Union[List[Any], Dict[str, Any]]:
+    """Run independent builder calls on worker processes.
+
+    Results come back as binary BRep and are rebuilt as Workplanes/Shapes in
+    the caller; other return values are pickled. Workers build with the
+    caller's quality mode and thread geometry switch. A list of calls returns
+    a list, a mapping returns a dict with the same keys. With one worker (or
+    a single call) everything runs inline without serialization.
+    """
+
+    keys = list(calls.keys()) if isinstance(calls, Mapping) else None
+    items = list(calls.values()) if isinstance(calls, Mapping) else list(calls)
+    workers = min(max_workers or os.cpu_count() or 1, len(items))
+    if executor is None and workers <= 1:
+        results = [c.run() for c in items]
+    else:
+        pool = executor or get_pool(max_workers)
+        # Workers (and the fork server) start lazily on submit
+        with _detached_main():
+            futures = [pool.submit(_run_packed, c, current_quality(), real_threads()) for c in items]
+        results = [_unpack(f.result()) for f in futures]
+    return dict(zip(keys, results)) if keys is not None else results
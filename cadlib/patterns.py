@@ -1,62 +1,48 @@
-from math import radians, cos, sin
-from typing import Iterable
-
+import numpy as np
 import cadquery as cq
 
+from .instances import _fuse_shapes
+from .points import PointsLike, as_points, bolt_circle_points, rect_grid_points
+
 
-def _fuse_shapes(shapes: Iterable[cq.Shape]) -> cq.Workplane:
-    comp = cq.Compound.makeCompound(list(shapes))
-    return cq.Workplane("XY").add(comp).combine()
+def array_at_points(solid: cq.Workplane, points: PointsLike, fuzzy: float = 0.0) -> cq.Workplane:
+    """Place a copy of `solid` translated to every point and fuse.
 
+    `points` may be (x, y) or (x, y, z) tuples or an (N,2)/(N,3) array, e.g.
+    from the `points` generators.
+    `fuzzy` is the boolean fuzzy tolerance in mm for nearly touching instances.
+    """
 
-def linear_array(solid: cq.Workplane, n: int, dx: float = 0.0, dy: float = 0.0, dz: float = 0.0) -> cq.Workplane:
+    base_shape = solid.val()
+    shapes = [base_shape.located(cq.Location(cq.Vector(*p))) for p in as_points(points).tolist()]
+    return _fuse_shapes(shapes, fuzzy)
+
+
+def linear_array(solid: cq.Workplane, n: int, dx: float = 0.0, dy: float = 0.0, dz: float = 0.0, fuzzy: float = 0.0) -> cq.Workplane:
     """Duplicate `solid` n times along a vector (dx, dy, dz) and fuse.
 
     The first instance is placed at the origin offset (0,0,0).
+    `fuzzy` is the boolean fuzzy tolerance in mm for nearly touching instances.
     """
 
-    base_shape = solid.val()
-    shapes = []
-    for i in range(n):
-        loc = cq.Location(cq.Vector(dx * i, dy * i, dz * i))
-        shapes.append(base_shape.located(loc))
-    return _fuse_shapes(shapes)
+    return array_at_points(solid, np.arange(n)[:, None] * np.array([dx, dy, dz], dtype=float), fuzzy)
 
 
-def grid_array(solid: cq.Workplane, nx: int, ny: int, dx: float, dy: float, centered: bool = True) -> cq.Workplane:
+def grid_array(solid: cq.Workplane, nx: int, ny: int, dx: float, dy: float, centered: bool = True, fuzzy: float = 0.0) -> cq.Workplane:
     """Create an nx by ny grid of `solid` spaced by dx, dy and fuse.
 
     If centered, the grid is centered around the origin.
+    `fuzzy` is the boolean fuzzy tolerance in mm for nearly touching instances.
     """
 
-    base_shape = solid.val()
-    shapes = []
-    x0 = -((nx - 1) * dx) / 2.0 if centered else 0.0
-    y0 = -((ny - 1) * dy) / 2.0 if centered else 0.0
-    for ix in range(nx):
-        for iy in range(ny):
-            x = x0 + ix * dx
-            y = y0 + iy * dy
-            loc = cq.Location(cq.Vector(x, y, 0))
-            shapes.append(base_shape.located(loc))
-    return _fuse_shapes(shapes)
-
-
-def circular_array(solid: cq.Workplane, n: int, radius: float, start_angle_deg: float = 0.0, arc_span_deg: float = 360.0) -> cq.Workplane:
+    return array_at_points(solid, rect_grid_points(nx, ny, dx, dy, centered), fuzzy)
+
+
+def circular_array(solid: cq.Workplane, n: int, radius: float, start_angle_deg: float = 0.0, arc_span_deg: float = 360.0, fuzzy: float = 0.0) -> cq.Workplane:
     """Distribute `solid` around a circle or arc of given radius and fuse.
 
     start_angle_deg defines the first instance angle; arc_span_deg defines total arc.
+    `fuzzy` is the boolean fuzzy tolerance in mm for nearly touching instances.
     """
 
-    base_shape = solid.val()
-    shapes = []
-    step = arc_span_deg / max(n - 1, 1) if arc_span_deg < 360 else 360.0 / n
-    for i in range(n):
-        ang = start_angle_deg + step * i
-        x = radius * cos(radians(ang))
-        y = radius * sin(radians(ang))
-        loc = cq.Location(cq.Vector(x, y, 0))
-        shapes.append(base_shape.located(loc))
-    return _fuse_shapes(shapes)
-
-
+    return array_at_points(solid, bolt_circle_points(n, radius, start_angle_deg, arc_span_deg), fuzzy)
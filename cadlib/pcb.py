@@ -1,7 +1,12 @@
 from typing import List, Tuple
 import cadquery as cq
+from .cache import cached
+from .profiles import revolve_profile, ring
+from .instances import Instances
+from .modes import is_preview
 
 
+@cached
 def pcb_pocket(board_length: float, board_width: float, thickness: float, clearance: float = 0.2, depth: float = None) -> cq.Workplane:
     """Create a rectangular PCB pocket in XY, extruded in +Z by depth (defaults to thickness).
 
@@ -14,6 +19,7 @@ def pcb_pocket(board_length: float, board_width: float, thickness: float, cleara
     return cq.Workplane("XY").rect(L, W).extrude(depth)
 
 
+@cached
 def pcb_standoffs(
     hole_locations_xy: List[Tuple[float, float]],
     height: float,
@@ -23,27 +29,16 @@ def pcb_standoffs(
 ) -> cq.Workplane:
     """Generate cylindrical standoffs at PCB hole locations.
 
-    Returns fused solid of all standoffs.
+    One standoff is revolved from its section and filleted, then placed at
+    every location as an instance; only overlapping standoffs are fused.
+    Returns all standoffs. Preview mode skips the fillet.
     """
 
-    shapes = []
-    for (x, y) in hole_locations_xy:
-        standoff = (
-            cq.Workplane("XY")
-            .workplane(offset=0)
-            .center(x, y)
-            .circle(outer_d / 2.0)
-            .extrude(height)
-            .faces("<Z").workplane().hole(hole_d)
-        )
-        if fillet > 0:
-            try:
-                standoff = standoff.edges("|Z").fillet(fillet)
-            except Exception:
-                # If fillet fails due to small geometry, skip fillet
-                pass
-        shapes.append(standoff.val())
-    comp = cq.Compound.makeCompound(shapes)
-    return cq.Workplane("XY").add(comp).combine()
-
-
+    standoff = cq.Workplane("XY").newObject([revolve_profile(ring(hole_d / 2.0, outer_d / 2.0, 0.0, height))])
+    if fillet > 0 and not is_preview():
+        try:
+            standoff = standoff.edges("|Z").fillet(fillet)
+        except Exception:
+            # If fillet fails due to small geometry, skip fillet
+            pass
+    return Instances.at_points(standoff, hole_locations_xy).materialize()
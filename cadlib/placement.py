@@ -0,0 +1,202 @@
+from dataclasses import dataclass, field, replace
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import cadquery as cq
+
+from .points import PointsLike, Region, as_points
+from .sections import _points_in_polygon, _signed_area, _to_shape, section
+from .utils import min_printable_wall_mm
+
+
+ShapeLike = Union[cq.Workplane, cq.Shape]
+Polygon = np.ndarray  # (M,2) closed loop, last point not repeated
+
+# Point × segment pairs evaluated per chunk, bounding temporary memory
+_CHUNK_PAIRS = 1 << 20
+
+
+def _polygon(points: Sequence[Sequence[float]]) -> Polygon:
+    poly = np.asarray(points, dtype=float)[:, :2]
+    if len(poly) > 1 and np.allclose(poly[0], poly[-1]):
+        poly = poly[:-1]
+    if len(poly) < 3:
+        raise ValueError("a polygon needs at least 3 points")
+    return poly
+
+
+def _rect_polygon(rect: Region) -> Polygon:
+    xmin, ymin, xmax, ymax = (float(v) for v in rect)
+    return np.array([[xmin, ymin], [xmax, ymin], [xmax, ymax], [xmin, ymax]])
+
+
+def _footprint(shape: ShapeLike, z: Optional[float] = None) -> List[Tuple[Polygon, List[Polygon]]]:
+    """(outer, holes) polygons of an XY section; by default at the shape's mid-height."""
+
+    solid = _to_shape(shape)
+    if z is None:
+        bb = solid.BoundingBox()
+        z = (bb.zmin + bb.zmax) / 2.0
+    return section(solid, z=z).polygons()
+
+
+def _near_edges(xy: np.ndarray, polygons: Sequence[Polygon], distance: float) -> np.ndarray:
+    """True for points closer than `distance` to an edge of any polygon.
+
+    Point/segment pairs are first screened with the segment's bounding box
+    grown by `distance`; exact distances run only on the pairs that pass.
+    """
+
+    near = np.zeros(len(xy), dtype=bool)
+    if not polygons or len(xy) == 0 or distance <= 0:
+        return near
+    a = np.concatenate(polygons)
+    b = np.concatenate([np.roll(p, -1, axis=0) for p in polygons])
+    ab = b - a
+    len2 = np.maximum(np.einsum("ij,ij->i", ab, ab), 1e-300)
+    lo, hi = np.minimum(a, b) - distance, np.maximum(a, b) + distance
+    step = max(1, _CHUNK_PAIRS // len(a))
+    for s in range(0, len(xy), step):
+        p = xy[s : s + step]
+        px, py = p[:, :1], p[:, 1:]
+        i, j = np.nonzero((px >= lo[:, 0]) & (px <= hi[:, 0]) & (py >= lo[:, 1]) & (py <= hi[:, 1]))
+        if len(i) == 0:
+            continue
+        ap = p[i] - a[j]
+        t = np.clip(np.einsum("ij,ij->i", ap, ab[j]) / len2[j], 0.0, 1.0)
+        d = ap - t[:, None] * ab[j]
+        near[s + i[np.einsum("ij,ij->i", d, d) < distance * distance]] = True
+    return near
+
+
+def _inside_any(xy: np.ndarray, polygons: Sequence[Polygon]) -> np.ndarray:
+    inside = np.zeros(len(xy), dtype=bool)
+    for poly in polygons:
+        lo, hi = poly.min(axis=0), poly.max(axis=0)
+        idx = np.flatnonzero(np.all((xy >= lo) & (xy <= hi), axis=1) & ~inside)
+        if len(idx):
+            inside[idx] = _points_in_polygon(xy[idx], poly)
+    return inside
+
+
+@dataclass(frozen=True)
+class PanelRegion:
+    """Panel outline plus keep-out zones for placing pattern features.
+
+    Distances are in the panel's XY plane. `edge_margin` is the material left
+    between a feature and the outline or an inner opening (default: the
+    minimum printable wall); `clearance` is the gap kept from keep-outs.
+    """
+
+    outline: Polygon
+    openings: Tuple[Polygon, ...] = ()
+    keepout_polygons: Tuple[Polygon, ...] = ()
+    keepout_circles: np.ndarray = field(default_factory=lambda: np.zeros((0, 3)))
+    edge_margin: float = field(default_factory=min_printable_wall_mm)
+    clearance: float = 0.0
+
+    @classmethod
+    def rect(cls, length: float, width: float, **kwargs) -> "PanelRegion":
+        """Centered length × width rectangular panel."""
+
+        return cls(_rect_polygon((-length / 2.0, -width / 2.0, length / 2.0, width / 2.0)), **kwargs)
+
+    @classmethod
+    def from_polygon(cls, outline: Sequence[Sequence[float]], **kwargs) -> "PanelRegion":
+        return cls(_polygon(outline), **kwargs)
+
+    @classmethod
+    def from_shape(cls, panel: ShapeLike, z: Optional[float] = None, **kwargs) -> "PanelRegion":
+        """Outline from an XY section of a panel solid; its existing openings become inner edges."""
+
+        polys = _footprint(panel, z)
+        if not polys:
+            raise ValueError("panel has no material at the section height")
+        outer, holes = max(polys, key=lambda ph: abs(_signed_area(ph[0])))
+        return cls(outer, tuple(holes), **kwargs)
+
+    def with_keepouts(
+        self,
+        circles: Iterable[Tuple[float, float, float]] = (),
+        rects: Iterable[Region] = (),
+        polygons: Iterable[Sequence[Sequence[float]]] = (),
+        shapes: Iterable[ShapeLike] = (),
+        z: Optional[float] = None,
+    ) -> "PanelRegion":
+        """Add keep-outs: circles (cx, cy, r), rects, polygons, or solids (standoffs, bosses, connector cutouts) by XY footprint."""
+
+        polys = list(self.keepout_polygons)
+        polys.extend(_rect_polygon(r) for r in rects)
+        polys.extend(_polygon(p) for p in polygons)
+        for s in shapes:
+            polys.extend(outer for outer, _ in _footprint(s, z))
+        circ = np.vstack([self.keepout_circles, np.asarray(list(circles), dtype=float).reshape(-1, 3)])
+        return PanelRegion(self.outline, self.openings, tuple(polys), circ, self.edge_margin, self.clearance)
+
+    def mask(self, points: PointsLike, feature_radius: float = 0.0) -> np.ndarray:
+        """True for points where a feature of `feature_radius` fits.
+
+        The feature must lie inside the outline with `edge_margin` to the
+        outline and openings, and keep `clearance` from every keep-out.
+        """
+
+        xy = as_points(points)[:, :2]
+        edge = feature_radius + self.edge_margin
+        keep = _inside_any(xy, [self.outline]) & ~_inside_any(xy, self.openings)
+        idx = np.flatnonzero(keep)
+        # Cheap tests first; distance tests only run on the survivors
+        if len(self.keepout_circles) and len(idx):
+            c = self.keepout_circles
+            d2 = np.sum((xy[idx, None, :] - c[None, :, :2]) ** 2, axis=2)
+            idx = idx[np.all(d2 >= (c[None, :, 2] + feature_radius + self.clearance) ** 2, axis=1)]
+        if self.keepout_polygons and len(idx):
+            idx = idx[~_inside_any(xy[idx], self.keepout_polygons)]
+            idx = idx[~_near_edges(xy[idx], self.keepout_polygons, feature_radius + self.clearance)]
+        if len(idx):
+            idx = idx[~_near_edges(xy[idx], [self.outline, *self.openings], edge)]
+        out = np.zeros(len(xy), dtype=bool)
+        out[idx] = True
+        return out
+
+    def filter(self, points: PointsLike, feature_radius: float = 0.0) -> np.ndarray:
+        """Only the valid positions, as an (N,3) array."""
+
+        pts = as_points(points)
+        return pts[self.mask(pts, feature_radius)]
+
+    def bounds(self) -> Region:
+        """Outline bounding box shrunk by the edge margin, for sizing candidate grids."""
+
+        lo, hi = self.outline.min(axis=0) + self.edge_margin, self.outline.max(axis=0) - self.edge_margin
+        return (float(lo[0]), float(lo[1]), float(hi[0]), float(hi[1]))
+
+
+def valid_positions(
+    candidates: PointsLike,
+    outline: Union[Sequence[Sequence[float]], ShapeLike, PanelRegion],
+    feature_radius: float = 0.0,
+    circles: Iterable[Tuple[float, float, float]] = (),
+    rects: Iterable[Region] = (),
+    polygons: Iterable[Sequence[Sequence[float]]] = (),
+    shapes: Iterable[ShapeLike] = (),
+    edge_margin: Optional[float] = None,
+    clearance: Optional[float] = None,
+) -> np.ndarray:
+    """Candidate positions where a feature of `feature_radius` fits the panel and misses every keep-out.
+
+    `outline` is a polygon, a panel solid (sectioned at mid-height) or a
+    `PanelRegion`. Keep-outs are as in `PanelRegion.with_keepouts`.
+    `edge_margin` defaults to `min_printable_wall_mm()`, `clearance` to 0.
+    """
+
+    if isinstance(outline, PanelRegion):
+        region = outline
+    elif isinstance(outline, (cq.Workplane, cq.Shape)):
+        region = PanelRegion.from_shape(outline)
+    else:
+        region = PanelRegion.from_polygon(outline)
+    if edge_margin is not None:
+        region = replace(region, edge_margin=edge_margin)
+    if clearance is not None:
+        region = replace(region, clearance=clearance)
+    return region.with_keepouts(circles, rects, polygons, shapes).filter(candidates, feature_radius)
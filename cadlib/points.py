@@ -0,0 +1,218 @@
+from math import ceil, sqrt
+from typing import Iterable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import cadquery as cq
+
+from .sections import _points_in_polygon
+
+
+PointsLike = Union[np.ndarray, Iterable[Sequence[float]]]
+Region = Tuple[float, float, float, float]  # (xmin, ymin, xmax, ymax)
+
+_GOLDEN_ANGLE = np.pi * (3.0 - sqrt(5.0))
+
+
+def as_points(points: PointsLike) -> np.ndarray:
+    """Coerce (x, y) or (x, y, z) points (list, tuple or array) to a float (N,3) array; z defaults to 0."""
+
+    arr = np.asarray(points if isinstance(points, np.ndarray) else list(points), dtype=float)
+    if arr.size == 0:
+        return np.zeros((0, 3))
+    if arr.ndim != 2 or arr.shape[1] not in (2, 3):
+        raise ValueError(f"points must have shape (N, 2) or (N, 3), got {arr.shape}")
+    if arr.shape[1] == 2:
+        arr = np.column_stack([arr, np.zeros(len(arr))])
+    return arr
+
+
+def _with_origin(xy: np.ndarray, origin: Sequence[float]) -> np.ndarray:
+    ox, oy, oz = (tuple(float(c) for c in origin) + (0.0,))[:3]
+    out = np.empty((len(xy), 3))
+    out[:, 0] = xy[:, 0] + ox
+    out[:, 1] = xy[:, 1] + oy
+    out[:, 2] = oz
+    return out
+
+
+def bolt_circle_points(
+    n: int,
+    radius: float,
+    start_angle_deg: float = 0.0,
+    arc_span_deg: float = 360.0,
+    origin: Sequence[float] = (0, 0, 0),
+) -> np.ndarray:
+    """n points on a circle (or an arc of `arc_span_deg`, ends included)."""
+
+    if n <= 0:
+        return np.zeros((0, 3))
+    step = arc_span_deg / max(n - 1, 1) if arc_span_deg < 360.0 else 360.0 / n
+    ang = np.radians(start_angle_deg + step * np.arange(n))
+    return _with_origin(radius * np.column_stack([np.cos(ang), np.sin(ang)]), origin)
+
+
+def rect_grid_points(nx: int, ny: int, dx: float, dy: float, centered: bool = True, origin: Sequence[float] = (0, 0, 0)) -> np.ndarray:
+    """nx × ny grid spaced dx, dy, ordered like `grid_array` (Y varies fastest)."""
+
+    x = np.arange(nx) * dx - ((nx - 1) * dx / 2.0 if centered else 0.0)
+    y = np.arange(ny) * dy - ((ny - 1) * dy / 2.0 if centered else 0.0)
+    gx, gy = np.meshgrid(x, y, indexing="ij")
+    return _with_origin(np.column_stack([gx.ravel(), gy.ravel()]), origin)
+
+
+def staggered_grid_points(
+    nx: int, ny: int, dx: float, dy: float, offset: float = 0.5, centered: bool = True, origin: Sequence[float] = (0, 0, 0)
+) -> np.ndarray:
+    """Grid whose odd rows (along Y) are shifted by `offset`·dx in X; row-major order."""
+
+    x = np.arange(nx) * dx
+    y = np.arange(ny) * dy
+    gy, gx = np.meshgrid(y, x, indexing="ij")
+    gx = gx + (np.arange(ny)[:, None] % 2) * offset * dx
+    xy = np.column_stack([gx.ravel(), gy.ravel()])
+    if centered and len(xy):
+        xy -= (xy.min(axis=0) + xy.max(axis=0)) / 2.0
+    return _with_origin(xy, origin)
+
+
+def hex_grid_points(region: Region, pitch: float, margin: float = 0.0, z: float = 0.0) -> np.ndarray:
+    """Hexagonal (honeycomb) lattice with nearest-neighbour spacing `pitch`, centered in `region`.
+
+    Points lie at least `margin` inside the region; rows are pitch·√3/2 apart
+    and odd rows are shifted by half a pitch.
+    """
+
+    if pitch <= 0:
+        raise ValueError("pitch must be positive")
+    xmin, ymin, xmax, ymax = region[0] + margin, region[1] + margin, region[2] - margin, region[3] - margin
+    w, h = xmax - xmin, ymax - ymin
+    if w < 0 or h < 0:
+        return np.zeros((0, 3))
+    row = pitch * sqrt(3.0) / 2.0
+    ny, nx = int(h // row) + 1, int(w // pitch) + 1
+    j, i = np.divmod(np.arange(ny * nx), nx)
+    xy = np.column_stack([i * pitch + (j % 2) * pitch / 2.0, j * row])
+    xy = xy[xy[:, 0] <= w + 1e-9]
+    xy += np.array([xmin, ymin]) + (np.array([w, h]) - xy.max(axis=0)) / 2.0
+    return _with_origin(xy, (0.0, 0.0, z))
+
+
+def spiral_points(n: int, radius: float, origin: Sequence[float] = (0, 0, 0)) -> np.ndarray:
+    """n points evenly filling a disc of `radius` along a golden-angle (sunflower) spiral."""
+
+    if n <= 0:
+        return np.zeros((0, 3))
+    i = np.arange(n)
+    r = radius * np.sqrt((i + 0.5) / n)
+    ang = i * _GOLDEN_ANGLE
+    return _with_origin(np.column_stack([r * np.cos(ang), r * np.sin(ang)]), origin)
+
+
+def poisson_disk_points(region: Region, min_distance: float, seed: Optional[int] = None, k: int = 30, z: float = 0.0) -> np.ndarray:
+    """Random fill of `region` with no two points closer than `min_distance` (Bridson's algorithm).
+
+    Candidates around each active point are generated and tested as arrays
+    against a background grid of cell size min_distance/√2.
+    """
+
+    if min_distance <= 0:
+        raise ValueError("min_distance must be positive")
+    xmin, ymin, xmax, ymax = region
+    w, h = xmax - xmin, ymax - ymin
+    if w < 0 or h < 0:
+        return np.zeros((0, 3))
+    rng = np.random.default_rng(seed)
+    cell = min_distance / sqrt(2.0)
+    gw, gh = int(ceil(w / cell)) + 1, int(ceil(h / cell)) + 1
+    # Background grid padded by 2 cells per side; each cell holds at most one point
+    grid = np.full((gw + 4, gh + 4), -1, dtype=np.int64)
+    pts = np.empty((gw * gh, 2))
+    pts[0] = rng.uniform((0.0, 0.0), (w, h))
+    grid[tuple((pts[0] / cell).astype(np.int64) + 2)] = 0
+    count, active = 1, [0]
+    offsets = np.array([(i, j) for i in range(-2, 3) for j in range(-2, 3)])
+    d2 = min_distance * min_distance
+    while active:
+        slot = int(rng.integers(len(active)))
+        r = min_distance * np.sqrt(rng.uniform(1.0, 4.0, k))
+        ang = rng.uniform(0.0, 2 * np.pi, k)
+        cand = pts[active[slot]] + np.column_stack([r * np.cos(ang), r * np.sin(ang)])
+        cand = cand[(cand[:, 0] >= 0) & (cand[:, 0] <= w) & (cand[:, 1] >= 0) & (cand[:, 1] <= h)]
+        # Test all candidates against their 5×5 grid neighbourhoods at once
+        cells = (cand / cell).astype(np.int64) + 2
+        near = grid[cells[:, :1] + offsets[:, 0], cells[:, 1:] + offsets[:, 1]]
+        dist2 = np.sum((pts[np.maximum(near, 0)] - cand[:, None, :]) ** 2, axis=2)
+        ok = np.flatnonzero(np.all((near < 0) | (dist2 >= d2), axis=1))
+        if len(ok):
+            pts[count] = cand[ok[0]]
+            grid[tuple(cells[ok[0]])] = count
+            active.append(count)
+            count += 1
+        else:
+            active[slot] = active[-1]
+            active.pop()
+    return _with_origin(pts[:count] + np.array([xmin, ymin]), (0.0, 0.0, z))
+
+
+def keepout_mask(
+    points: PointsLike,
+    circles: Iterable[Tuple[float, float, float]] = (),
+    rects: Iterable[Region] = (),
+    polygons: Iterable[Sequence[Sequence[float]]] = (),
+    clearance: float = 0.0,
+) -> np.ndarray:
+    """Boolean mask of points outside every keep-out zone (grown by `clearance`).
+
+    Zones are XY circles (cx, cy, r), rectangles (xmin, ymin, xmax, ymax) and
+    closed polygons [(x, y), ...]; polygons are not grown by the clearance.
+    """
+
+    pts = as_points(points)
+    xy = pts[:, :2]
+    keep = np.ones(len(pts), dtype=bool)
+    circles = np.asarray(list(circles), dtype=float).reshape(-1, 3)
+    if len(circles):
+        d2 = np.sum((xy[:, None, :] - circles[None, :, :2]) ** 2, axis=2)
+        keep &= ~np.any(d2 < (circles[None, :, 2] + clearance) ** 2, axis=1)
+    rects = np.asarray(list(rects), dtype=float).reshape(-1, 4)
+    if len(rects):
+        lo, hi = rects[None, :, :2] - clearance, rects[None, :, 2:] + clearance
+        keep &= ~np.any(np.all((xy[:, None, :] > lo) & (xy[:, None, :] < hi), axis=2), axis=1)
+    for poly in polygons:
+        keep &= ~_points_in_polygon(xy, np.asarray(poly, dtype=float)[:, :2])
+    return keep
+
+
+def filter_keepouts(
+    points: PointsLike,
+    circles: Iterable[Tuple[float, float, float]] = (),
+    rects: Iterable[Region] = (),
+    polygons: Iterable[Sequence[Sequence[float]]] = (),
+    clearance: float = 0.0,
+) -> np.ndarray:
+    """Points outside every keep-out zone; see `keepout_mask`."""
+
+    pts = as_points(points)
+    return pts[keepout_mask(pts, circles, rects, polygons, clearance)]
+
+
+def transform_points(
+    points: PointsLike,
+    translate: Sequence[float] = (0, 0, 0),
+    rotate_deg: float = 0.0,
+    scale: float = 1.0,
+    location: Optional[cq.Location] = None,
+) -> np.ndarray:
+    """Scale, rotate about Z, then translate all points at once; `location` is applied last."""
+
+    pts = as_points(points) * scale
+    if rotate_deg:
+        a = np.radians(rotate_deg)
+        c, s = np.cos(a), np.sin(a)
+        pts = pts @ np.array([[c, s, 0.0], [-s, c, 0.0], [0.0, 0.0, 1.0]])
+    pts = pts + np.asarray((tuple(translate) + (0.0,))[:3], dtype=float)
+    if location is not None:
+        t = location.wrapped.Transformation()
+        m = np.array([[t.Value(i, j) for j in range(1, 5)] for i in range(1, 4)])
+        pts = pts @ m[:, :3].T + m[:, 3]
+    return pts
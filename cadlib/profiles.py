@@ -0,0 +1,85 @@
+from typing import List, Sequence, Tuple
+
+import cadquery as cq
+
+
+RZ = Tuple[float, float]  # (radius, height) in the half-plane of revolution
+
+_EPS = 1e-9
+
+
+def _collinear(a: RZ, b: RZ, c: RZ) -> bool:
+    return abs((b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0])) <= _EPS
+
+
+def _clean(points: Sequence[RZ]) -> List[RZ]:
+    """Drop repeated points and points in the middle of straight runs, so each segment becomes one face."""
+
+    out: List[RZ] = []
+    for p in points:
+        p = (float(p[0]), float(p[1]))
+        if not out or abs(p[0] - out[-1][0]) > _EPS or abs(p[1] - out[-1][1]) > _EPS:
+            out.append(p)
+    if len(out) > 1 and abs(out[0][0] - out[-1][0]) <= _EPS and abs(out[0][1] - out[-1][1]) <= _EPS:
+        out.pop()
+    changed = True
+    while changed and len(out) > 3:
+        changed = False
+        for i in range(len(out)):
+            if _collinear(out[i - 1], out[i], out[(i + 1) % len(out)]):
+                del out[i]
+                changed = True
+                break
+    return out
+
+
+def _wire(points: Sequence[RZ]) -> cq.Wire:
+    pts = _clean(points)
+    if len(pts) < 3:
+        raise ValueError("a profile needs at least three distinct points")
+    if min(r for r, _ in pts) < -_EPS:
+        raise ValueError("profile radii must be >= 0")
+    return cq.Wire.makePolygon([cq.Vector(r, 0.0, z) for r, z in pts], close=True)
+
+
+def ring(inner_radius: float, outer_radius: float, z0: float, z1: float) -> List[RZ]:
+    """Rectangular profile of a ring (or a disk when `inner_radius` is 0) from z0 to z1."""
+
+    return [(inner_radius, z0), (outer_radius, z0), (outer_radius, z1), (inner_radius, z1)]
+
+
+def bored(wall: Sequence[RZ], bore_radius: float, bore_z0: float, bore_z1: float) -> Tuple[List[RZ], List[List[RZ]]]:
+    """(outline, voids) of a body with outer `wall` and a central bore.
+
+    `wall` runs up the outside from the bottom to the top; grooves and
+    chamfers are points on it. The bore spans bore_z0..bore_z1 (clipped to
+    the body). It opens through either end it reaches, and a bore reaching
+    neither end is an enclosed cavity. A zero radius or empty range means no
+    bore.
+    """
+
+    bottom, top = wall[0][1], wall[-1][1]
+    z0, z1 = max(bore_z0, bottom), min(bore_z1, top)
+    if bore_radius <= 0 or z1 <= z0:
+        return [(0.0, bottom), *wall, (0.0, top)], []
+    at_bottom, at_top = z0 <= bottom, z1 >= top
+    if at_bottom and at_top:
+        return [(bore_radius, bottom), *wall, (bore_radius, top)], []
+    if at_top:
+        return [(0.0, bottom), *wall, (bore_radius, top), (bore_radius, z0), (0.0, z0)], []
+    if at_bottom:
+        return [(bore_radius, bottom), *wall, (0.0, top), (0.0, z1), (bore_radius, z1)], []
+    return [(0.0, bottom), *wall, (0.0, top)], [ring(0.0, bore_radius, z0, z1)]
+
+
+def revolve_profile(outline: Sequence[RZ], voids: Sequence[Sequence[RZ]] = ()) -> cq.Solid:
+    """Revolve a closed (r, z) outline a full turn about Z into one solid.
+
+    Points go around the outline in either direction. Segments on the axis
+    (r = 0) close the solid there. `voids` are closed outlines inside it and
+    become enclosed cavities. Steps, grooves, chamfers and counterbores are
+    just more points, so an axisymmetric part needs no booleans, and every
+    straight segment becomes a single face.
+    """
+
+    return cq.Solid.revolve(_wire(outline), [_wire(v) for v in voids], 360.0, cq.Vector(0, 0, 0), cq.Vector(0, 0, 1))
@@ -1,6 +1,10 @@
 import cadquery as cq
+from .cache import cached
+from .modes import is_preview
+from .profiles import revolve_profile, ring
 
 
+@cached
 def o_ring_gland_face(diameter: float, cross_section: float, squeeze: float = 0.15, groove_depth_factor: float = 0.85) -> cq.Workplane:
     """Create a circular face-seal O-ring gland pocket as a solid to cut.
 
@@ -8,20 +12,21 @@ def o_ring_gland_face(diameter: float, cross_section: float, squeeze: float = 0.
     - cross_section: cord diameter
     - squeeze: target compression ratio (0.1–0.3)
     - groove_depth_factor: fraction of cross_section used as groove depth
-    Returns a thin ring extruded by groove depth.
+    Returns a thin ring of groove depth, revolved from its section.
     """
 
     groove_depth = cross_section * groove_depth_factor
     inner = diameter - cross_section * (1 - squeeze)
     outer = diameter + cross_section * (1 - squeeze)
-    wp = cq.Workplane("XY").circle(outer / 2.0).circle(inner / 2.0)
-    return wp.extrude(groove_depth)
+    return cq.Workplane("XY").newObject([revolve_profile(ring(inner / 2.0, outer / 2.0, 0.0, groove_depth))])
 
 
+@cached
 def gasket_channel_rect(length: float, width: float, channel_width: float, depth: float, corner_radius: float = 1.0) -> cq.Workplane:
     """Create a rectangular gasket channel solid to cut.
 
     Channel path follows a rounded rectangle; width and depth parametrize the cut.
+    Corners stay sharp in preview mode.
     """
 
     # Build ring by extruding an outer rectangle and subtracting an inner rectangle
@@ -29,7 +34,7 @@ def gasket_channel_rect(length: float, width: float, channel_width: float, depth
     inner = cq.Workplane("XY").rect(length - 2 * channel_width, width - 2 * channel_width).extrude(depth + 1e-6)
     ring = outer.cut(inner)
     # Optional corner softening on vertical edges if requested
-    if corner_radius > 0:
+    if corner_radius > 0 and not is_preview():
         try:
             ring = ring.edges("|Z").fillet(min(corner_radius, channel_width * 0.9))
         except Exception:
@@ -0,0 +1,315 @@
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import cadquery as cq
+from OCP.BRepAdaptor import BRepAdaptor_Curve
+from OCP.BRepTools import BRepTools_WireExplorer
+from OCP.GCPnts import GCPnts_QuasiUniformDeflection
+from OCP.TopAbs import TopAbs_REVERSED
+
+
+Shapeish = Union[cq.Workplane, cq.Shape]
+
+
+@dataclass(frozen=True)
+class SectionLoop:
+    """Closed polyline of a section, in plane-local (u, v) coordinates.
+
+    Outer boundaries are counter-clockwise, holes clockwise.
+    """
+
+    points: np.ndarray
+    is_hole: bool = False
+
+    @property
+    def area(self) -> float:
+        """Unsigned polygon area in mm²."""
+
+        return abs(_signed_area(self.points))
+
+    @property
+    def perimeter(self) -> float:
+        closed = np.vstack([self.points, self.points[:1]])
+        return float(np.linalg.norm(np.diff(closed, axis=0), axis=1).sum())
+
+
+@dataclass(frozen=True)
+class Section:
+    """Planar section of a part: loops plus plane frame and measures.
+
+    `area` is the material area (outer loops minus holes); `perimeter` sums every loop.
+    """
+
+    origin: Tuple[float, float, float]
+    normal: Tuple[float, float, float]
+    x_dir: Tuple[float, float, float]
+    loops: List[SectionLoop] = field(default_factory=list)
+    area: float = 0.0
+    perimeter: float = 0.0
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.loops
+
+    def polygons(self) -> List[Tuple[np.ndarray, List[np.ndarray]]]:
+        """Group loops as (outer, [holes]) polygons by containment."""
+
+        outers = [lp for lp in self.loops if not lp.is_hole]
+        holes = [lp for lp in self.loops if lp.is_hole]
+        result = [(o.points, []) for o in outers]
+        for h in holes:
+            for idx, o in enumerate(outers):
+                if _points_in_polygon(h.points[:1], o.points)[0]:
+                    result[idx][1].append(h.points)
+                    break
+        return result
+
+    def to_world(self, points_uv: np.ndarray) -> np.ndarray:
+        """Map plane-local (N,2) points back to world XYZ."""
+
+        o, x, y, _ = _frame(self.origin, self.normal, self.x_dir)
+        pts = np.asarray(points_uv, dtype=float)
+        return o + pts[:, :1] * x + pts[:, 1:2] * y
+
+
+def _to_shape(shape: Shapeish) -> cq.Shape:
+    if isinstance(shape, cq.Workplane):
+        vals = [v for v in shape.vals() if isinstance(v, cq.Shape)]
+        if not vals:
+            raise ValueError("Workplane holds no shapes to section")
+        return vals[0] if len(vals) == 1 else cq.Compound.makeCompound(vals)
+    return shape
+
+
+def _frame(origin, normal, x_dir=None):
+    plane = cq.Plane(origin=origin, xDir=x_dir, normal=normal)
+    o = np.array(plane.origin.toTuple())
+    return o, np.array(plane.xDir.toTuple()), np.array(plane.yDir.toTuple()), np.array(plane.zDir.toTuple())
+
+
+def _signed_area(points: np.ndarray) -> float:
+    x, y = points[:, 0], points[:, 1]
+    return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+
+
+def _points_in_polygon(points: np.ndarray, polygon: np.ndarray) -> np.ndarray:
+    """Even-odd ray casting for (N,2) points against one (M,2) polygon."""
+
+    px = points[:, 0:1]
+    py = points[:, 1:2]
+    x1, y1 = polygon[:, 0], polygon[:, 1]
+    x2, y2 = np.roll(x1, -1), np.roll(y1, -1)
+    straddles = (y1 > py) != (y2 > py)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_cross = x1 + (py - y1) * (x2 - x1) / (y2 - y1)
+    hits = straddles & (px < x_cross)
+    return (hits.sum(axis=1) % 2) == 1
+
+
+def _orient(points: np.ndarray, is_hole: bool) -> np.ndarray:
+    ccw = _signed_area(points) > 0
+    return points[::-1].copy() if ccw == is_hole else points
+
+
+def _wire_points(wire: cq.Wire, deflection: float) -> np.ndarray:
+    pts: List[Tuple[float, float, float]] = []
+    explorer = BRepTools_WireExplorer(wire.wrapped)
+    while explorer.More():
+        edge = explorer.Current()
+        adaptor = BRepAdaptor_Curve(edge)
+        disc = GCPnts_QuasiUniformDeflection(adaptor, deflection)
+        edge_pts = [disc.Value(i + 1) for i in range(disc.NbPoints())]
+        if edge.Orientation() == TopAbs_REVERSED:
+            edge_pts.reverse()
+        # Drop the last point; it is the first point of the next edge
+        pts.extend((p.X(), p.Y(), p.Z()) for p in edge_pts[:-1])
+        explorer.Next()
+    return np.array(pts, dtype=float).reshape(-1, 3)
+
+
+def _section_brep(shape: cq.Shape, origin, normal, x_dir, tolerance: float) -> Section:
+    o, x, y, n = _frame(origin, normal, x_dir)
+    cutter = cq.Face.makePlane(basePnt=cq.Vector(*o), dir=cq.Vector(*n))
+    result = shape.intersect(cutter)
+
+    loops: List[SectionLoop] = []
+    area = 0.0
+    perimeter = 0.0
+    for face in result.Faces():
+        area += face.Area()
+        wires = [(face.outerWire(), False)] + [(w, True) for w in face.innerWires()]
+        for wire, is_hole in wires:
+            perimeter += wire.Length()
+            xyz = _wire_points(wire, tolerance)
+            if len(xyz) < 3:
+                continue
+            rel = xyz - o
+            uv = np.column_stack([rel @ x, rel @ y])
+            loops.append(SectionLoop(_orient(uv, is_hole), is_hole))
+    return Section(tuple(o), tuple(n), tuple(x), loops, float(area), float(perimeter))
+
+
+def _weld_mesh(shape: cq.Shape, tolerance: float, angular_tolerance: float = 0.1) -> Tuple[np.ndarray, np.ndarray]:
+    verts, tris = shape.tessellate(tolerance, angular_tolerance)
+    v = np.array([p.toTuple() for p in verts], dtype=float).reshape(-1, 3)
+    t = np.array(tris, dtype=np.int64).reshape(-1, 3)
+    # Tessellation duplicates vertices per face; merge coincident ones so edges are shared
+    keys = np.round(v / 1e-6).astype(np.int64)
+    _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    return v[first], inverse.reshape(-1)[t]
+
+
+def _section_mesh(verts: np.ndarray, tris: np.ndarray, origin, normal, x_dir) -> Section:
+    o, x, y, n = _frame(origin, normal, x_dir)
+    d = (verts - o) @ n
+    above = d >= 0.0
+    tri_above = above[tris]
+    count = tri_above.sum(axis=1)
+    crossing = tris[(count == 1) | (count == 2)]
+    if len(crossing) == 0:
+        return Section(tuple(o), tuple(n), tuple(x))
+
+    # Each crossing triangle has exactly two edges whose endpoints straddle the plane
+    edges = np.stack([crossing[:, [0, 1]], crossing[:, [1, 2]], crossing[:, [2, 0]]], axis=1)
+    straddle = above[edges[..., 0]] != above[edges[..., 1]]
+    seg_edges = edges[straddle].reshape(-1, 2, 2)
+    seg_edges = np.sort(seg_edges, axis=2)
+
+    # Intersection point per unique mesh edge so neighbouring segments share endpoints exactly
+    flat = seg_edges.reshape(-1, 2)
+    uniq, inv = np.unique(flat, axis=0, return_inverse=True)
+    inv = inv.reshape(-1)
+    da, db = d[uniq[:, 0]], d[uniq[:, 1]]
+    t = (da / (da - db))[:, None]
+    pts = verts[uniq[:, 0]] + t * (verts[uniq[:, 1]] - verts[uniq[:, 0]])
+    rel = pts - o
+    uv = np.column_stack([rel @ x, rel @ y])
+    segs = inv.reshape(-1, 2)
+
+    # Chain segments into loops through their shared edge ids
+    adjacency: dict = {}
+    for a, b in segs.tolist():
+        adjacency.setdefault(a, []).append(b)
+        adjacency.setdefault(b, []).append(a)
+    visited = set()
+    raw_loops: List[np.ndarray] = []
+    for start in adjacency:
+        if start in visited:
+            continue
+        chain = [start]
+        visited.add(start)
+        prev, cur = None, start
+        while True:
+            nxt = [p for p in adjacency[cur] if p != prev and p not in visited]
+            if not nxt:
+                break
+            prev, cur = cur, nxt[0]
+            visited.add(cur)
+            chain.append(cur)
+        if len(chain) >= 3:
+            raw_loops.append(uv[chain])
+
+    loops: List[SectionLoop] = []
+    for idx, lp in enumerate(raw_loops):
+        depth = sum(
+            bool(_points_in_polygon(lp[:1], other)[0]) for j, other in enumerate(raw_loops) if j != idx
+        )
+        is_hole = depth % 2 == 1
+        loops.append(SectionLoop(_orient(lp, is_hole), is_hole))
+    area = sum(-lp.area if lp.is_hole else lp.area for lp in loops)
+    perimeter = sum(lp.perimeter for lp in loops)
+    return Section(tuple(o), tuple(n), tuple(x), loops, float(area), float(perimeter))
+
+
+def section(
+    shape: Shapeish,
+    z: float = 0.0,
+    plane: Optional[cq.Plane] = None,
+    method: str = "brep",
+    tolerance: float = 0.05,
+) -> Section:
+    """Section `shape` with a plane and return its outline loops, area and perimeter.
+
+    By default the plane is XY at height `z`; pass `plane` for any orientation.
+    `method="brep"` intersects the exact geometry; `method="mesh"` slices a tessellation.
+    """
+
+    if plane is not None:
+        origin, normal, x_dir = plane.origin.toTuple(), plane.zDir.toTuple(), plane.xDir.toTuple()
+    else:
+        origin, normal, x_dir = (0.0, 0.0, float(z)), (0.0, 0.0, 1.0), (1.0, 0.0, 0.0)
+    solid = _to_shape(shape)
+    if method == "brep":
+        return _section_brep(solid, origin, normal, x_dir, tolerance)
+    if method == "mesh":
+        verts, tris = _weld_mesh(solid, tolerance)
+        return _section_mesh(verts, tris, origin, normal, x_dir)
+    raise ValueError("method must be 'brep' or 'mesh'")
+
+
+def slice_heights(
+    shape: Shapeish,
+    heights: Iterable[float],
+    method: str = "mesh",
+    tolerance: float = 0.05,
+) -> List[Section]:
+    """Section `shape` with XY planes at each height in one call.
+
+    The mesh method tessellates once and reuses it for every height.
+    """
+
+    zs = [float(h) for h in heights]
+    solid = _to_shape(shape)
+    if method == "mesh":
+        verts, tris = _weld_mesh(solid, tolerance)
+        return [_section_mesh(verts, tris, (0.0, 0.0, z), (0.0, 0.0, 1.0), (1.0, 0.0, 0.0)) for z in zs]
+    return [section(solid, z=z, method=method, tolerance=tolerance) for z in zs]
+
+
+def sections_to_svg(
+    sections: Union[Section, Sequence[Section]],
+    path: Optional[str] = None,
+    stroke_width: float = 0.2,
+    margin: float = 2.0,
+) -> str:
+    """Render sections as SVG paths in plane-local mm (Y flipped to SVG down).
+
+    Each section becomes one `<path>` with even-odd fill so holes stay open.
+    Writes to `path` when given and always returns the SVG text.
+    """
+
+    secs = [sections] if isinstance(sections, Section) else list(sections)
+    all_pts = [lp.points for s in secs for lp in s.loops]
+    if all_pts:
+        stacked = np.vstack(all_pts)
+        umin, vmin = stacked.min(axis=0) - margin
+        umax, vmax = stacked.max(axis=0) + margin
+    else:
+        umin = vmin = -margin
+        umax = vmax = margin
+    width, height = umax - umin, vmax - vmin
+
+    paths = []
+    for idx, s in enumerate(secs):
+        cmds = []
+        for lp in s.loops:
+            coords = " L ".join(f"{u - umin:.4f} {vmax - v:.4f}" for u, v in lp.points)
+            cmds.append(f"M {coords} Z")
+        paths.append(
+            f'  <path id="section-{idx}" d="{" ".join(cmds)}" fill="none" fill-rule="evenodd" '
+            f'stroke="black" stroke-width="{stroke_width}"/>'
+        )
+    svg = "\n".join(
+        [
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:.4f}mm" height="{height:.4f}mm" '
+            f'viewBox="0 0 {width:.4f} {height:.4f}">',
+            *paths,
+            "</svg>",
+            "",
+        ]
+    )
+    if path is not None:
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write(svg)
+    return svg
@@ -0,0 +1,231 @@
+import json
+from typing import Any, Callable, Dict, List, Literal, Mapping, Optional, Tuple, Type, Union
+
+import numpy as np
+import cadquery as cq
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, create_model
+from typing_extensions import Annotated
+
+from .cache import cached
+from .connectors import cutout_dc_barrel, cutout_rj45, cutout_usb_c
+from .csg import Cut, Fuse, Leaf
+from .cylinders import tube
+from .enclosures import d_shaped_enclosure, elliptical_enclosure, rectangular_enclosure_base_and_lid
+from .fasteners import _hole_planes
+from .hole_tools import hole_tool
+from .inserts import insert_boss
+from .instances import _matrix_location
+from .pcb import pcb_pocket, pcb_standoffs
+from .points import as_points, bolt_circle_points, hex_grid_points, rect_grid_points, spiral_points, staggered_grid_points
+from .sealing import gasket_channel_rect, o_ring_gland_face
+from .validators import HoleSpec
+from .variants import _params_model
+from .vents import louvre_panel, perforated_panel, perforation_tool
+
+
+@cached
+def _box(length: float, width: float, height: float) -> cq.Workplane:
+    """Box centered on the origin in XY, standing on Z=0."""
+
+    return cq.Workplane("XY").box(length, width, height, centered=(True, True, False))
+
+
+@cached
+def _cylinder(diameter: float, height: float) -> cq.Workplane:
+    """Cylinder on the Z axis, standing on Z=0."""
+
+    return cq.Workplane("XY").circle(diameter / 2.0).extrude(height)
+
+
+# Builders a spec may name, by `feature`
+FEATURES: Dict[str, Callable[..., Any]] = {
+    "box": _box,
+    "cylinder": _cylinder,
+    "tube": tube,
+    "rectangular_enclosure_base_and_lid": rectangular_enclosure_base_and_lid,
+    "elliptical_enclosure": elliptical_enclosure,
+    "d_shaped_enclosure": d_shaped_enclosure,
+    "insert_boss": insert_boss,
+    "pcb_pocket": pcb_pocket,
+    "pcb_standoffs": pcb_standoffs,
+    "cutout_usb_c": cutout_usb_c,
+    "cutout_rj45": cutout_rj45,
+    "cutout_dc_barrel": cutout_dc_barrel,
+    "o_ring_gland_face": o_ring_gland_face,
+    "gasket_channel_rect": gasket_channel_rect,
+    "louvre_panel": louvre_panel,
+    "perforated_panel": perforated_panel,
+    "perforation_tool": perforation_tool,
+}
+
+# Point generators a spec may name, by `generator`
+POINT_GENERATORS: Dict[str, Callable[..., np.ndarray]] = {
+    "bolt_circle_points": bolt_circle_points,
+    "rect_grid_points": rect_grid_points,
+    "staggered_grid_points": staggered_grid_points,
+    "hex_grid_points": hex_grid_points,
+    "spiral_points": spiral_points,
+}
+
+_STRICT = ConfigDict(extra="forbid")
+
+
+def _camel(name: str) -> str:
+    return "".join(word.capitalize() for word in name.split("_") if word)
+
+
+def _tagged_models(registry: Mapping[str, Callable[..., Any]], tag: str, suffix: str, base: Type[BaseModel]) -> List[Type[BaseModel]]:
+    """One model per registry entry: a literal `tag` field plus the builder's parameters under `params`."""
+
+    models = []
+    for name, func in registry.items():
+        params, _ = _params_model(func)
+        required = any(f.is_required() for f in params.model_fields.values())
+        default = Field(...) if required else Field(default_factory=params)
+        models.append(
+            create_model(f"{_camel(name)}{suffix}", __base__=base, **{tag: (Literal[name], ...)}, params=(params, default))
+        )
+    return models
+
+
+class _PointsBase(BaseModel):
+    model_config = _STRICT
+
+
+_POINT_MODELS = _tagged_models(POINT_GENERATORS, "generator", "Points", _PointsBase)
+PointsSpec = Union[
+    List[Tuple[float, ...]],
+    Annotated[Union[tuple(_POINT_MODELS)], Field(discriminator="generator")],  # type: ignore[misc]
+]
+
+
+class HolesSpec(BaseModel):
+    """Screw holes bored along -Z of the face picked by `face`, offset by each point."""
+
+    model_config = _STRICT
+
+    spec: HoleSpec
+    points: PointsSpec
+    face: str = ">Z"
+
+
+class _FeatureBase(BaseModel):
+    """Placement and booleans shared by every feature.
+
+    `add`, `cut` and `holes` act in the feature's own frame before it is
+    rotated (degrees about X, then Y, then Z), moved to `at` and copied to
+    every point of `points`.
+    """
+
+    model_config = _STRICT
+
+    solid: Optional[int] = Field(None, description="keep only this solid of the result, e.g. 0 for an enclosure base")
+    add: List["Feature"] = Field(default_factory=list)
+    cut: List["Feature"] = Field(default_factory=list)
+    holes: List[HolesSpec] = Field(default_factory=list)
+    rotate: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+    at: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+    points: Optional[PointsSpec] = None
+
+
+_FEATURE_MODELS = _tagged_models(FEATURES, "feature", "Feature", _FeatureBase)
+Feature = Annotated[Union[tuple(_FEATURE_MODELS)], Field(discriminator="feature")]  # type: ignore[misc]
+for _model in (_FeatureBase, *_FEATURE_MODELS):
+    _model.model_rebuild()
+_FEATURE_ADAPTER: TypeAdapter = TypeAdapter(Feature)
+
+
+class PartSpec(BaseModel):
+    """Declarative parts: each named output is a feature tree built in-process."""
+
+    model_config = _STRICT
+
+    parts: Dict[str, Feature]
+
+
+def spec_schema() -> Dict[str, Any]:
+    """JSON schema of `PartSpec`, e.g. for LLM structured output."""
+
+    return PartSpec.model_json_schema()
+
+
+def _points(points: PointsSpec) -> np.ndarray:
+    if isinstance(points, BaseModel):
+        return as_points(POINT_GENERATORS[points.generator](**dict(points.params)))
+    return as_points(points)
+
+
+def _placement(node: BaseModel) -> np.ndarray:
+    """3×4 matrix: rotate about X, then Y, then Z (degrees), then move to `at`."""
+
+    rx, ry, rz = np.radians(node.rotate)
+    cx, sx, cy, sy, cz, sz = np.cos(rx), np.sin(rx), np.cos(ry), np.sin(ry), np.cos(rz), np.sin(rz)
+    rot_x = np.array([[1.0, 0.0, 0.0], [0.0, cx, -sx], [0.0, sx, cx]])
+    rot_y = np.array([[cy, 0.0, sy], [0.0, 1.0, 0.0], [-sy, 0.0, cy]])
+    rot_z = np.array([[cz, -sz, 0.0], [sz, cz, 0.0], [0.0, 0.0, 1.0]])
+    return np.column_stack([rot_z @ rot_y @ rot_x, node.at])
+
+
+def _placed(node: BaseModel) -> List[cq.Shape]:
+    """The feature's shape at every placement; the local build comes from the shape cache."""
+
+    local = _build_local(node.model_dump(mode="json", exclude={"rotate", "at", "points"})).val()
+    matrix = _placement(node)
+    if node.points is None:
+        offsets = np.zeros((1, 3))
+    else:
+        offsets = _points(node.points)
+    out = []
+    for offset in offsets:
+        placed = np.column_stack([matrix[:, :3], matrix[:, 3] + offset])
+        out.append(local.moved(_matrix_location(placed)))
+    return out
+
+
+@cached
+def _build_local(node: Dict[str, Any]) -> cq.Workplane:
+    """Build one feature tree in its own frame; keyed by the canonical tree, so repeats are free."""
+
+    spec = _FEATURE_ADAPTER.validate_python(node)
+    func = FEATURES[spec.feature]
+    _, takes_model = _params_model(func)
+    result = func(spec.params) if takes_model else func(**dict(spec.params))
+    solids = cq.Workplane("XY").add(result).solids().vals()
+    if spec.solid is not None:
+        if not -len(solids) <= spec.solid < len(solids):
+            raise ValueError(f"{spec.feature} has {len(solids)} solids; solid={spec.solid} is out of range")
+        solids = [solids[spec.solid]]
+    body = Fuse([Leaf(s) for s in solids] + [Leaf(s) for child in spec.add for s in _placed(child)]).evaluate()
+    tools = [Leaf(s) for child in spec.cut for s in _placed(child)]
+    if spec.holes:
+        target = cq.Workplane("XY").newObject([body])
+        for group in spec.holes:
+            tool = hole_tool(group.spec, body.BoundingBox().DiagonalLength)
+            tools.extend(Leaf(tool.moved(cq.Location(p))) for p in _hole_planes(target.faces(group.face), _points(group.points)))
+    # Cuts and holes go in one boolean
+    if tools:
+        body = Cut(Leaf(body), tools).evaluate()
+    return cq.Workplane("XY").newObject([body])
+
+
+def build_spec(spec: Union[PartSpec, Mapping[str, Any], str]) -> Dict[str, cq.Workplane]:
+    """Build every part of a spec (model, dict or JSON text) without running any Python from it.
+
+    Invalid specs raise pydantic's ValidationError naming the offending path.
+    """
+
+    if isinstance(spec, str):
+        spec = PartSpec.model_validate_json(spec)
+    elif not isinstance(spec, PartSpec):
+        spec = PartSpec.model_validate(spec)
+    parts = {}
+    for name, node in spec.parts.items():
+        shapes = _placed(node)
+        shape = shapes[0] if len(shapes) == 1 else Fuse([Leaf(s) for s in shapes]).evaluate()
+        parts[name] = cq.Workplane("XY").newObject([shape])
+    return parts
+
+
+def load_spec(path: str) -> PartSpec:
+    with open(path, "r", encoding="utf-8") as fh:
+        return PartSpec.model_validate(json.load(fh))
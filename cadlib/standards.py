@@ -1,5 +1,13 @@
 from typing import List, Tuple
-import cadquery as cq
+
+import numpy as np
+
+from .points import bolt_circle_points
+
+
+def _square_corners(half: float, origin: Tuple[float, float, float]) -> List[Tuple[float, float, float]]:
+    corners = np.array([[-1.0, -1.0, 0.0], [1.0, -1.0, 0.0], [1.0, 1.0, 0.0], [-1.0, 1.0, 0.0]]) * half + np.asarray(origin, dtype=float)
+    return [tuple(p) for p in corners.tolist()]
 
 
 def pattern_nema17(origin: Tuple[float, float, float] = (0, 0, 0)) -> List[Tuple[float, float, float]]:
@@ -8,15 +16,7 @@ def pattern_nema17(origin: Tuple[float, float, float] = (0, 0, 0)) -> List[Tuple
     Coordinates in mm, centered on shaft.
     """
 
-    pitch = 31.0
-    half = pitch / 2.0
-    ox, oy, oz = origin
-    return [
-        (ox - half, oy - half, oz),
-        (ox + half, oy - half, oz),
-        (ox + half, oy + half, oz),
-        (ox - half, oy + half, oz),
-    ]
+    return _square_corners(31.0 / 2.0, origin)
 
 
 def pattern_vesa(size_mm: int = 75, origin: Tuple[float, float, float] = (0, 0, 0)) -> List[Tuple[float, float, float]]:
@@ -27,27 +27,14 @@ def pattern_vesa(size_mm: int = 75, origin: Tuple[float, float, float] = (0, 0,
 
     if size_mm not in (75, 100):
         raise ValueError("VESA size must be 75 or 100 mm")
-    half = size_mm / 2.0
-    ox, oy, oz = origin
-    return [
-        (ox - half, oy - half, oz),
-        (ox + half, oy - half, oz),
-        (ox + half, oy + half, oz),
-        (ox - half, oy + half, oz),
-    ]
+    return _square_corners(size_mm / 2.0, origin)
 
 
 def bolt_circle(n: int, radius: float, start_angle_deg: float = 0.0, origin: Tuple[float, float, float] = (0, 0, 0)) -> List[Tuple[float, float, float]]:
-    from math import radians, cos, sin
-
-    step = 360.0 / n
-    ox, oy, oz = origin
-    pts = []
-    for i in range(n):
-        ang = radians(start_angle_deg + step * i)
-        x = ox + radius * cos(ang)
-        y = oy + radius * sin(ang)
-        pts.append((x, y, oz))
-    return pts
+    """Return n equally spaced hole locations on a circle.
 
+    For large patterns use `points.bolt_circle_points`, which returns the
+    same points as an (N,3) array.
+    """
 
+    return [tuple(p) for p in bolt_circle_points(n, radius, start_angle_deg, origin=origin).tolist()]
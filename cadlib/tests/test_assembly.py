@@ -0,0 +1,111 @@
+import json
+import struct
+
+import cadquery as cq
+import numpy as np
+import pytest
+
+import cadlib.inserts as inserts
+from cadlib import AssemblyBuilder, geometry_hash, insert_boss
+
+
+def _bbox(shape):
+    bb = shape.BoundingBox()
+    return np.array([bb.xmin, bb.ymin, bb.zmin, bb.xmax, bb.ymax, bb.zmax])
+
+
+def _glb_json(path):
+    data = open(path, "rb").read()
+    length = struct.unpack("<I", data[12:16])[0]
+    return json.loads(data[20 : 20 + length])
+
+
+def test_geometry_hash_ignores_placement_and_meshing():
+    a = cq.Workplane("XY").box(10, 6, 4).faces(">Z").workplane().hole(2).val()
+    b = cq.Workplane("XY").box(10, 6, 4).faces(">Z").workplane().hole(2).val()
+    b.tessellate(0.05)
+    assert geometry_hash(a) == geometry_hash(b)
+    assert geometry_hash(a) == geometry_hash(a.translate(cq.Vector(5, -3, 2)))
+    assert geometry_hash(a) == geometry_hash(a.moved(cq.Location((1, 2, 3))))
+    assert geometry_hash(a) != geometry_hash(a.rotate(cq.Vector(), cq.Vector(0, 0, 1), 30))
+    assert geometry_hash(a) != geometry_hash(cq.Workplane("XY").box(10, 6, 4.01).faces(">Z").workplane().hole(2))
+    # Mirror images share volume and inertia but not their extents about the centroid
+    wedge = cq.Workplane("XZ").polyline([(0, 0), (10, 0), (0, 4)]).close().extrude(3).val()
+    assert geometry_hash(wedge) != geometry_hash(wedge.mirror("YZ"))
+
+
+def test_identical_parts_share_one_shape():
+    builder = AssemblyBuilder("device")
+    builder.add(cq.Workplane("XY").box(80, 50, 2), "plate")
+    # Bosses built separately, translated, or placed by location all dedupe
+    originals = [inserts.insert_boss.__wrapped__("M3", 8.0).val().translate(cq.Vector(10 * i, 0, 2)) for i in range(3)]
+    for shape in originals:
+        builder.add(shape, "boss")
+    names = builder.add_at(insert_boss("M3", 8.0), [(-20, 15, 2), (20, 15, 2)], "boss")
+    assert len(builder.shapes) == 2
+    assert [n.name for n in builder.nodes] == ["plate", "boss", "boss_2", "boss_3", "boss_4", "boss_5"]
+    assert names == ["boss_4", "boss_5"]
+    for shape, node in zip(originals, builder.nodes[1:4]):
+        np.testing.assert_allclose(_bbox(builder.shapes[node.shape].moved(node.location)), _bbox(shape), atol=1e-6)
+    assert builder.placements()[4]["matrix"][0][3] == pytest.approx(-20.0)
+
+
+def test_instanced_exports(tmp_path):
+    builder = AssemblyBuilder("device")
+    builder.add(cq.Workplane("XY").box(80, 50, 2), "plate", color="gray")
+    builder.add_at(insert_boss("M3", 8.0), [(x, y, 2) for x in (-30, -10, 10, 30) for y in (-15, 15)], "boss")
+    builder.export(str(tmp_path / "device.glb"))
+    builder.export(str(tmp_path / "device.step"))
+    pair = AssemblyBuilder("pair")
+    pair.add(cq.Workplane("XY").box(80, 50, 2), "plate")
+    pair.add(insert_boss("M3", 8.0), "boss")
+    pair.export(str(tmp_path / "pair.glb"))
+    pair.export(str(tmp_path / "pair.step"))
+
+    def positions(path):
+        return {p["attributes"]["POSITION"] for m in _glb_json(path)["meshes"] for p in m["primitives"]}
+
+    # Eight bosses reference the vertex data of one
+    assert len(positions(tmp_path / "device.glb")) == len(positions(tmp_path / "pair.glb"))
+    assert len(_glb_json(tmp_path / "device.glb")["nodes"]) > len(_glb_json(tmp_path / "pair.glb")["nodes"])
+    assert (tmp_path / "device.step").stat().st_size < 2 * (tmp_path / "pair.step").stat().st_size
+    imported = cq.importers.importStep(str(tmp_path / "device.step"))
+    assert len(imported.solids().vals()) == 9
+    with pytest.raises(ValueError, match="unsupported"):
+        builder.export(str(tmp_path / "device.obj"))
+
+
+def test_scene_graph_transforms():
+    graph = {
+        "root": {
+            "id": "root",
+            "transform": {"position": [0, 0, 0], "rotation": [0, 0, 0], "scale": [1, 1, 1]},
+            "children": [
+                {
+                    "id": "a",
+                    "name": "bracket",
+                    "componentId": "c1",
+                    "transform": {"position": [10, 0, 0], "rotation": [0, 0, np.pi / 2], "scale": [1, 1, 1]},
+                    "children": [
+                        {
+                            "id": "b",
+                            "name": "screw",
+                            "componentId": "c2",
+                            "transform": {"position": [5, 0, 0], "rotation": [0, 0, 0], "scale": [1, 1, 1]},
+                            "children": [],
+                        }
+                    ],
+                },
+                {"id": "c", "name": "unknown", "componentId": "missing", "children": []},
+            ],
+        }
+    }
+    builder = AssemblyBuilder()
+    added = builder.add_scene_graph(graph, {"c1": cq.Workplane("XY").box(4, 2, 1), "c2": cq.Workplane("XY").box(1, 1, 1)})
+    assert added == ["bracket", "screw"]
+    screw = builder.shapes[builder.nodes[1].shape].moved(builder.nodes[1].location)
+    # The child's +X offset is turned into +Y by the parent's 90° rotation
+    np.testing.assert_allclose(_bbox(screw), [9.5, 4.5, -0.5, 10.5, 5.5, 0.5], atol=1e-9)
+    graph["root"]["children"][0]["transform"]["scale"] = [2, 2, 2]
+    with pytest.raises(ValueError, match="scaled"):
+        AssemblyBuilder().add_scene_graph(graph, {"c1": cq.Workplane("XY").box(1, 1, 1)})
@@ -0,0 +1,96 @@
+import os
+
+import cadquery as cq
+import pytest
+
+from cadlib import TubeParams, cutout_usb_c, insert_boss, tube
+from cadlib.cache import cache_key, cache_stats, clear_cache, configure_cache
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_cache()
+    yield
+    configure_cache(enabled=True, max_cost=256 * 1024 * 1024)
+    clear_cache()
+
+
+def test_repeated_builds_hit_cache():
+    a = tube(TubeParams(outer_diameter=20, wall_thickness=2, height=30))
+    b = tube(TubeParams(outer_diameter=20.0, wall_thickness=2.0, height=30.0))
+    stats = cache_stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+    assert b.val().Volume() == pytest.approx(a.val().Volume())
+    # Hits share the BRep data of the first build
+    assert b.val().wrapped.TShape() == a.val().wrapped.TShape()
+
+
+def test_equivalent_calls_share_key():
+    assert cache_key(insert_boss.__wrapped__, "M3") == cache_key(insert_boss.__wrapped__, size="M3", height=6)
+    assert cache_key(insert_boss.__wrapped__, "M3") != cache_key(insert_boss.__wrapped__, "M4")
+
+
+def test_returned_handles_are_independent():
+    first = cutout_usb_c(2.0)
+    first.val().move(cq.Location(cq.Vector(50, 0, 0)))
+    again = cutout_usb_c(2.0)
+    assert again.val().Center().x == pytest.approx(0.0, abs=1e-9)
+    assert cache_stats().hits == 1
+
+
+def test_lru_eviction_by_cost():
+    insert_boss("M3")
+    one = cache_stats().cost
+    configure_cache(max_cost=int(one * 2.5))
+    insert_boss("M4")
+    insert_boss("M3")  # refresh M3 so M4 is least recently used
+    insert_boss("M2")
+    stats = cache_stats()
+    assert stats.evictions >= 1 and stats.cost <= stats.max_cost
+    insert_boss("M3")
+    assert cache_stats().hits == 2
+
+
+def test_disabled_cache_builds_every_time():
+    configure_cache(enabled=False)
+    insert_boss("M3")
+    insert_boss("M3")
+    assert cache_stats().entries == 0
+
+
+def test_disk_cache_survives_memory_clear(tmp_path):
+    configure_cache(disk_dir=tmp_path)
+    try:
+        built = insert_boss("M3")
+        clear_cache()
+        loaded = insert_boss("M3")
+        stats = cache_stats()
+        assert (stats.disk_hits, stats.misses) == (1, 1)
+        assert isinstance(loaded, cq.Workplane)
+        assert loaded.val().Volume() == pytest.approx(built.val().Volume())
+        assert len(list(tmp_path.rglob("*.brep"))) == 1
+    finally:
+        configure_cache(disable_disk=True)
+
+
+def test_disk_cache_evicts_oldest_and_drops_corrupt_entries(tmp_path):
+    configure_cache(disk_dir=tmp_path)
+    try:
+        for size in ("M2", "M3", "M4"):
+            insert_boss(size)
+        from cadlib.cache import _CACHE
+
+        disk = _CACHE.disk
+        files = sorted(tmp_path.rglob("*.brep"))
+        for age, path in enumerate(files):
+            os.utime(path, (1_000_000 + age, 1_000_000 + age))
+        disk.evict(target=disk.size() - 1)
+        assert not files[0].exists() and files[-1].exists()
+
+        files[-1].write_bytes(b"not a brep")
+        clear_cache()
+        for size in ("M2", "M3", "M4"):
+            assert insert_boss(size).val().isValid()
+        assert cache_stats().disk_hits == 1
+    finally:
+        configure_cache(disable_disk=True)
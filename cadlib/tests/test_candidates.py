@@ -0,0 +1,31 @@
+import json
+import os
+import subprocess
+import sys
+
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+TOOL = os.path.join(REPO_ROOT, "backend", "tools", "run_candidates.py")
+
+
+def test_first_valid_candidate_wins_and_others_are_cancelled(tmp_path):
+    (tmp_path / "bad.py").write_text("def build():\n    raise RuntimeError('boom')\n")
+    (tmp_path / "slow.py").write_text("import time\ntime.sleep(600)\n")
+    (tmp_path / "good.json").write_text(json.dumps({"parts": {"boss": {"feature": "insert_boss", "params": {"size": "M3"}}}}))
+    out = tmp_path / "winner"
+    proc = subprocess.run(
+        [sys.executable, TOOL, "bad.py", "slow.py", "good.json", "--jobs", "3", "--timeout", "300", "--out", str(out)],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        timeout=600,
+    )
+    assert proc.returncode == 0, proc.stdout + proc.stderr
+    report = json.loads(proc.stdout)
+    assert report["winner"] == "good.json" and report["valid"]
+    status = {r["path"]: r["status"] for r in report["ranking"]}
+    assert status == {"good.json": "ok", "bad.py": "failed", "slow.py": "cancelled"}
+    assert report["ranking"][0]["path"] == "good.json"
+    assert "boom" in next(r for r in report["ranking"] if r["path"] == "bad.py")["error"]
+    assert (out / "boss.stl").stat().st_size > 84
+    assert json.loads((out / "manifest.json").read_text())["parts"]["boss"]["valid"] is True
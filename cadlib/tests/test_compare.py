@@ -0,0 +1,56 @@
+import os
+import tempfile
+
+import cadquery as cq
+import pytest
+
+from cadlib import TubeParams, tube, compare_shapes
+from cadlib.compare import _triangle_distance, load_stl, surface_distance
+from cadlib.sections import _weld_mesh
+
+
+def test_identical_parts_converge():
+    part = tube(TubeParams(outer_diameter=20, wall_thickness=2, height=30))
+    diff = compare_shapes(part, tube(TubeParams(outer_diameter=20, wall_thickness=2, height=30)), samples=5000)
+    assert diff.hausdorff < 1e-6
+    assert diff.volume_delta == pytest.approx(0.0)
+    assert diff.converged()
+
+
+def test_added_hole_is_localized():
+    block = cq.Workplane("XY").box(100, 60, 30)
+    drilled = cq.Workplane("XY").box(100, 60, 30).faces(">Z").workplane().hole(5)
+    diff = compare_shapes(block, drilled, samples=5000)
+    assert not diff.converged()
+    assert diff.hausdorff == pytest.approx(15.0, abs=0.5)
+    assert diff.volume_delta == pytest.approx(-589.05, rel=1e-3)
+    # Only points on the new bore should be flagged as changed
+    changed = diff.points_b[diff.changed_b]
+    assert len(changed) > 0 and (abs(changed[:, 0]) < 2.6).all() and (abs(changed[:, 1]) < 2.6).all()
+
+
+def test_compare_stl_meshes():
+    a = tube(TubeParams(outer_diameter=20, wall_thickness=2, height=30))
+    b = tube(TubeParams(outer_diameter=20.4, wall_thickness=2, height=30))
+    with tempfile.TemporaryDirectory() as td:
+        pa, pb = os.path.join(td, "a.stl"), os.path.join(td, "b.stl")
+        cq.exporters.export(a, pa)
+        cq.exporters.export(b, pb)
+        diff = compare_shapes(load_stl(pa), load_stl(pb), samples=5000)
+    assert diff.mean_distance == pytest.approx(0.2, abs=0.05)
+    assert diff.volume_delta > 0
+
+
+def test_rotated_part_distances_are_exact():
+    # Off-axis slivers along the fillets and bores used to fill huge voxel boxes
+    def drilled(d):
+        part = cq.Workplane("XY").box(100, 60, 30).edges("|Z").fillet(8).faces(">Z").workplane().rarray(20, 20, 4, 2).hole(d)
+        return part.rotate((0, 0, 0), (1, 1, 0), 35)
+
+    diff = compare_shapes(drilled(5), drilled(6), samples=5000)
+    assert diff.hausdorff == pytest.approx(0.5, abs=1e-3)
+    verts, tris = _weld_mesh(drilled(6).val(), 0.05)
+    pts = diff.points_a[::40]
+    a, b, c = (verts[tris[:, i]][None] for i in range(3))
+    exact = _triangle_distance(pts[:, None, :], a, b, c).min(axis=1)
+    assert surface_distance(pts, verts, tris) == pytest.approx(exact, abs=1e-12)
@@ -0,0 +1,122 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from cadlib.costs import MAX_ITERATIONS, MAX_PATTERN, UNKNOWN_COUNT, analyze_script
+
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+RUNNER = os.path.join(REPO_ROOT, "backend", "tools", "run_generated_guarded.py")
+
+
+def test_constant_loops_and_patterns_are_expanded():
+    src = """
+from cadlib import insert_boss, apply_screw_holes, HoleSpec, bolt_circle_points
+N = 6
+ROWS = N // 2
+def boss_row(plate):
+    for i in range(ROWS):
+        plate = plate.union(insert_boss("M3", 6).translate((i * 10, 0, 0)))
+    return plate
+def build():
+    plate = cq.Workplane().box(50, 30, 10).edges("|Z").fillet(2)
+    for j in [0, 1]:
+        plate = boss_row(plate)
+    plate = apply_screw_holes(plate.faces(">Z"), bolt_circle_points(N, 10), HoleSpec(size="M3"))
+    return plate.faces(">Z").workplane().rarray(5, 5, 4, 3).hole(1)
+"""
+    cost = analyze_script(src)
+    # 2 rows × 3 bosses, each a union plus the builder's own (revolved) cost
+    assert cost.booleans == pytest.approx(2 * 3 * (1 + 0.25) + 1 + 1)
+    assert cost.fillets == 1
+    assert cost.instances == pytest.approx(6 + 11)
+    assert cost.max_pattern == 12
+    assert cost.issues == () and cost.fatal == ()
+    assert cost.tier() == "fast"
+
+
+def test_nested_loops_multiply_and_route_to_slow():
+    src = """
+def build():
+    b = cq.Workplane().box(100, 100, 2)
+    for i in range(40):
+        for j in range(40):
+            b = b.union(cq.Workplane().cylinder(5, 1).translate((i, j, 0)))
+    return b
+"""
+    cost = analyze_script(src)
+    assert cost.booleans == 1600
+    assert cost.tier() == "slow"
+    assert cost.tier(limit=1000) == "reject"
+
+
+def test_pathological_scripts_are_fatal():
+    assert analyze_script("def build():\n    while True:\n        pass\n").tier() == "reject"
+    assert analyze_script("def f(n):\n    return f(n - 1)\ndef build():\n    return f(3)\n").fatal
+    huge = f"def build():\n    return cq.Workplane().box(9, 9, 1).faces('>Z').workplane().rarray(1, 1, {MAX_PATTERN}, 2).hole(0.1)\n"
+    assert "rarray places" in analyze_script(huge).fatal[0]
+    # A loop that can break is not fatal, only unbounded
+    bounded = analyze_script("def build():\n    while True:\n        break\n")
+    assert not bounded.fatal and "no static bound" in bounded.issues[0]
+
+
+def test_unknown_bounds_are_assumed_and_reported():
+    cost = analyze_script("def build(points):\n    b = cq.Workplane().box(9, 9, 9)\n    for p in points:\n        b = b.cut(b)\n    return b\n")
+    assert cost.booleans == UNKNOWN_COUNT
+    assert "not static" in cost.issues[0]
+
+
+def test_runner_rejects_before_execution(tmp_path):
+    script = tmp_path / "gen.py"
+    script.write_text("def build():\n    while True:\n        pass\n")
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    proc = subprocess.run([sys.executable, RUNNER, str(script)], env=env, capture_output=True, text=True, timeout=300)
+    assert proc.returncode == 3
+    assert "infinite loop" in proc.stdout
+    assert not (tmp_path / "out").exists()
+
+
+def test_counts_passed_by_keyword_match_parameter_names():
+    def holes(args):
+        return analyze_script(
+            "from cadlib import apply_screw_holes, HoleSpec, rect_grid_points\n"
+            "def build():\n"
+            "    plate = cq.Workplane().box(9, 9, 1)\n"
+            f"    return apply_screw_holes(plate.faces('>Z'), rect_grid_points({args}), HoleSpec(size='M3'))\n"
+        )
+
+    assert holes("10, ny=100000, dx=1, dy=1").tier() == "reject"
+    assert holes("ny=100000, nx=10, dx=1, dy=1").tier() == "reject"
+    assert holes("10, dx=1, ny=4, dy=1").max_pattern == 40
+    rows = analyze_script("def build():\n    return cq.Workplane().box(9, 9, 1).faces('>Z').workplane().rarray(1, 1, 3, yCount=5).hole(0.1)\n")
+    assert rows.max_pattern == 15
+
+
+def test_long_loops_cost_time_without_cad_calls():
+    huge = analyze_script("def build():\n    for i in range(10**9):\n        pass\n")
+    assert huge.tier() == "reject" and "loop runs 1000000000 iterations" in huge.fatal[0]
+    nested = analyze_script("def build():\n    t = 0\n    for i in range(2000):\n        for j in range(2000):\n            t += i * j\n")
+    assert len(nested.fatal) == 1 and nested.fatal[0].startswith("line 3:")
+    assert analyze_script("def build():\n    return sum(x * x for x in range(2 * MAX_ITERATIONS))\n".replace("MAX_ITERATIONS", str(MAX_ITERATIONS))).fatal
+    slow = analyze_script("def build():\n    for i in range(500000):\n        pass\n")
+    assert not slow.fatal and slow.iterations == 500000 and slow.tier() == "slow"
+    assert analyze_script("def build():\n    for i in range(100):\n        pass\n").tier() == "fast"
+
+
+def test_non_finite_and_complex_folds_are_not_static():
+    for expr in ("int(1e400)", "round(1e400)", "10.0 ** 400", "(-8) ** 0.5", "1e308 / 1e-308"):
+        cost = analyze_script(f"def build():\n    for i in range({expr}):\n        pass\n")
+        assert cost.iterations == UNKNOWN_COUNT and "not static" in cost.issues[0]
+
+
+def test_runner_survives_a_failing_cost_analysis(tmp_path):
+    # Nested deeper than the analyzer's recursion can follow
+    script = tmp_path / "gen.py"
+    script.write_text("def build():\n    return cq.Workplane().box(1, 1, 1)\nX = " + "-" * 900 + "1\n")
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    proc = subprocess.run([sys.executable, RUNNER, str(script), "--cost-only"], env=env, capture_output=True, text=True, timeout=300)
+    assert proc.returncode == 0 and "Traceback" not in proc.stdout + proc.stderr
+    assert json.loads(proc.stdout.splitlines()[-1])["tier"] == "unknown"
@@ -0,0 +1,55 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import cadquery as cq
+import pytest
+
+from cadlib import as_csg
+from cadlib.csg import Cut
+
+
+def _holes(n):
+    return [cq.Workplane("XY").center(-20 + 5 * i, 0).circle(1.0).extrude(10).translate((0, 0, -5)) for i in range(n)]
+
+
+def test_chained_cuts_become_one_compound_cut():
+    plate = cq.Workplane("XY").box(60, 20, 4)
+    boss = cq.Workplane("XY").center(0, 8).circle(3).extrude(6)
+    expected = plate.union(boss)
+    node = as_csg(plate) + boss
+    for h in _holes(9):
+        expected = expected.cut(h)
+        node = node - h
+    assert isinstance(node, Cut) and len(node.tools) == 9
+    result = node.evaluate()
+    assert result.isValid()
+    assert result.Volume() == pytest.approx(expected.val().Volume(), rel=1e-9)
+
+
+def test_union_of_disjoint_parts_skips_boolean_and_cuts_are_pushed_down():
+    a = cq.Workplane("XY").box(10, 10, 10)
+    b = cq.Workplane("XY").box(10, 10, 10).translate((30, 0, 0))
+    far = cq.Workplane("XY").box(2, 2, 2).translate((200, 0, 0))
+    pair = (as_csg(a) + b).evaluate()
+    assert isinstance(pair, cq.Compound) and len(pair.Solids()) == 2
+    slotted = (as_csg(a) + b - cq.Workplane("XY").box(60, 2, 2) - far).evaluate()
+    # The slot runs through the first box and halfway into the second
+    assert slotted.Volume() == pytest.approx(2000 - 40 - 20)
+
+
+def test_common_orders_by_size_and_detects_empty():
+    box = as_csg(cq.Workplane("XY").box(10, 10, 10))
+    ball = cq.Workplane("XY").sphere(6.5)
+    expected = cq.Workplane("XY").box(10, 10, 10).intersect(ball).val().Volume()
+    assert (box & ball).evaluate().Volume() == pytest.approx(expected)
+    apart = box & cq.Workplane("XY").box(1, 1, 1).translate((40, 0, 0))
+    assert apart.bbox() is None and not apart.evaluate().Solids()
+
+
+def test_shared_subtrees_and_executor():
+    body = as_csg(cq.Workplane("XY").box(20, 20, 5)) - _holes(3)[1]
+    left = body - cq.Workplane("XY").box(2, 30, 30).translate((-8, 0, 0))
+    right = body + cq.Workplane("XY").box(4, 4, 4).translate((0, 0, 4))
+    with ThreadPoolExecutor(2) as ex:
+        wp = (as_csg(left) + right.to_workplane()).to_workplane(ex)
+    assert isinstance(wp, cq.Workplane) and wp.val().isValid()
+    assert body._value is not None and left.base is body.base
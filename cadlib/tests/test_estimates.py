@@ -0,0 +1,118 @@
+import subprocess
+import sys
+
+import cadquery as cq
+import numpy as np
+import pytest
+
+from cadlib import (
+    RectEnclosureParams,
+    TubeParams,
+    cutout_dc_barrel,
+    cutout_rj45,
+    cutout_usb_c,
+    elliptical_enclosure,
+    gasket_channel_rect,
+    insert_boss,
+    o_ring_gland_face,
+    pcb_pocket,
+    quality,
+    rectangular_enclosure_base_and_lid,
+    tube,
+)
+from cadlib.estimates import (
+    estimate,
+    estimate_cutout_dc_barrel,
+    estimate_cutout_rj45,
+    estimate_cutout_usb_c,
+    estimate_elliptical_enclosure,
+    estimate_gasket_channel_rect,
+    estimate_o_ring_gland_face,
+    estimate_tube,
+)
+
+
+def _kernel(parts):
+    volumes, boxes = [], []
+    for part in parts:
+        shape = cq.Compound.makeCompound(part.vals()) if isinstance(part, cq.Workplane) else part
+        bb = shape.BoundingBox()
+        volumes.append(shape.Volume())
+        boxes.append([bb.xmin, bb.ymin, bb.zmin, bb.xmax, bb.ymax, bb.zmax])
+    return np.array(volumes), np.array(boxes)
+
+
+def _check(est, parts):
+    volumes, boxes = _kernel(parts)
+    np.testing.assert_allclose(est.volume, volumes, rtol=1e-6)
+    np.testing.assert_allclose(est.bbox, boxes, atol=1e-4)
+
+
+def test_tube_batch_matches_kernel():
+    rows = [
+        TubeParams(outer_diameter=20, wall_thickness=2, height=30, end_style=style, end_cap_thickness=3)
+        for style in ("open", "one_end_closed", "both_closed")
+    ] + [TubeParams(outer_diameter=50, wall_thickness=1.2, height=5, end_style="both_closed")]
+    _check(estimate(tube, rows), [tube(p) for p in rows])
+
+
+@pytest.mark.parametrize("mode", ["final", "preview"])
+def test_insert_boss_batch_matches_kernel(mode):
+    rows = [dict(size=s, height=h, through_hole=t) for s in ("M2", "M3", "M4") for h in (3.0, 8.0) for t in (True, False)]
+    with quality(mode):
+        _check(estimate("insert_boss", rows), [insert_boss(**r) for r in rows])
+
+
+def test_enclosure_batch_matches_kernel():
+    rows = [
+        RectEnclosureParams(),
+        RectEnclosureParams(length=50, width=30, height=20, wall_thickness=2, lid_height=8),
+        RectEnclosureParams(lid_height=2.5),
+    ]
+    _check(estimate(rectangular_enclosure_base_and_lid, rows), [rectangular_enclosure_base_and_lid(p) for p in rows])
+    est = estimate_elliptical_enclosure([80, 30], 40, [30, 20], 2, [10, 8])
+    _check(est, [elliptical_enclosure(80, 40, 30, 2, 10), elliptical_enclosure(30, 40, 20, 2, 8)])
+
+
+@pytest.mark.parametrize("mode", ["final", "preview"])
+def test_cutouts_and_seals_match_kernel(mode):
+    with quality(mode):
+        _check(estimate_cutout_usb_c([2.0, 3.0], [0.2, 0.1]), [cutout_usb_c(2.0), cutout_usb_c(3.0, 0.1)])
+        _check(estimate_cutout_rj45([2.0, 4.0]), [cutout_rj45(2.0), cutout_rj45(4.0)])
+        _check(estimate_cutout_dc_barrel(2.0, [0.2, 0.5]), [cutout_dc_barrel(2.0), cutout_dc_barrel(2.0, 0.5)])
+        _check(
+            estimate_o_ring_gland_face([30, 50], [2, 3], [0.15, 0.2], [0.85, 0.8]),
+            [o_ring_gland_face(30, 2), o_ring_gland_face(50, 3, 0.2, 0.8)],
+        )
+        _check(
+            estimate_gasket_channel_rect([60, 80], [40, 50], [3, 4], [2, 3], [1, 0]),
+            [gasket_channel_rect(60, 40, 3, 2), gasket_channel_rect(80, 50, 4, 3, 0)],
+        )
+
+
+def test_pcb_pocket_default_depth_per_row():
+    rows = [dict(board_length=50, board_width=30, thickness=1.6), dict(board_length=50, board_width=30, thickness=1.6, depth=3.0)]
+    _check(estimate(pcb_pocket, rows), [pcb_pocket(**r) for r in rows])
+
+
+def test_mass_size_and_broadcasting():
+    est = estimate_tube(20.0, 2.0, [10.0, 20.0, 30.0])
+    assert len(est) == 3
+    np.testing.assert_allclose(est.size, [[20, 20, 20], [20, 20, 40], [20, 20, 60]])
+    np.testing.assert_allclose(est.mass("PETG"), est.volume * 1.27e-3)
+    np.testing.assert_allclose(est.mass("PLA", infill=0.5), est.volume * 0.62e-3)
+
+
+def test_estimate_rejects_unknown_builders_and_parameters():
+    with pytest.raises(KeyError):
+        estimate("louvre_panel", [{}])
+    with pytest.raises(TypeError):
+        estimate("cutout_rj45", [{"panel_thickness": 2.0, "depth": 1.0}])
+    with pytest.raises(TypeError):
+        estimate("cutout_rj45", [{"panel_thickness": 2.0}, {"clearance": 0.1}])
+    assert len(estimate("cutout_rj45", [])) == 0
+
+
+def test_import_does_not_load_occt():
+    code = "import sys, cadlib.estimates; sys.exit(any(m in sys.modules for m in ('cadquery', 'OCP')))"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
@@ -0,0 +1,33 @@
+import cadquery as cq
+import pytest
+
+from cadlib import HoleSpec, apply_screw_holes
+
+
+def _hole_centers(wp: cq.Workplane):
+    return sorted((round(f.Center().x, 6), round(f.Center().y, 6)) for f in wp.faces("%CYLINDER").vals())
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        HoleSpec(size="M3", through=True),
+        HoleSpec(size="M3", through=True, counterbore=True, head_type="socket"),
+        HoleSpec(size="M3", through=True, countersink=True, head_type="flat"),
+        HoleSpec(size="M4", through=False, depth=2.0),
+    ],
+)
+def test_batched_matches_sequential(spec):
+    plate = cq.Workplane("XY").rect(60, 40).extrude(5)
+    pts = [(-20, -10, 2.5), (20, -10, 2.5), (20, 10, 2.5), (-20, 10, 2.5)]
+    batched = apply_screw_holes(plate, pts, spec)
+    sequential = apply_screw_holes(plate, pts, spec, batched=False)
+    assert batched.val().Volume() == pytest.approx(sequential.val().Volume(), rel=1e-9)
+    assert _hole_centers(batched) == _hole_centers(sequential)
+
+
+def test_each_location_is_independent():
+    plate = cq.Workplane("XY").rect(60, 40).extrude(5)
+    spec = HoleSpec(size="M3", through=True)
+    result = apply_screw_holes(plate, [(-20, -10, 2.5), (20, 10, 2.5)], spec)
+    assert _hole_centers(result) == [(-20.0, -10.0), (20.0, 10.0)]
@@ -0,0 +1,108 @@
+import json
+import os
+import subprocess
+import sys
+
+import cadquery as cq
+import numpy as np
+import pytest
+
+from cadlib import fingerprint, geometry_hash, insert_boss, perforated_panel, same_geometry
+
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+RUNNER = os.path.join(REPO_ROOT, "backend", "tools", "run_generated_guarded.py")
+
+
+def _part():
+    return cq.Workplane("XY").box(20, 12, 6).faces(">Z").workplane().hole(3).edges("|Z").fillet(1).val()
+
+
+def test_fingerprint_survives_round_trips(tmp_path):
+    part = _part()
+    step, brep = str(tmp_path / "p.step"), str(tmp_path / "p.brep")
+    cq.exporters.export(part, step)
+    part.exportBrep(brep)
+    assert fingerprint(cq.importers.importStep(step)) == fingerprint(part)
+    assert fingerprint(cq.Shape.importBrep(brep)) == fingerprint(part)
+    # Existing triangulation does not leak into the result
+    meshed = _part()
+    meshed.tessellate(0.01)
+    assert fingerprint(meshed) == fingerprint(part)
+
+
+def test_fingerprint_ignores_face_and_boolean_order():
+    part = _part()
+    reordered = cq.Solid.makeSolid(cq.Shell.makeShell(list(reversed(part.Faces()))))
+    assert same_geometry(reordered, part)
+    a, b = cq.Workplane("XY").box(10, 10, 10), cq.Workplane("XY").cylinder(14, 3)
+    c = cq.Workplane("XY").sphere(6.5)
+    assert same_geometry(a.cut(b).cut(c), a.cut(c).cut(b))
+
+
+def test_fingerprint_tracks_position_size_and_handedness():
+    part = _part()
+    moved = part.translate(cq.Vector(0.5, 0, 0))
+    assert fingerprint(moved) != fingerprint(part)
+    assert geometry_hash(moved) == geometry_hash(part)
+    assert not same_geometry(part, cq.Workplane("XY").box(20, 12, 6.01).faces(">Z").workplane().hole(3).edges("|Z").fillet(1))
+    wedge = cq.Workplane("XZ").polyline([(0, 0), (10, 0), (0, 4)]).close().extrude(3).val()
+    assert not same_geometry(wedge, wedge.mirror("YZ").translate(cq.Vector(10, 0, 0)))
+
+
+def test_runner_skips_unchanged_and_copies_duplicates(tmp_path):
+    script = tmp_path / "gen.py"
+    script.write_text(
+        "from cadlib import insert_boss\n"
+        "def build():\n"
+        "    return {'a': insert_boss('M3', 8), 'b': insert_boss('M3', 8), 'c': insert_boss('M3', 6)}\n"
+    )
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+
+    def run():
+        subprocess.run([sys.executable, RUNNER, str(script)], check=True, env=env, capture_output=True)
+        with open(tmp_path / "out" / "manifest.json") as fh:
+            return json.load(fh)["parts"]
+
+    first = run()
+    assert [first[k]["status"] for k in "abc"] == ["exported", "duplicate", "exported"]
+    assert first["b"]["same_as"] == "a"
+    assert first["a"]["fingerprint"] == fingerprint(insert_boss("M3", 8))
+    assert (tmp_path / "out" / "b.stl").read_bytes() == (tmp_path / "out" / "a.stl").read_bytes()
+    second = run()
+    assert {v["status"] for v in second.values()} == {"unchanged"}
+
+
+def test_healing_is_part_of_the_unchanged_check(tmp_path):
+    script = tmp_path / "gen.py"
+    script.write_text("from cadlib import insert_boss\ndef build():\n    return {'a': insert_boss('M3', 8)}\n")
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+
+    def run(*flags):
+        subprocess.run([sys.executable, RUNNER, str(script), *flags], check=True, env=env, capture_output=True)
+        with open(tmp_path / "out" / "manifest.json") as fh:
+            return json.load(fh)["parts"]["a"]
+
+    assert run()["status"] == "exported"
+    healed = run("--heal")
+    assert healed["status"] == "exported" and healed["heal"] is True
+    assert run("--heal")["status"] == "unchanged"
+
+
+def test_flat_faces_are_integrated_without_meshing():
+    from cadlib.fingerprints import _CUBIC_POINTS, _CUBIC_WEIGHTS, _TRIPLES, _surface_third_moments
+    from cadlib.sections import _weld_mesh
+
+    # Boundary integration of the planar faces agrees with a fine mesh of the whole surface
+    wedge = cq.Workplane("XZ").polyline([(0, 0), (10, 0), (0, 4)]).close().extrude(3).faces("<Y").workplane().hole(1).val()
+    verts, tris = _weld_mesh(wedge.copy(), 1e-4, 0.02)
+    corners = verts[tris]
+    area = 0.5 * np.linalg.norm(np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0]), axis=1)
+    pts = np.einsum("qk,tkd->tqd", _CUBIC_POINTS, corners)
+    w = area[:, None] * _CUBIC_WEIGHTS
+    d = pts - np.einsum("tq,tqd->d", w, pts) / w.sum()
+    expected = np.array([np.einsum("tq,tq->", w, d[..., i] * d[..., j] * d[..., k]) for i, j, k in _TRIPLES]) / w.sum()
+    assert _surface_third_moments(wedge, 5.0) == pytest.approx(expected, abs=1e-3 * np.abs(expected).max())
+    # A panel with hundreds of openings stays cheap and stable
+    panel = perforated_panel(100, 80, 2, hole_size=3, pitch=5)
+    assert fingerprint(panel) == fingerprint(panel.val().copy())
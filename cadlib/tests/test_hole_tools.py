@@ -0,0 +1,76 @@
+import cadquery as cq
+import pytest
+from pydantic import ValidationError
+
+from cadlib import HoleSpec, apply_screw_holes, cache_stats, clearance_diameter, hole_tool, insert_boss
+from cadlib.cache import clear_cache
+from cadlib.hole_tools import HEAD_DIMENSIONS_MM, ISO_CLEARANCE_DIAMETERS_MM, UNC_CLEARANCE_DIAMETERS_MM, _screw_tool, depth_class
+
+
+ALL_SIZES = [(s, "ISO") for s in ISO_CLEARANCE_DIAMETERS_MM] + [(s, "UNC") for s in UNC_CLEARANCE_DIAMETERS_MM]
+
+
+def test_every_size_has_heads():
+    assert set(HEAD_DIMENSIONS_MM) == {s for s, _ in ALL_SIZES}
+    assert clearance_diameter("M8") == pytest.approx(9.2)
+    assert clearance_diameter("UNC_1_4", "SLIDE") == pytest.approx(6.93)
+
+
+def test_unc_sizes_need_the_unc_standard():
+    with pytest.raises(ValidationError):
+        HoleSpec(size="UNC_8")
+    with pytest.raises(ValidationError):
+        HoleSpec(standard="UNC", size="M3")
+
+
+def test_tools_are_built_once_per_key():
+    _screw_tool.cache_clear()
+    spec = HoleSpec(size="M5", counterbore=True, head_type="socket")
+    first = hole_tool(spec, 20.0)
+    # Same depth class and an equivalent spec: the prebuilt solid is reused
+    hole_tool(spec, 25.0)
+    hole_tool(spec.model_copy(update={"countersink": True, "head_type": "socket"}), 30.0)
+    assert _screw_tool.cache_info()[:2] == (2, 1)
+    assert depth_class(25.0) == 32.0 and hole_tool(spec, 40.0).BoundingBox().zmin == pytest.approx(-64.0)
+    # Each caller gets its own copy: moving or meshing it leaves the library alone
+    first.move(cq.Location(cq.Vector(5, 0, 0)))
+    first.tessellate(0.1)
+    again = hole_tool(spec, 20.0)
+    assert again.Center().x == pytest.approx(0.0) and again.BoundingBox().zmax == pytest.approx(0.0)
+
+
+def test_plates_reuse_tools_and_stay_out_of_the_shape_cache():
+    clear_cache()
+    spec = HoleSpec(size="M3")
+    for n in (2, 3):
+        apply_screw_holes(cq.Workplane("XY").rect(60, 40).extrude(5).faces(">Z"), [(x, 0) for x in range(-20, -20 + 10 * n, 10)], spec)
+    assert cache_stats().entries == 0
+
+
+@pytest.mark.parametrize("size,standard", ALL_SIZES)
+@pytest.mark.parametrize("head", [None, "counterbore", "countersink"])
+def test_holes_for_every_size_and_head(size, standard, head):
+    spec = HoleSpec(
+        standard=standard,
+        size=size,
+        counterbore=head == "counterbore",
+        countersink=head == "countersink",
+        head_type={"counterbore": "socket", "countersink": "flat"}.get(head),
+    )
+    plate = cq.Workplane("XY").rect(60, 40).extrude(12)
+    result = apply_screw_holes(plate.faces(">Z"), [(-15, 0), (15, 0)], spec).val()
+    assert result.isValid()
+    removed = plate.val().Volume() - result.Volume()
+    plain = 2 * 3.14159265 * (clearance_diameter(size) / 2) ** 2 * 12
+    if head is None:
+        assert removed == pytest.approx(plain, rel=1e-4)
+    else:
+        assert removed > plain
+    if head == "countersink":
+        assert len(cq.Workplane().add(result).faces("%CONE").vals()) == 2
+
+
+@pytest.mark.parametrize("size", ["M5", "M6", "M8"])
+def test_large_insert_bosses(size):
+    boss = insert_boss(size, 12.0).val()
+    assert boss.isValid() and len(boss.Faces()) == 9
@@ -0,0 +1,58 @@
+import xml.etree.ElementTree as ET
+import zipfile
+
+import cadquery as cq
+import numpy as np
+import pytest
+
+from cadlib import Instances, export_3mf, instanced_mesh, pcb_standoffs
+from cadlib.compare import mesh_volume
+
+
+def test_standoffs_are_instances_of_one_prototype():
+    holes = [(0, 0), (40, 0), (40, 30), (0, 30)]
+    standoffs = pcb_standoffs(holes, height=6.0).val()
+    solids = standoffs.Solids()
+    assert len(solids) == 4
+    assert all(s.wrapped.IsPartner(solids[0].wrapped) for s in solids)
+    centers = sorted((round(s.Center().x, 6), round(s.Center().y, 6)) for s in solids)
+    assert centers == [(0, 0), (0, 30), (40, 0), (40, 30)]
+
+
+def test_materialize_fuses_only_overlaps():
+    peg = cq.Workplane("XY").circle(3).extrude(5)
+    apart = Instances.at_points(peg, [(0, 0), (10, 0)]).materialize()
+    assert isinstance(apart.val(), cq.Compound) and len(apart.val().Solids()) == 2
+    touching = Instances.at_points(peg, [(0, 0), (4, 0)]).materialize()
+    assert len(touching.val().Solids()) == 1
+    assert touching.val().Volume() < 2 * peg.val().Volume()
+
+
+def test_instanced_mesh_handles_rotated_placements():
+    block = cq.Workplane("XY").box(10, 4, 2).val()
+    locs = tuple(cq.Location(cq.Vector(30 * i, 0, 0), cq.Vector(0, 0, 1), 30.0 * i) for i in range(5))
+    inst = Instances(block, locs)
+    verts, tris = instanced_mesh(inst)
+    assert len(tris) == 5 * 12
+    assert mesh_volume(verts, tris) == pytest.approx(5 * 80.0)
+    bb = inst.compound().BoundingBox()
+    assert verts.min(axis=0) == pytest.approx([bb.xmin, bb.ymin, bb.zmin], abs=1e-6)
+
+
+def test_export_3mf_writes_prototype_once(tmp_path):
+    holes = [(10.0 * i, 0.0) for i in range(50)]
+    path = tmp_path / "standoffs.3mf"
+    assert export_3mf(pcb_standoffs(holes, height=6.0), str(path)) == 50
+    with zipfile.ZipFile(path) as zf:
+        root = ET.fromstring(zf.read("3D/3dmodel.model"))
+    ns = {"m": "http://schemas.microsoft.com/3dmanufacturing/core/2015/02"}
+    objects = root.findall("m:resources/m:object", ns)
+    items = root.findall("m:build/m:item", ns)
+    assert len(objects) == 1 and len(items) == 50
+    mesh = objects[0].find("m:mesh", ns)
+    verts = np.array([[float(v.get(k)) for k in "xyz"] for v in mesh.find("m:vertices", ns)])
+    tris = np.array([[int(t.get(k)) for k in ("v1", "v2", "v3")] for t in mesh.find("m:triangles", ns)])
+    shift = [float(v) for v in items[7].get("transform").split()][9:]
+    assert shift == pytest.approx([70.0, 0.0, 0.0])
+    single = pcb_standoffs([(0.0, 0.0)], height=6.0).val().Volume()
+    assert mesh_volume(verts, tris) == pytest.approx(single, rel=1e-2)
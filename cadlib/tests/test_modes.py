@@ -0,0 +1,87 @@
+import threading
+
+import cadquery as cq
+import pytest
+
+import cadlib
+from cadlib import cache_stats, current_quality, cutout_usb_c, insert_boss, pcb_standoffs, quality, set_quality
+from cadlib.cache import clear_cache, configure_cache
+from cadlib.instances import instanced_mesh
+from cadlib.modes import tessellation
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_cache()
+    yield
+    clear_cache()
+
+
+def test_final_is_default_and_context_restores():
+    assert current_quality() == "final"
+    with cadlib.quality("preview"):
+        assert current_quality() == "preview"
+        with quality("final"):
+            assert current_quality() == "final"
+        assert current_quality() == "preview"
+    assert current_quality() == "final"
+
+
+def test_invalid_mode_rejected():
+    with pytest.raises(ValueError):
+        with quality("draft"):
+            pass
+
+
+def test_final_output_unchanged():
+    configure_cache(enabled=False)
+    try:
+        default = insert_boss("M3", 8.0).val()
+        with quality("final"):
+            final = insert_boss("M3", 8.0).val()
+    finally:
+        configure_cache(enabled=True)
+    assert len(final.Faces()) == len(default.Faces())
+    assert final.Volume() == pytest.approx(default.Volume(), rel=1e-12)
+
+
+def test_preview_skips_cosmetic_features():
+    final_usb, final_boss = cutout_usb_c(2.0).val(), insert_boss("M3", 8.0).val()
+    with quality("preview"):
+        usb, boss = cutout_usb_c(2.0).val(), insert_boss("M3", 8.0).val()
+        standoffs = pcb_standoffs([(0, 0), (20, 0)], 6.0).val()
+    # Square corners remove slightly more panel; no groove leaves more boss
+    assert len(usb.Faces()) == 6 and usb.Volume() > final_usb.Volume()
+    assert len(boss.Faces()) < len(final_boss.Faces()) and boss.Volume() > final_boss.Volume()
+    assert standoffs.isValid()
+
+
+def test_cache_keeps_modes_apart():
+    final = cutout_usb_c(2.0)
+    with quality("preview"):
+        preview = cutout_usb_c(2.0)
+    assert cache_stats().hits == 0
+    assert len(preview.faces().vals()) != len(final.faces().vals())
+    with quality("preview"):
+        cutout_usb_c(2.0)
+    assert cache_stats().hits == 1
+
+
+def test_mode_is_per_thread():
+    seen = []
+    set_quality("final")
+    with quality("preview"):
+        t = threading.Thread(target=lambda: seen.append(current_quality()))
+        t.start()
+        t.join()
+    assert seen == ["final"]
+
+
+def test_preview_tessellation_is_coarser():
+    assert tessellation(0.1, 0.1) == (0.1, 0.1)
+    # Fresh solids: OCCT keeps the first triangulation computed for a shape
+    _, fine = instanced_mesh(cq.Workplane("XY").circle(10).extrude(5))
+    with quality("preview"):
+        assert tessellation(0.1, 0.1)[0] > 0.1
+        _, coarse = instanced_mesh(cq.Workplane("XY").circle(10).extrude(5))
+    assert len(coarse) < len(fine)
@@ -0,0 +1,107 @@
+import time
+import zipfile
+
+import cadquery as cq
+import numpy as np
+import pytest
+
+from cadlib import TubeParams, insert_boss, nest, tube
+from cadlib.compare import load_stl, write_stl
+from cadlib.nesting import print_orientation
+from cadlib.sections import _weld_mesh
+
+
+def _parts():
+    parts = {"base": cq.Workplane("XY").box(120, 80, 40), "plate": cq.Workplane("XY").box(10, 90, 60)}
+    for i in range(8):
+        parts[f"bracket{i}"] = cq.Workplane("XY").box(60, 8, 20 + i).faces(">Z").workplane().hole(3)
+    for i in range(8):
+        parts[f"tube{i}"] = tube(TubeParams(outer_diameter=12 + i, height=30))
+    for i in range(6):
+        parts[f"boss{i}"] = insert_boss("M3", 6.0 + i)
+    return parts
+
+
+def _assert_valid(layout, bed, spacing, margin):
+    for k in range(layout.plate_count):
+        boxes = [(p.footprint.min(axis=0), p.footprint.max(axis=0)) for p in layout.on_plate(k)]
+        for i, (lo, hi) in enumerate(boxes):
+            assert np.all(lo >= margin - 1e-6) and np.all(hi <= np.array(bed) - margin + 1e-6)
+            for lo2, hi2 in boxes[:i]:
+                assert np.any(lo >= hi2 + spacing - 1e-6) or np.any(lo2 >= hi + spacing - 1e-6)
+        verts, _ = layout.mesh(k)
+        assert verts[:, 2].min() == pytest.approx(0.0, abs=1e-9)
+
+
+def test_nest_twenty_parts_on_one_bed_quickly():
+    parts = _parts()
+    start = time.perf_counter()
+    layout = nest(parts, bed=(220, 220))
+    assert time.perf_counter() - start < 10.0
+    assert layout.plate_count == 1
+    assert [p.name for p in layout.placements] == list(parts)
+    _assert_valid(layout, (220, 220), 2.0, 5.0)
+    assert layout.utilization() > 0.4
+
+
+def test_overflow_opens_new_plates():
+    parts = [cq.Workplane("XY").box(90, 90, 5) for _ in range(5)]
+    layout = nest(parts, bed=(200, 200), spacing=3.0, margin=4.0)
+    assert layout.plate_count == 2
+    assert [len(layout.on_plate(k)) for k in range(2)] == [4, 1]
+    _assert_valid(layout, (200, 200), 3.0, 4.0)
+    with pytest.raises(ValueError, match="does not fit"):
+        nest([cq.Workplane("XY").box(300, 10, 10)], bed=(200, 200))
+
+
+def test_rotation_fits_long_parts():
+    # 150 mm rods only fit a 160 × 100 bed lying along X
+    rods = [cq.Workplane("XY").box(10, 150, 10) for _ in range(4)]
+    layout = nest(rods, bed=(160, 100), rotate=True)
+    assert layout.plate_count == 1
+    _assert_valid(layout, (160, 100), 2.0, 5.0)
+
+
+def test_print_orientation_picks_largest_flat_face():
+    # Tall thin plate stands on its edge; it should be laid flat on the 80 × 60 face
+    verts, tris = _weld_mesh(cq.Workplane("XY").box(4, 80, 60).val(), 0.1)
+    rot = print_orientation(verts, tris)
+    size = np.ptp(verts @ rot.T, axis=0)
+    assert size[2] == pytest.approx(4.0)
+    # A tube stays upright on its ring rather than rolling onto its side
+    verts, tris = _weld_mesh(tube(TubeParams(outer_diameter=20, height=30)).val(), 0.1)
+    np.testing.assert_allclose(print_orientation(verts, tris), np.eye(3))
+
+
+def test_transforms_match_compound_and_exports(tmp_path):
+    parts = {"a": cq.Workplane("XY").box(30, 20, 10), "b": cq.Workplane("XY").cylinder(15, 8)}
+    layout = nest(parts, bed=(100, 100))
+    for p in layout.placements:
+        bb = parts[p.name].val().moved(p.location).BoundingBox()
+        np.testing.assert_allclose([bb.xmin, bb.ymin], p.footprint.min(axis=0), atol=0.1)
+        assert bb.zmin == pytest.approx(0.0, abs=0.1)
+    assert [t["name"] for t in layout.transforms()] == ["a", "b"]
+    assert np.array(layout.transforms()[0]["matrix"]).shape == (4, 4)
+
+    layout.export(str(tmp_path / "plate.step"))
+    assert len(cq.importers.importStep(str(tmp_path / "plate.step")).solids().vals()) == 2
+    layout.export(str(tmp_path / "plate.3mf"))
+    with zipfile.ZipFile(tmp_path / "plate.3mf") as zf:
+        assert zf.read("3D/3dmodel.model").count(b"<item ") == 2
+    layout.export(str(tmp_path / "plate.stl"))
+    verts, tris = load_stl(str(tmp_path / "plate.stl"))
+    assert len(tris) == len(layout.mesh()[1])
+
+
+def test_nest_stl_files(tmp_path):
+    paths = []
+    for i in range(3):
+        verts, tris = _weld_mesh(cq.Workplane("XY").box(40, 30, 5 + i).val(), 0.1)
+        path = tmp_path / f"part{i}.stl"
+        write_stl(str(path), verts, tris)
+        paths.append(str(path))
+    layout = nest(paths, bed=(120, 120))
+    assert [p.name for p in layout.placements] == ["part0", "part1", "part2"]
+    _assert_valid(layout, (120, 120), 2.0, 5.0)
+    with pytest.raises(ValueError, match="mesh"):
+        layout.compound()
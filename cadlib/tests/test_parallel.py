@@ -0,0 +1,47 @@
+import cadquery as cq
+import pytest
+
+from cadlib import RectEnclosureParams, TubeParams, call, insert_boss, rectangular_enclosure_base_and_lid, run_parallel, tube
+from cadlib.cache import configure_cache
+from cadlib.parallel import shape_from_bytes, shape_to_bytes, shutdown_pool
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _stop_workers():
+    yield
+    shutdown_pool()
+
+
+def test_shape_bytes_roundtrip():
+    shape = cq.Workplane("XY").box(10, 8, 4).edges("|Z").fillet(1).val()
+    back = shape_from_bytes(shape_to_bytes(shape))
+    assert back.isValid()
+    assert back.Volume() == pytest.approx(shape.Volume(), rel=1e-12)
+
+
+def test_run_parallel_matches_inline_results():
+    configure_cache(enabled=False)
+    try:
+        calls = {"boss": call(insert_boss, "M3", 8.0), "tube": call(tube, TubeParams(outer_diameter=12, height=20)), "count": call(len, "abc")}
+        inline = run_parallel(calls, max_workers=1)
+        pooled = run_parallel(calls, max_workers=2)
+    finally:
+        configure_cache(enabled=True)
+    assert list(pooled) == ["boss", "tube", "count"]
+    assert pooled["count"] == 3
+    for key in ("boss", "tube"):
+        assert isinstance(pooled[key], cq.Workplane)
+        assert pooled[key].val().Volume() == pytest.approx(inline[key].val().Volume(), rel=1e-12)
+
+
+def test_worker_errors_propagate():
+    with pytest.raises(ValueError):
+        run_parallel([call(int, "x"), call(int, "1")], max_workers=2)
+
+
+def test_parallel_enclosure_matches_sequential():
+    params = RectEnclosureParams(length=70, width=45, height=25)
+    seq = rectangular_enclosure_base_and_lid(params)
+    par = run_parallel([call(rectangular_enclosure_base_and_lid, params, parallel=True)], max_workers=2)[0]
+    assert len(par.Solids()) == 2
+    assert [s.Volume() for s in par.Solids()] == pytest.approx([s.Volume() for s in seq.Solids()], rel=1e-12)
@@ -0,0 +1,30 @@
+import cadquery as cq
+import pytest
+
+from cadlib import grid_array, linear_array, circular_array
+
+
+def test_disjoint_instances_skip_fuse():
+    peg = cq.Workplane("XY").circle(3).extrude(10)
+    grid = grid_array(peg, nx=4, ny=4, dx=8, dy=8)
+    shape = grid.val()
+    assert isinstance(shape, cq.Compound)
+    assert len(shape.Solids()) == 16
+    # Instances share the prototype geometry instead of being rebuilt
+    assert all(s.wrapped.TShape() == peg.val().wrapped.TShape() for s in shape.Solids())
+
+
+def test_overlapping_instances_fuse_to_one_solid():
+    block = cq.Workplane("XY").box(10, 10, 10)
+    line = linear_array(block, n=3, dx=5)
+    assert len(line.val().Solids()) == 1
+    assert line.val().Volume() == pytest.approx(20 * 10 * 10)
+
+
+def test_fuzzy_fuse_of_touching_instances():
+    block = cq.Workplane("XY").box(10, 10, 10)
+    # Instances only touch (within 1e-4); the fuzzy tolerance merges them into one solid
+    line = linear_array(block, n=3, dx=10.0001, fuzzy=1e-3)
+    assert len(line.val().Solids()) == 1
+    ring = circular_array(block, n=4, radius=4, fuzzy=1e-3)
+    assert ring.val().isValid()
@@ -0,0 +1,81 @@
+import cadquery as cq
+import numpy as np
+import pytest
+
+from cadlib import PanelRegion, cutout_usb_c, hex_grid_points, pcb_standoffs, rect_grid_points, valid_positions
+from cadlib.placement import _near_edges
+from cadlib.utils import min_printable_wall_mm
+
+
+def _edge_distance(xy, poly):
+    a, b = poly, np.roll(poly, -1, axis=0)
+    ab = b - a
+    t = np.clip(np.einsum("nmk,mk->nm", xy[:, None] - a, ab) / np.sum(ab * ab, axis=1), 0, 1)
+    return np.min(np.linalg.norm(xy[:, None] - (a + t[..., None] * ab), axis=2), axis=1)
+
+
+def test_edge_margin_defaults_to_printable_wall():
+    region = PanelRegion.rect(40, 20)
+    assert region.edge_margin == pytest.approx(min_printable_wall_mm())
+    pts = region.filter(rect_grid_points(81, 41, 0.5, 0.5), feature_radius=1.0)
+    assert len(pts)
+    assert np.abs(pts[:, 0]).max() <= 20 - 1.0 - region.edge_margin + 1e-9
+    assert np.abs(pts[:, 1]).max() <= 10 - 1.0 - region.edge_margin + 1e-9
+
+
+def test_near_edges_matches_brute_force():
+    rng = np.random.default_rng(0)
+    poly = np.array([[0, 0], [30, 0], [30, 10], [15, 25], [0, 10]], dtype=float)
+    xy = rng.uniform(-5, 35, (2000, 2))
+    assert np.array_equal(_near_edges(xy, [poly], 2.5), _edge_distance(xy, poly) < 2.5)
+
+
+def test_keepouts_reject_colliding_positions():
+    region = PanelRegion.rect(100, 60, edge_margin=1.0, clearance=0.5).with_keepouts(
+        circles=[(-20, 0, 5)], rects=[(10, -5, 30, 5)], polygons=[[(-45, 20), (-35, 20), (-40, 28)]]
+    )
+    pts = region.filter(rect_grid_points(101, 61, 1.0, 1.0), feature_radius=1.5)
+    xy = pts[:, :2]
+    assert np.all(np.hypot(xy[:, 0] + 20, xy[:, 1]) >= 5 + 1.5 + 0.5 - 1e-9)
+    rect = np.array([[10, -5], [30, -5], [30, 5], [10, 5]], dtype=float)
+    inside = (xy[:, 0] > 10) & (xy[:, 0] < 30) & (np.abs(xy[:, 1]) < 5)
+    assert not inside.any() and _edge_distance(xy, rect).min() >= 2.0 - 1e-9
+    mask = region.mask([(0, 0), (-20, 0), (20, 0), (60, 0)], 1.5)
+    assert mask.tolist() == [True, False, False, False]
+
+
+def test_solid_panel_and_solid_keepouts():
+    panel = cq.Workplane("XY").rect(120, 80).extrude(2).faces(">Z").workplane().hole(20)
+    standoffs = pcb_standoffs([(-40, -25), (40, -25), (-40, 25), (40, 25)], 6.0)
+    usb = cutout_usb_c(2.0).translate((50, 0, 0))
+    region = PanelRegion.from_shape(panel).with_keepouts(shapes=[standoffs, usb])
+    assert len(region.openings) == 1 and len(region.keepout_polygons) == 5
+    pts = region.filter(hex_grid_points(region.bounds(), 2.0), feature_radius=0.75)
+    xy = pts[:, :2]
+    assert np.all(np.hypot(xy[:, 0], xy[:, 1]) >= 10 + 0.75 + region.edge_margin - 0.05)
+    for cx, cy in [(-40, -25), (40, -25), (-40, 25), (40, 25)]:
+        assert np.all(np.hypot(xy[:, 0] - cx, xy[:, 1] - cy) >= 3.0 + 0.75 - 0.05)
+    assert not np.any((np.abs(xy[:, 0] - 50) < 4.7) & (np.abs(xy[:, 1]) < 3.2))
+    same = valid_positions(hex_grid_points(region.bounds(), 2.0), panel, 0.75, shapes=[standoffs, usb])
+    assert np.array_equal(same, pts)
+
+
+def test_thousands_of_candidates_match_brute_force():
+    outline = np.array([(0, 0), (200, 0), (200, 120), (100, 160), (0, 120)], dtype=float)
+    region = PanelRegion.from_polygon(outline).with_keepouts(circles=[(50, 50, 10), (150, 50, 10)], rects=[(90, 0, 110, 30)])
+    cand = hex_grid_points(region.bounds(), 1.5)
+    assert len(cand) > 10000
+    kept = region.mask(cand, 0.5)
+    xy = cand[:, :2]
+    # The outline is convex and counter-clockwise
+    edges = np.roll(outline, -1, axis=0) - outline
+    inside = np.all(edges[:, 0] * (xy[:, None, 1] - outline[:, 1]) - edges[:, 1] * (xy[:, None, 0] - outline[:, 0]) >= 0, axis=1)
+    reach = 0.5 + region.clearance
+    expected = inside & (_edge_distance(xy, outline) >= 0.5 + region.edge_margin)
+    for cx, cy, r in [(50, 50, 10), (150, 50, 10)]:
+        expected &= np.hypot(xy[:, 0] - cx, xy[:, 1] - cy) >= r + reach
+    rect = np.array([[90, 0], [110, 0], [110, 30], [90, 30]], dtype=float)
+    in_rect = (xy[:, 0] > 90) & (xy[:, 0] < 110) & (xy[:, 1] > 0) & (xy[:, 1] < 30)
+    expected &= ~in_rect & (_edge_distance(xy, rect) >= reach)
+    assert 0 < kept.sum() < len(cand)
+    assert np.array_equal(kept, expected)
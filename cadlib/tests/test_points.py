@@ -0,0 +1,99 @@
+import cadquery as cq
+import numpy as np
+import pytest
+from scipy.spatial import cKDTree
+
+from cadlib import (
+    HoleSpec,
+    Instances,
+    apply_screw_holes,
+    array_at_points,
+    bolt_circle,
+    bolt_circle_points,
+    circular_array,
+    filter_keepouts,
+    grid_array,
+    hex_grid_points,
+    pattern_nema17,
+    poisson_disk_points,
+    rect_grid_points,
+    spiral_points,
+    staggered_grid_points,
+    transform_points,
+)
+from cadlib.points import as_points, keepout_mask
+
+
+def _nearest(points):
+    d, _ = cKDTree(points[:, :2]).query(points[:, :2], k=2)
+    return d[:, 1]
+
+
+def test_generators_return_n_by_3_arrays():
+    for pts in (
+        bolt_circle_points(12, 20.0),
+        rect_grid_points(4, 3, 5.0, 5.0),
+        staggered_grid_points(4, 3, 5.0, 4.0),
+        hex_grid_points((-20, -20, 20, 20), 4.0),
+        spiral_points(50, 10.0),
+        poisson_disk_points((0, 0, 30, 30), 3.0, seed=0),
+    ):
+        assert pts.ndim == 2 and pts.shape[1] == 3 and len(pts) > 0
+
+
+def test_legacy_list_helpers_match_vectorized_points():
+    assert bolt_circle(5, 12.0, 10.0) == pytest.approx([tuple(p) for p in bolt_circle_points(5, 12.0, 10.0)])
+    assert pattern_nema17((1, 2, 3))[0] == (1 - 15.5, 2 - 15.5, 3)
+    assert isinstance(bolt_circle(3, 1.0)[0], tuple)
+
+
+def test_grids_are_centered_and_evenly_spaced():
+    grid = rect_grid_points(3, 2, 10.0, 4.0)
+    assert grid[:, :2].mean(axis=0) == pytest.approx([0.0, 0.0])
+    assert grid[1].tolist() == pytest.approx([-10.0, 2.0, 0.0])  # Y varies fastest, as in grid_array
+    hexes = hex_grid_points((-20, -15, 20, 15), 4.0, margin=2.0)
+    assert _nearest(hexes) == pytest.approx(4.0)
+    assert hexes[:, 0].min() >= -18 and hexes[:, 0].max() <= 18 and hexes[:, 1].min() >= -13 and hexes[:, 1].max() <= 13
+    assert np.linalg.norm(spiral_points(200, 10.0)[:, :2], axis=1).max() <= 10.0
+
+
+def test_poisson_disk_respects_min_distance_and_seed():
+    pts = poisson_disk_points((0, 0, 60, 40), 2.5, seed=3)
+    assert _nearest(pts).min() >= 2.5 - 1e-9
+    assert pts[:, 0].min() >= 0 and pts[:, 0].max() <= 60 and pts[:, 1].max() <= 40
+    assert len(pts) > 150  # a maximal fill, not a sparse scatter
+    assert np.array_equal(pts, poisson_disk_points((0, 0, 60, 40), 2.5, seed=3))
+
+
+def test_keepouts_and_transforms():
+    grid = rect_grid_points(11, 11, 1.0, 1.0)
+    kept = filter_keepouts(grid, circles=[(0, 0, 2.0)], rects=[(3, 3, 5, 5)], polygons=[[(-5, -5), (-3, -5), (-5, -3)]], clearance=0.5)
+    assert len(kept) < len(grid)
+    assert np.all(np.hypot(kept[:, 0], kept[:, 1]) >= 2.5)
+    assert not np.any((kept[:, 0] > 2.5) & (kept[:, 1] > 2.5))
+    assert keepout_mask([(0, 0)], circles=[(0, 0, 1)]).tolist() == [False]
+    moved = transform_points([(1, 0), (0, 1)], translate=(10, 0, 5), rotate_deg=90, scale=2.0)
+    np.testing.assert_allclose(moved, [[10.0, 2.0, 5.0], [8.0, 0.0, 5.0]], atol=1e-12)
+    loc = cq.Location(cq.Vector(1, 2, 3))
+    np.testing.assert_allclose(transform_points([(0, 0, 0)], location=loc), [[1.0, 2.0, 3.0]])
+    with pytest.raises(ValueError):
+        as_points([(1, 2, 3, 4)])
+
+
+def test_builders_accept_arrays():
+    plate = cq.Workplane("XY").rect(60, 60).extrude(4)
+    holes = bolt_circle_points(6, 20.0, origin=(0, 0, 4))
+    spec = HoleSpec(size="M3", fit="SNAP", through=True)
+    from_array = apply_screw_holes(plate, holes, spec)
+    from_tuples = apply_screw_holes(plate, [tuple(p) for p in holes.tolist()], spec)
+    assert from_array.val().Volume() == pytest.approx(from_tuples.val().Volume(), rel=1e-12)
+    assert from_array.val().Volume() < plate.val().Volume()
+    # (N,2) locations sit on the target's workplane (z = 0)
+    flat = apply_screw_holes(plate.faces(">Z").workplane(), holes[:, :2], spec)
+    assert flat.val().Volume() == pytest.approx(from_array.val().Volume(), rel=1e-12)
+
+    pin = cq.Workplane("XY").circle(1).extrude(2)
+    arr = array_at_points(pin, rect_grid_points(3, 3, 5.0, 5.0))
+    assert arr.val().Volume() == pytest.approx(grid_array(pin, 3, 3, 5.0, 5.0).val().Volume())
+    assert len(circular_array(pin, 8, 10.0).val().Solids()) == 8
+    assert len(Instances.at_points(pin, spiral_points(20, 30.0))) == 20
@@ -0,0 +1,61 @@
+import math
+
+import pytest
+
+from cadlib import TubeParams, check_shape, insert_boss, o_ring_gland_face, quality, tube
+from cadlib.profiles import bored, revolve_profile, ring
+
+
+def test_ring_and_disk():
+    assert revolve_profile(ring(2, 5, 0, 4)).Volume() == pytest.approx(math.pi * (25 - 4) * 4)
+    disk = revolve_profile(ring(0, 5, 0, 4))
+    assert disk.Volume() == pytest.approx(math.pi * 25 * 4)
+    # Bottom, top and side: the axis segment adds no face
+    assert len(disk.Faces()) == 3 and disk.isValid()
+
+
+def test_repeated_and_collinear_points_add_no_faces():
+    outline = [(0, 0), (3, 0), (5, 0), (5, 2), (5, 2), (5, 4), (0, 4), (0, 0)]
+    assert len(revolve_profile(outline).Faces()) == 3
+
+
+@pytest.mark.parametrize(
+    "bore,voids,volume",
+    [
+        ((0, 0, 10), 0, 10 * 25),  # no bore
+        ((2, -5, 15), 0, 10 * 21),  # through
+        ((2, 4, 20), 0, 10 * 25 - 6 * 4),  # open at the top
+        ((2, -1, 6), 0, 10 * 25 - 6 * 4),  # open at the bottom
+        ((2, 3, 7), 1, 10 * 25 - 4 * 4),  # enclosed cavity
+    ],
+)
+def test_bored_cases(bore, voids, volume):
+    outline, cavities = bored([(5, 0), (5, 10)], *bore)
+    assert len(cavities) == voids
+    solid = revolve_profile(outline, cavities)
+    assert solid.isValid() and solid.Volume() == pytest.approx(math.pi * volume)
+
+
+def test_chamfer_and_groove_are_profile_points():
+    outline, _ = bored([(4, 0), (5, 1), (5, 6), (4.5, 6), (4.5, 7), (5, 7), (5, 10)], 2, 0, 10)
+    solid = revolve_profile(outline)
+    assert solid.isValid() and len(solid.Faces()) == 9
+
+
+def test_negative_radius_rejected():
+    with pytest.raises(ValueError):
+        revolve_profile([(-1, 0), (2, 0), (2, 1)])
+
+
+@pytest.mark.parametrize("style,faces", [("open", 4), ("one_end_closed", 6), ("both_closed", 6)])
+def test_tube_is_one_revolve(style, faces):
+    part = tube(TubeParams(outer_diameter=20, wall_thickness=2, height=30, end_style=style)).val()
+    assert len(part.Faces()) == faces
+    assert check_shape(part).ok
+
+
+@pytest.mark.parametrize("mode", ["final", "preview"])
+def test_revolved_builders_are_valid(mode):
+    with quality(mode):
+        for part in (insert_boss("M3", 8.0, through_hole=False), insert_boss("M2", 1.2), o_ring_gland_face(30, 2)):
+            assert check_shape(part).ok
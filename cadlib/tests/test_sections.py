@@ -0,0 +1,43 @@
+import math
+import os
+import tempfile
+
+import cadquery as cq
+import pytest
+
+from cadlib import TubeParams, tube, section, slice_heights, sections_to_svg
+
+
+def test_section_area_and_perimeter_brep_and_mesh():
+    block = cq.Workplane("XY").box(20, 10, 10).faces(">Z").workplane().hole(4)
+    expected_area = 200.0 - math.pi * 4.0
+    expected_perimeter = 60.0 + math.pi * 4.0
+    exact = section(block, z=1.0)
+    meshed = section(block, z=1.0, method="mesh")
+    assert exact.area == pytest.approx(expected_area, rel=1e-6)
+    assert exact.perimeter == pytest.approx(expected_perimeter, rel=1e-6)
+    assert meshed.area == pytest.approx(expected_area, rel=1e-2)
+    assert sorted(lp.is_hole for lp in meshed.loops) == [False, True]
+
+
+def test_slice_heights_batch_and_svg():
+    part = tube(TubeParams(outer_diameter=30, wall_thickness=3, height=40, end_style="one_end_closed"))
+    secs = slice_heights(part, [-39.0, 0.0, 45.0])
+    assert secs[0].area == pytest.approx(math.pi * 15.0**2, rel=1e-2)
+    assert secs[1].area == pytest.approx(math.pi * (15.0**2 - 12.0**2), rel=1e-2)
+    assert secs[2].is_empty
+    with tempfile.TemporaryDirectory() as td:
+        path = os.path.join(td, "sections.svg")
+        svg = sections_to_svg(secs[:2], path)
+        assert os.path.getsize(path) > 0 and svg.count("<path") == 2
+
+
+def test_section_arbitrary_plane():
+    part = tube(TubeParams(outer_diameter=30, wall_thickness=3, height=40, end_style="both_closed"))
+    plane = cq.Plane(origin=(0, 0, 0), xDir=(0, 1, 0), normal=(1, 0, 0))
+    sec = section(part, plane=plane)
+    outer, holes = sec.polygons()[0]
+    assert len(holes) == 1
+    # tube() extrudes `height` to both sides of Z=0; caps leave a 36 mm tall void
+    assert sec.area == pytest.approx(30 * 80 - 24 * 36, rel=1e-6)
+    assert section(part, plane=plane, method="mesh").area == pytest.approx(sec.area, rel=1e-2)
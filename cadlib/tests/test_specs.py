@@ -0,0 +1,84 @@
+import json
+
+import cadquery as cq
+import pytest
+from pydantic import ValidationError
+
+from cadlib import HoleSpec, PartSpec, apply_screw_holes, build_spec, insert_boss, same_geometry, spec_schema
+from cadlib.cache import cache_stats, clear_cache
+
+
+def test_spec_matches_equivalent_script():
+    spec = {
+        "parts": {
+            "plate": {
+                "feature": "box",
+                "params": {"length": 60, "width": 40, "height": 4},
+                "add": [{"feature": "insert_boss", "params": {"size": "M3", "height": 6}, "at": [0, 0, 4], "points": [[-20, -10], [20, 10]]}],
+                "holes": [{"spec": {"size": "M3"}, "points": [[-25, 15], [25, -15]]}],
+            }
+        }
+    }
+    built = build_spec(spec)["plate"]
+
+    plate = cq.Workplane("XY").box(60, 40, 4, centered=(True, True, False))
+    boss = insert_boss("M3", 6).val()
+    body = plate.union(cq.Workplane("XY").newObject([boss.moved(cq.Location((-20, -10, 4)))]))
+    body = body.union(cq.Workplane("XY").newObject([boss.moved(cq.Location((20, 10, 4)))]))
+    script = apply_screw_holes(body.faces(">Z"), [(-25, 15), (25, -15)], HoleSpec(size="M3"))
+    assert built.val().isValid()
+    assert same_geometry(built, script)
+
+
+def test_placement_generators_and_solid_selection():
+    spec = {
+        "parts": {
+            "base": {
+                "feature": "rectangular_enclosure_base_and_lid",
+                "params": {"length": 100, "width": 60, "height": 30},
+                "solid": 0,
+                "cut": [{"feature": "cutout_dc_barrel", "params": {"panel_thickness": 4}, "rotate": [0, 90, 0], "at": [48, 0, 15]}],
+            },
+            "ring": {
+                "feature": "cylinder",
+                "params": {"diameter": 4, "height": 2},
+                "points": {"generator": "bolt_circle_points", "params": {"n": 6, "radius": 20}},
+            },
+        }
+    }
+    parts = build_spec(json.dumps(spec))
+    base = parts["base"].val()
+    assert len(parts["base"].solids().vals()) == 1
+    # The barrel hole pierces the +X wall
+    assert base.Volume() < build_spec({"parts": {"b": {**spec["parts"]["base"], "cut": []}}})["b"].val().Volume() - 100
+    ring = parts["ring"].val()
+    assert len(ring.Solids()) == 6
+    assert ring.BoundingBox().xmax == pytest.approx(22.0, abs=1e-6)
+
+
+def test_repeated_features_come_from_the_cache():
+    clear_cache()
+    node = {"feature": "insert_boss", "params": {"size": "M4", "height": 7}}
+    build_spec({"parts": {"a": node}})
+    misses = cache_stats().misses
+    build_spec({"parts": {"b": {**node, "at": [10, 0, 0]}, "c": {**node, "rotate": [0, 0, 45]}}})
+    assert cache_stats().misses == misses
+
+
+def test_invalid_specs_name_the_field():
+    with pytest.raises(ValidationError, match="parts.p.box.params.height"):
+        build_spec({"parts": {"p": {"feature": "box", "params": {"length": 1, "width": 1}}}})
+    with pytest.raises(ValidationError, match="does not match any of the expected tags"):
+        build_spec({"parts": {"p": {"feature": "import_os"}}})
+    with pytest.raises(ValidationError, match="Extra inputs"):
+        PartSpec.model_validate({"parts": {"p": {"feature": "box", "params": {"length": 1, "width": 1, "height": 1}, "code": "x"}}})
+    with pytest.raises(ValueError, match="out of range"):
+        build_spec({"parts": {"p": {"feature": "box", "params": {"length": 1, "width": 1, "height": 1}, "solid": 3}}})
+
+
+def test_schema_lists_every_feature():
+    schema = spec_schema()
+    assert schema["additionalProperties"] is False
+    tags = {d["properties"]["feature"]["const"] for d in schema["$defs"].values() if "feature" in d.get("properties", {})}
+    assert {"box", "tube", "insert_boss", "rectangular_enclosure_base_and_lid"} <= tags
+    assert schema["$defs"]["TubeFeature"]["properties"]["params"]["$ref"].endswith("TubeParams")
@@ -0,0 +1,103 @@
+import json
+import math
+import os
+import subprocess
+import sys
+
+import cadquery as cq
+import pytest
+
+from cadlib import ThreadSpec, TubeParams, apply_thread, cache_stats, check_shape, quality, thread, thread_geometry, threads_of, tube
+from cadlib.cache import clear_cache
+from cadlib.threads import thread_dimensions
+
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+RUNNER = os.path.join(REPO_ROOT, "backend", "tools", "run_generated_guarded.py")
+
+
+def _cylinder_volume(diameter, length):
+    return math.pi * diameter**2 / 4.0 * length
+
+
+def test_dimensions_follow_iso_coarse_pitch_and_clearance():
+    major, minor, pitch = thread_dimensions(ThreadSpec(size="M6", clearance=0.0))
+    assert (major, pitch) == (6.0, 1.0) and minor == pytest.approx(6.0 - 1.0825, abs=1e-3)
+    assert thread_dimensions(ThreadSpec(size="M2_5", pitch=0.35, clearance=0.0))[::2] == (2.5, 0.35)
+    # Clearance shrinks bolts and grows nuts
+    assert thread_dimensions(ThreadSpec(size="M6"))[0] == pytest.approx(5.7)
+    assert thread_dimensions(ThreadSpec(size="M6", external=False))[0] == pytest.approx(6.3)
+
+
+def test_threads_are_cosmetic_by_default_and_in_preview():
+    spec = ThreadSpec(size="M6")
+    stud = thread(spec, 10).val()
+    assert len(stud.Faces()) == 3 and stud.Volume() == pytest.approx(_cylinder_volume(5.7, 10))
+    with thread_geometry(), quality("preview"):
+        assert len(thread(spec, 10).val().Faces()) == 3
+    nut = apply_thread(cq.Workplane().box(20, 20, 12).faces(">Z"), ThreadSpec(size="M8", external=False), 8)
+    (record,) = threads_of(nut)
+    assert (record.designation, record.external, record.real) == ("M8x1.25", False, False)
+    assert record.origin == pytest.approx((0, 0, 6)) and record.direction == pytest.approx((0, 0, -1))
+    minor = thread_dimensions(ThreadSpec(size="M8", external=False))[1]
+    assert nut.val().Volume() == pytest.approx(20 * 20 * 12 - _cylinder_volume(minor, 8))
+
+
+def test_real_threads_are_helical_valid_and_cached():
+    clear_cache()
+    spec = ThreadSpec(size="M6")
+    major, minor, _ = thread_dimensions(spec)
+    with thread_geometry():
+        stud = thread(spec, 10).val()
+        hits = cache_stats().hits
+        assert thread(spec, 10).val().isSame(stud)
+        assert cache_stats().hits == hits + 1
+    assert stud.isValid() and len(stud.Faces()) > 3
+    assert _cylinder_volume(minor, 10) < stud.Volume() < _cylinder_volume(major, 10)
+    bb = stud.BoundingBox()
+    assert (bb.zmin, bb.zmax, bb.xlen) == pytest.approx((0, 10, major), abs=1e-3)
+    # The cosmetic cylinder is a separate cache entry
+    assert len(thread(spec, 10).val().Faces()) == 3
+
+
+def test_real_thread_on_a_tube_end_keeps_the_bore():
+    body = tube(TubeParams(outer_diameter=12, wall_thickness=2, height=20))
+    with thread_geometry():
+        threaded = apply_thread(body.faces(">Z"), ThreadSpec(size="M12"), 8, bore=8)
+    report = check_shape(threaded)
+    assert report.ok and report.solids == 1
+    assert threaded.val().BoundingBox().zmax == pytest.approx(28, abs=1e-3)
+    assert threads_of(threaded)[0].real
+    with pytest.raises(ValueError):
+        thread(ThreadSpec(size="M6"), 10, bore=5)
+
+
+def test_runner_builds_real_threads_only_when_asked(tmp_path):
+    script = tmp_path / "gen.py"
+    script.write_text(
+        "from cadlib import ThreadSpec, apply_thread\n"
+        "def build():\n"
+        "    knob = cq.Workplane().cylinder(10, 10)\n"
+        "    return {'knob': apply_thread(knob.faces('>Z'), ThreadSpec(size='M5', external=False), 6)}\n"
+    )
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    env.pop("CADLIB_THREADS", None)
+    runs = ((["--quality", "final"], False), (["--quality", "preview", "--real-threads"], False), (["--quality", "final", "--real-threads"], True))
+    for flags, real in runs:
+        proc = subprocess.run([sys.executable, RUNNER, str(script), *flags], env=env, capture_output=True, text=True, timeout=300)
+        assert proc.returncode == 0, proc.stdout + proc.stderr
+        knob = json.loads((tmp_path / "out" / "manifest.json").read_text())["parts"]["knob"]
+        assert knob["valid"] and knob["threads"][0]["designation"] == "M5x0.8"
+        assert knob["threads"][0]["real"] is real
+
+
+def test_annotations_stay_on_the_threaded_branch():
+    base = cq.Workplane().box(20, 20, 12)
+    a = apply_thread(base.faces(">Z"), ThreadSpec(size="M6", external=False), 8)
+    assert threads_of(base) == () and threads_of(base.faces("<Z")) == ()
+    c = apply_thread(base.faces(">Z"), ThreadSpec(size="M4", external=False), 6)
+    assert [t.designation for t in threads_of(c)] == ["M4x0.7"]
+    # Both threads on one chain, and derived Workplanes keep them
+    both = apply_thread(a.faces("<Z"), ThreadSpec(size="M4", external=False), 6).translate((5, 0, 0))
+    assert [t.designation for t in threads_of(both)] == ["M6x1", "M4x0.7"]
+    assert [t.designation for t in threads_of(a)] == ["M6x1"]
@@ -0,0 +1,97 @@
+import json
+import os
+import subprocess
+import sys
+
+import cadquery as cq
+import pytest
+
+from cadlib import RectEnclosureParams, check_shape, insert_boss, rectangular_enclosure_base_and_lid, trace_operations
+
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+RUNNER = os.path.join(REPO_ROOT, "backend", "tools", "run_generated_guarded.py")
+
+
+def _categories(report):
+    return [d.category for d in report.diagnostics]
+
+
+@pytest.mark.parametrize(
+    "part",
+    [
+        cq.Workplane().cylinder(10, 3),
+        cq.Workplane().sphere(3),
+        cq.Solid.makeCone(3, 0, 5),
+        cq.Solid.makeTorus(10, 2),
+        insert_boss("M3", 6),
+    ],
+)
+def test_good_parts_have_no_diagnostics(part):
+    report = check_shape(part)
+    assert report.ok and report.diagnostics == ()
+    assert report.solids == 1 and report.volume > 0
+
+
+def test_multiple_solids_are_only_a_warning():
+    report = check_shape(rectangular_enclosure_base_and_lid(RectEnclosureParams()))
+    assert report.ok
+    assert _categories(report) == ["multiple_solids"]
+
+
+def test_open_shell_names_its_faces():
+    box = cq.Workplane().box(10, 10, 10).val()
+    open_box = cq.Solid.makeSolid(cq.Shell.makeShell(box.Faces()[:5]))
+    report = check_shape(open_box)
+    assert not report.ok
+    assert {"invalid_brep", "open_shell"} <= set(_categories(report))
+    brep = next(d for d in report.diagnostics if d.category == "invalid_brep")
+    assert brep.statuses == ("NotClosed",)
+    # The four side faces border the missing one
+    assert len(next(d for d in report.diagnostics if d.category == "open_shell").faces) == 4
+
+
+def test_inverted_solid_is_healed():
+    inverted = cq.Solid(cq.Workplane().box(5, 5, 5).val().wrapped.Reversed())
+    report = check_shape(inverted)
+    assert _categories(report) == ["inverted"] and report.volume == pytest.approx(-125.0)
+    healed = check_shape(inverted, heal=True)
+    assert healed.ok and healed.healed
+    assert healed.shape.Volume() == pytest.approx(125.0)
+
+
+def test_empty_and_loose_faces():
+    assert _categories(check_shape(cq.Workplane().box(1, 1, 1).cut(cq.Workplane().box(2, 2, 2)))) == ["empty"]
+    assert _categories(check_shape(cq.Workplane().box(1, 1, 1).faces(">Z"))) == ["not_solid"]
+
+
+def test_traced_errors_name_the_operation_and_line():
+    with trace_operations():
+        plate = cq.Workplane().box(20, 20, 4).faces(">Z").workplane().hole(3)
+        line = sys._getframe().f_lineno + 1
+        gone = plate.cut(cq.Workplane().box(50, 50, 50)).translate((1, 0, 0))
+        boss = insert_boss("M3", 7)
+    (diag,) = check_shape(gone).diagnostics
+    assert (diag.category, diag.operation, diag.line) == ("empty", "cut", line)
+    assert boss._cadlib_trace[0] == "insert_boss"
+    # Tracing is switched off again afterwards
+    assert not hasattr(cq.Workplane().box(1, 1, 1), "_cadlib_trace")
+
+
+def test_runner_reports_diagnostics(tmp_path):
+    script = tmp_path / "gen.py"
+    script.write_text(
+        "def build():\n"
+        "    plate = cq.Workplane().box(20, 20, 4)\n"
+        "    return {'ok': plate, 'gone': plate.cut(cq.Workplane().box(50, 50, 50))}\n"
+    )
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    proc = subprocess.run([sys.executable, RUNNER, str(script)], env=env, capture_output=True, text=True, timeout=300)
+    assert proc.returncode == 1
+    assert "No solid to export for: gone" in proc.stdout
+    parts = json.loads((tmp_path / "out" / "manifest.json").read_text())["parts"]
+    assert parts["ok"]["status"] == "exported" and parts["ok"]["valid"]
+    assert parts["gone"]["status"] == "failed"
+    assert parts["gone"]["diagnostics"] == [
+        {"category": "empty", "severity": "error", "message": parts["gone"]["diagnostics"][0]["message"], "operation": "cut", "line": 3}
+    ]
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from cadlib import RectEnclosureParams, insert_boss, parameter_grid, rectangular_enclosure_base_and_lid, sweep
+from cadlib.utils import MATERIAL_DENSITY_G_CM3
+from cadlib.parallel import shutdown_pool
+
+
+def test_parameter_grid_is_cartesian():
+    rows = parameter_grid({"a": [1, 2], "b": ["x", "y", "z"]})
+    assert len(rows) == 6
+    assert rows[0] == {"a": 1, "b": "x"} and rows[-1] == {"a": 2, "b": "z"}
+
+
+def test_sweep_model_builder_validates_in_bulk_and_measures():
+    table = sweep(
+        rectangular_enclosure_base_and_lid,
+        {"length": [60, 80], "wall_thickness": [1.0, 2.0]},
+        material="PETG",
+        max_workers=1,
+    )
+    assert len(table) == 4
+    # wall_thickness 1.0 is below the model's minimum: reported, not built
+    assert list(table.valid) == [False, True, False, True]
+    assert "wall_thickness" in table.errors[0]
+    assert np.isnan(table["volume"][0])
+    expected = rectangular_enclosure_base_and_lid(RectEnclosureParams(length=80, wall_thickness=2.0))
+    assert table["volume"][3] == pytest.approx(expected.Volume(), rel=1e-9)
+    assert table["mass"][3] == pytest.approx(expected.Volume() * MATERIAL_DENSITY_G_CM3["PETG"] / 1000.0)
+    assert table["size_x"][3] == pytest.approx(80.0, abs=1e-3)
+    cols = table.columns()
+    assert cols["length"][3] == 80.0 and cols["valid"][3] is True and cols["volume"][0] is None
+
+
+def test_sweep_plain_builder_reports_build_errors(tmp_path):
+    table = sweep(insert_boss, [{"size": "M3", "height": 6.0}, {"size": "M3", "height": 9.0}, {"size": "M9"}, {"heigth": 3}], max_workers=1)
+    assert list(table.valid) == [True, True, False, False]
+    assert table.errors[2].startswith("KeyError")
+    assert "heigth" in table.errors[3]
+    table.to_csv(str(tmp_path / "boss.csv"))
+    assert (tmp_path / "boss.csv").read_text().splitlines()[0].startswith("size,height,wall")
+
+
+def test_pareto_and_export(tmp_path):
+    table = sweep(insert_boss, {"height": [4.0, 6.0, 8.0], "wall": [1.2, 2.0]}, max_workers=2)
+    try:
+        # Less mass and more height conflict: the thinnest wall at every height is optimal
+        front = table.pareto(minimize=("mass",), maximize=("size_z",))
+        assert front == [0, 2, 4]
+        paths = table.export_pareto(str(tmp_path), minimize=("mass",), maximize=("size_z",), fmt="stl", max_workers=2)
+    finally:
+        shutdown_pool()
+    assert [p.rsplit("/", 1)[-1] for p in paths] == ["variant_000.stl", "variant_002.stl", "variant_004.stl"]
+    assert all((tmp_path / p.rsplit("/", 1)[-1]).stat().st_size > 0 for p in paths)
+
+
+def test_unknown_material_rejected():
+    with pytest.raises(ValueError):
+        sweep(insert_boss, [{}], material="unobtainium")
@@ -0,0 +1,85 @@
+from math import pi
+
+import cadquery as cq
+import numpy as np
+import pytest
+
+from cadlib import louvre_panel, perforated_panel, perforation_tool
+from cadlib.vents import perforation_points
+
+
+def test_louvre_panel_single_cut_matches_per_slot_cuts():
+    panel = louvre_panel(60, 40, 2, slot_width=2, slot_pitch=5)
+    expected = cq.Workplane("XY").rect(60, 40).extrude(2)
+    for i in range(7):
+        slot = (
+            cq.Workplane("XY")
+            .workplane(offset=1.0)
+            .transformed(rotate=(35.0, 0, 0))
+            .center(0, -15.0 + i * 5)
+            .rect(48, 2)
+            .extrude(2)
+        )
+        expected = expected.cut(slot)
+    assert panel.val().isValid()
+    assert panel.val().Volume() == pytest.approx(expected.val().Volume(), rel=1e-9)
+
+
+@pytest.mark.parametrize("pattern", ["round", "slot", "hex"])
+def test_perforated_panel_volume(pattern):
+    region = (-40.0, -25.0, 40.0, 25.0)
+    pts = perforation_points(region, pattern, 3.0, 5.0, slot_length=9.0)
+    panel = perforated_panel(100, 70, 2, pattern, hole_size=3.0, pitch=5.0, slot_length=9.0, region=region)
+    opening = {
+        "round": pi * 1.5**2,
+        "slot": 6.0 * 3.0 + pi * 1.5**2,
+        "hex": 3.0 * 3.0 * 3.0**0.5 / 2.0,
+    }[pattern]
+    shape = panel.val()
+    assert len(pts) > 20
+    assert shape.isValid() and len(shape.Solids()) == 1
+    assert shape.Volume() == pytest.approx((100 * 70 - len(pts) * opening) * 2, rel=1e-6)
+    bb = shape.BoundingBox()
+    assert (bb.xlen, bb.ylen, bb.zlen) == pytest.approx((100, 70, 2))
+
+
+def test_perforation_points_stay_inside_region():
+    region = (-20.0, -10.0, 20.0, 10.0)
+    for pattern in ("round", "slot", "hex"):
+        for x, y in perforation_points(region, pattern, 3.0, 5.0, slot_length=9.0):
+            assert -20.0 < x < 20.0 and -10.0 < y < 10.0
+    with pytest.raises(ValueError):
+        perforation_points(region, "round", 5.0, 4.0)
+
+
+def test_perforation_tool_cuts_same_openings():
+    region = (-20.0, -20.0, 20.0, 20.0)
+    plate = cq.Workplane("XY").rect(50, 50).extrude(2)
+    cut = plate.val().cut(perforation_tool(region, 2, "round", 3.0, 5.0).val())
+    panel = perforated_panel(50, 50, 2, "round", 3.0, 5.0, region=region)
+    assert cut.Volume() == pytest.approx(panel.val().Volume(), rel=1e-9)
+
+
+@pytest.mark.parametrize("pattern", ["round", "slot", "hex"])
+@pytest.mark.parametrize("length", [30.0, 33.8])
+def test_openings_stay_apart_at_minimum_pitch(pattern, length):
+    # 33.8 leaves room for as many staggered openings as unstaggered ones
+    pitch = 3.05
+    region = (-length / 2.0 + 5, -10.0, length / 2.0 - 5, 10.0)
+    pts = np.array(perforation_points(region, pattern, 3.0, pitch, slot_length=9.0))
+    gaps = np.linalg.norm(pts[:, None] - pts[None], axis=-1) + np.eye(len(pts)) * 1e9
+    assert gaps.min() >= pitch - 1e-9
+    rows = np.unique(pts[:, 1])
+    even, odd = pts[pts[:, 1] == rows[0], 0], pts[pts[:, 1] == rows[1], 0]
+    assert odd[0] - even[0] == pytest.approx((even[1] - even[0]) / 2.0)
+    opening = {"round": pi * 1.5**2, "slot": 6.0 * 3.0 + pi * 1.5**2, "hex": 3.0 * 3.0 * 3.0**0.5 / 2.0}[pattern]
+    shape = perforated_panel(length, 30, 2, pattern, hole_size=3.0, pitch=pitch, slot_length=9.0).val()
+    assert shape.isValid()
+    assert shape.Volume() == pytest.approx((length * 30 - len(pts) * opening) * 2, rel=1e-6)
+
+
+def test_unstaggered_hex_rows_need_corner_clearance():
+    with pytest.raises(ValueError):
+        perforation_points((-10.0, -10.0, 10.0, 10.0), "hex", 3.0, 3.3, stagger=False)
+    shape = perforated_panel(30, 30, 2, "hex", hole_size=3.0, pitch=3.5, stagger=False).val()
+    assert shape.isValid()
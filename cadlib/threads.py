@@ -0,0 +1,175 @@
+from dataclasses import dataclass
+from math import radians, sqrt, tan
+from typing import Dict, Optional, Tuple
+
+import cadquery as cq
+
+from .cache import cached
+from .fasteners import _hole_planes
+from .modes import real_threads
+from .validators import ThreadSpec
+
+
+ISO_COARSE_PITCH_MM: Dict[str, float] = {
+    "M2": 0.4,
+    "M2_5": 0.45,
+    "M3": 0.5,
+    "M4": 0.7,
+    "M5": 0.8,
+    "M6": 1.0,
+    "M8": 1.25,
+    "M10": 1.5,
+    "M12": 1.75,
+}
+
+# ISO 68-1 basic profile: 60° flanks, depth 5H/8 with H = sqrt(3)/2 * P,
+# crest flat P/8 at the major diameter and root flat P/4 at the minor one
+_DEPTH = 5.0 / 8.0 * sqrt(3.0) / 2.0
+# The ridge reaches this far (in pitches) into the core so the fuse never meets coincident faces
+_OVERLAP = 0.05
+_THREADS_ATTR = "cadlib_threads"
+
+
+@dataclass(frozen=True)
+class Thread:
+    """Annotation of one threaded feature, kept on the Workplane it was applied to."""
+
+    size: str
+    pitch: float
+    external: bool
+    length: float
+    major_diameter: float
+    minor_diameter: float
+    origin: Tuple[float, float, float]
+    direction: Tuple[float, float, float]
+    real: bool
+
+    @property
+    def designation(self) -> str:
+        """ISO designation such as "M6x1"."""
+
+        return f"{self.size.replace('_', '.')}x{self.pitch:g}"
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "designation": self.designation,
+            "external": self.external,
+            "length": self.length,
+            "major_diameter": round(self.major_diameter, 4),
+            "minor_diameter": round(self.minor_diameter, 4),
+            "origin": [round(v, 6) for v in self.origin],
+            "direction": [round(v, 6) for v in self.direction],
+            "real": self.real,
+        }
+
+
+def thread_dimensions(spec: ThreadSpec) -> Tuple[float, float, float]:
+    """(major diameter, minor diameter, pitch) of the spec, clearance applied.
+
+    The clearance shrinks external threads and grows internal ones, so a
+    printed bolt and nut of the same size fit together.
+    """
+
+    pitch = spec.pitch if spec.pitch is not None else ISO_COARSE_PITCH_MM[spec.size]
+    major = float(spec.size[1:].replace("_", "."))
+    minor = major - 2.0 * _DEPTH * pitch
+    allowance = 2.0 * spec.clearance * (-1.0 if spec.external else 1.0)
+    return major + allowance, minor + allowance, pitch
+
+
+def _helical_rod(major_r: float, minor_r: float, pitch: float, length: float) -> cq.Solid:
+    """Threaded rod from z=0 to `length`: a core at the minor radius plus a swept ridge."""
+
+    root = minor_r - _OVERLAP * pitch
+    # Half widths of the ridge at its (embedded) root and at the crest
+    half_root = 3.0 * pitch / 8.0 + _OVERLAP * pitch * tan(radians(30.0))
+    half_crest = pitch / 16.0
+    profile = cq.Workplane("XZ").polyline([(root, -half_root), (major_r, -half_crest), (major_r, half_crest), (root, half_root)]).close()
+    # One extra turn at each end, trimmed off below
+    helix = cq.Wire.makeHelix(pitch, length + 2.0 * pitch, root, center=cq.Vector(0, 0, -pitch))
+    ridge = profile.sweep(cq.Workplane().add(helix), isFrenet=True).val()
+    core = cq.Solid.makeCylinder(minor_r, length)
+    clip = cq.Solid.makeCylinder(major_r + pitch, length)
+    return core.fuse(ridge.intersect(clip)).clean()
+
+
+@cached
+def thread(spec: ThreadSpec, length: float, bore: float = 0.0) -> cq.Workplane:
+    """Threaded stud (external) or thread cutting tool (internal) from z=0 to `length` along +Z.
+
+    Cosmetic unless real thread geometry is on (see `modes.thread_geometry`):
+    an external thread is a cylinder at the major diameter, an internal one
+    a tool for a hole at the minor diameter. Real threads are swept ISO
+    profiles; the helical sweep is cached per spec and length. `bore` hollows
+    an external stud, e.g. for a tube end.
+    """
+
+    if length <= 0:
+        raise ValueError("length must be > 0")
+    major, minor, pitch = thread_dimensions(spec)
+    if not spec.external and bore:
+        raise ValueError("bore applies to external threads only")
+    if bore >= minor:
+        raise ValueError(f"bore must be smaller than the minor diameter {minor:.3f}")
+    if real_threads():
+        solid = _helical_rod(major / 2.0, minor / 2.0, pitch, length)
+    else:
+        solid = cq.Solid.makeCylinder((major if spec.external else minor) / 2.0, length)
+    if bore > 0:
+        solid = solid.cut(cq.Solid.makeCylinder(bore / 2.0, length))
+    return cq.Workplane("XY").newObject([solid])
+
+
+def threads_of(target: cq.Workplane) -> Tuple[Thread, ...]:
+    """Threads applied with `apply_thread` to this Workplane or the ones it was derived from.
+
+    Only the result of `apply_thread` and its descendants are annotated; the
+    Workplanes it was built from and sibling branches are not.
+    """
+
+    wp: Optional[cq.Workplane] = target
+    while wp is not None:
+        if _THREADS_ATTR in vars(wp):
+            return getattr(wp, _THREADS_ATTR)
+        wp = wp.parent
+    return ()
+
+
+def apply_thread(
+    target: cq.Workplane,
+    spec: ThreadSpec,
+    length: float,
+    location_xyz_mm: Tuple[float, float, float] = (0.0, 0.0, 0.0),
+    bore: float = 0.0,
+) -> cq.Workplane:
+    """Add an external threaded stud to the target, or cut an internal thread into it.
+
+    The location offsets the target's workplane by (x, y, z), as in
+    `apply_screw_holes`. External threads rise along +Z from there and are
+    fused; internal threads bore along -Z and are cut. The thread is
+    recorded on the result (see `threads_of`) whether it is cosmetic or real.
+    """
+
+    (plane,) = _hole_planes(target, [location_xyz_mm])
+    tool = thread(spec, length, bore).val()
+    if spec.external:
+        solid = target.findSolid().fuse(tool.moved(cq.Location(plane))).clean()
+        direction = plane.zDir
+    else:
+        solid = target.findSolid().cut(tool.moved(cq.Location(plane) * cq.Location(cq.Vector(0, 0, -length)))).clean()
+        direction = -plane.zDir
+    major, minor, pitch = thread_dimensions(spec)
+    record = Thread(
+        size=spec.size,
+        pitch=pitch,
+        external=spec.external,
+        length=float(length),
+        major_diameter=major,
+        minor_diameter=minor,
+        origin=plane.origin.toTuple(),
+        direction=direction.toTuple(),
+        real=real_threads(),
+    )
+    result = target.newObject([solid])
+    setattr(result, _THREADS_ATTR, threads_of(target) + (record,))
+    return result
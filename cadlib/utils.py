@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Dict
 
 
 class Fit(Enum):
@@ -15,6 +16,28 @@ class Fit(Enum):
 DEFAULT_NOZZLE_DIAMETER_MM: float = 0.4
 DEFAULT_LAYER_HEIGHT_MM: float = 0.2
 
+# Solid (100% infill) densities of common print materials in g/cm³
+MATERIAL_DENSITY_G_CM3: Dict[str, float] = {
+    "PLA": 1.24,
+    "PETG": 1.27,
+    "ABS": 1.04,
+    "ASA": 1.07,
+    "TPU": 1.21,
+    "PA12": 1.01,
+    "PC": 1.20,
+}
+
+# Heat-set insert outer diameter and length by thread size
+HEAT_SET_INSERTS_MM: Dict[str, Dict[str, float]] = {
+    "M2": {"od": 3.0, "len": 3.0},
+    "M2_5": {"od": 3.5, "len": 4.0},
+    "M3": {"od": 4.6, "len": 5.0},
+    "M4": {"od": 6.0, "len": 6.0},
+    "M5": {"od": 7.0, "len": 7.0},
+    "M6": {"od": 8.0, "len": 8.0},
+    "M8": {"od": 10.0, "len": 10.0},
+}
+
 
 def apply_fit_to_hole(nominal_diameter_mm: float, fit: Fit) -> float:
     """Return a hole diameter adjusted by the selected fit.
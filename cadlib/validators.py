@@ -20,7 +20,7 @@ class TubeParams(BaseModel):
 
 class HoleSpec(BaseModel):
     standard: Literal["ISO", "UNC"] = "ISO"
-    size: Literal["M2", "M2_5", "M3", "M4", "M5", "M6"]
+    size: Literal["M2", "M2_5", "M3", "M4", "M5", "M6", "M8", "UNC_2", "UNC_4", "UNC_6", "UNC_8", "UNC_10", "UNC_1_4"]
     fit: Literal["TIGHT", "SNAP", "SLIDE"] = "SNAP"
     through: bool = True
     depth: Optional[float] = None
@@ -28,6 +28,14 @@ class HoleSpec(BaseModel):
     countersink: bool = False
     head_type: Optional[Literal["flat", "pan", "socket"]] = None
 
+    @field_validator("size")
+    @classmethod
+    def size_matches_standard(cls, v: str, info):
+        standard = info.data.get("standard", "ISO")
+        if (standard == "UNC") != v.startswith("UNC"):
+            raise ValueError(f"size {v} is not a {standard} size")
+        return v
+
     @field_validator("depth")
     @classmethod
     def depth_required_for_blind(cls, v: Optional[float], info):
@@ -37,6 +45,13 @@ class HoleSpec(BaseModel):
         return v
 
 
+class ThreadSpec(BaseModel):
+    size: Literal["M2", "M2_5", "M3", "M4", "M5", "M6", "M8", "M10", "M12"]
+    pitch: Optional[float] = Field(None, gt=0.1, le=3.0)  # None: ISO coarse pitch
+    external: bool = True
+    clearance: float = Field(0.15, ge=0.0, le=1.0)  # radial allowance for printed fits
+
+
 class RectEnclosureParams(BaseModel):
     length: float = Field(100.0, ge=20.0, le=1000.0)
     width: float = Field(60.0, ge=20.0, le=1000.0)
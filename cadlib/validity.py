@@ -0,0 +1,285 @@
+import os
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
+
+import cadquery as cq
+from OCP.BRep import BRep_Tool
+from OCP.BRepCheck import BRepCheck_Analyzer
+from OCP.TopAbs import TopAbs_EDGE, TopAbs_FACE, TopAbs_SHELL, TopAbs_SOLID, TopAbs_VERTEX, TopAbs_WIRE
+from OCP.TopExp import TopExp
+from OCP.TopoDS import TopoDS
+from OCP.TopTools import TopTools_IndexedDataMapOfShapeListOfShape, TopTools_IndexedMapOfShape
+
+from .sections import _to_shape
+
+
+ShapeLike = Union[cq.Workplane, cq.Shape]
+
+# Frames from these directories are library code; the first frame outside is the caller's line
+_LIBRARY_DIRS = (os.path.dirname(cq.__file__) + os.sep, os.path.dirname(os.path.abspath(__file__)) + os.sep)
+_TESTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tests") + os.sep
+_TRACE_ATTR = "_cadlib_trace"
+_MIN_VOLUME = 1e-9
+
+
+@dataclass(frozen=True)
+class Diagnostic:
+    """One finding about an output, shaped for a repair prompt.
+
+    `faces` are indices into `shape.Faces()`. `operation` and `line` name the
+    Workplane call that first produced the problem, when operations were
+    traced (see `trace_operations`).
+    """
+
+    category: str
+    severity: str  # "error" or "warning"
+    message: str
+    faces: Tuple[int, ...] = ()
+    statuses: Tuple[str, ...] = ()
+    operation: Optional[str] = None
+    line: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, object]:
+        out: Dict[str, object] = {"category": self.category, "severity": self.severity, "message": self.message}
+        if self.faces:
+            out["faces"] = list(self.faces)
+        if self.statuses:
+            out["statuses"] = list(self.statuses)
+        if self.operation is not None:
+            out["operation"] = self.operation
+        if self.line is not None:
+            out["line"] = self.line
+        return out
+
+
+@dataclass(frozen=True)
+class ValidityReport:
+    """Result of `check_shape`; `shape` is the healed shape when healing helped."""
+
+    shape: Optional[cq.Shape]
+    diagnostics: Tuple[Diagnostic, ...]
+    solids: int
+    volume: float
+    healed: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    @property
+    def errors(self) -> Tuple[Diagnostic, ...]:
+        return tuple(d for d in self.diagnostics if d.severity == "error")
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "ok": self.ok,
+            "solids": self.solids,
+            "volume": round(self.volume, 6),
+            "healed": self.healed,
+            "diagnostics": [d.to_dict() for d in self.diagnostics],
+        }
+
+
+def _index_map(shape: cq.Shape, kind) -> TopTools_IndexedMapOfShape:
+    m = TopTools_IndexedMapOfShape()
+    TopExp.MapShapes_s(shape.wrapped, kind, m)
+    return m
+
+
+def _status_names(result) -> List[str]:
+    names = [s.name for s in result.Status()]
+    result.InitContextIterator()
+    while result.MoreShapeInContext():
+        names.extend(s.name for s in result.StatusOnShape())
+        result.NextShapeInContext()
+    return [n.replace("BRepCheck_", "") for n in names if n != "BRepCheck_NoError"]
+
+
+def _face_ids(shape: cq.Shape, faces: TopTools_IndexedMapOfShape, sub, kind) -> Set[int]:
+    """0-based ids of the faces of `shape` that contain the sub-shape `sub` of type `kind`."""
+
+    if kind == TopAbs_FACE:
+        return {faces.FindIndex(sub) - 1}
+    if kind in (TopAbs_SHELL, TopAbs_SOLID):
+        own = TopTools_IndexedMapOfShape()
+        TopExp.MapShapes_s(sub, TopAbs_FACE, own)
+        return {faces.FindIndex(own.FindKey(i)) - 1 for i in range(1, own.Extent() + 1)}
+    ancestors = TopTools_IndexedDataMapOfShapeListOfShape()
+    TopExp.MapShapesAndAncestors_s(shape.wrapped, kind, TopAbs_FACE, ancestors)
+    if not ancestors.Contains(sub):
+        return set()
+    return {faces.FindIndex(f) - 1 for f in ancestors.FindFromKey(sub)}
+
+
+def _brep_diagnostics(shape: cq.Shape, faces: TopTools_IndexedMapOfShape) -> List[Diagnostic]:
+    analyzer = BRepCheck_Analyzer(shape.wrapped)
+    if analyzer.IsValid():
+        return []
+    statuses: Dict[str, Set[int]] = {}
+    for kind in (TopAbs_VERTEX, TopAbs_EDGE, TopAbs_WIRE, TopAbs_FACE, TopAbs_SHELL, TopAbs_SOLID):
+        subs = _index_map(shape, kind)
+        for i in range(1, subs.Extent() + 1):
+            sub = subs.FindKey(i)
+            result = analyzer.Result(sub)
+            if result is None:
+                continue
+            names = _status_names(result)
+            if names:
+                ids = _face_ids(shape, faces, sub, kind)
+                for name in names:
+                    statuses.setdefault(name, set()).update(ids)
+    if not statuses:
+        return [Diagnostic("invalid_brep", "error", "BRepCheck reports the shape as invalid")]
+    return [
+        Diagnostic("invalid_brep", "error", f"BRepCheck: {name} on {len(ids)} face(s)", tuple(sorted(ids)), (name,))
+        for name, ids in sorted(statuses.items())
+    ]
+
+
+def _free_edge_faces(shape: cq.Shape, faces: TopTools_IndexedMapOfShape) -> Set[int]:
+    """Faces bordering edges that belong to a single face, i.e. where a shell is open."""
+
+    ancestors = TopTools_IndexedDataMapOfShapeListOfShape()
+    TopExp.MapShapesAndAncestors_s(shape.wrapped, TopAbs_EDGE, TopAbs_FACE, ancestors)
+    out: Set[int] = set()
+    for i in range(1, ancestors.Extent() + 1):
+        owners = ancestors.FindFromIndex(i)
+        # Seams list their face twice; degenerate edges (cone apex) have no neighbour
+        if owners.Size() == 1 and not BRep_Tool.Degenerated_s(TopoDS.Edge_s(ancestors.FindKey(i))):
+            out.add(faces.FindIndex(owners.First()) - 1)
+    return out
+
+
+def _is_empty(shape: Optional[cq.Shape]) -> bool:
+    return shape is None or shape.wrapped.IsNull() or (not shape.Solids() and not shape.Faces())
+
+
+def _diagnose(shape: cq.Shape, expect_solid: bool) -> Tuple[List[Diagnostic], int, float]:
+    if _is_empty(shape):
+        return [Diagnostic("empty", "error", "the result is empty; a boolean or selector removed everything")], 0, 0.0
+    faces = _index_map(shape, TopAbs_FACE)
+    out = _brep_diagnostics(shape, faces)
+    solids = shape.Solids()
+    if not solids:
+        if expect_solid:
+            out.append(Diagnostic("not_solid", "error", f"no solid, only {faces.Extent()} loose face(s)"))
+        return out, 0, 0.0
+    if len(solids) > 1:
+        out.append(Diagnostic("multiple_solids", "warning", f"{len(solids)} disjoint solids; fuse them if they should be one part"))
+    volume = 0.0
+    for k, solid in enumerate(solids):
+        v = solid.Volume()
+        volume += v
+        ids = tuple(sorted(faces.FindIndex(f.wrapped) - 1 for f in solid.Faces()))
+        if v < -_MIN_VOLUME:
+            out.append(Diagnostic("inverted", "error", f"solid {k} has negative volume {v:.3f} (faces point inward)", ids))
+        elif abs(v) <= _MIN_VOLUME:
+            out.append(Diagnostic("zero_volume", "error", f"solid {k} has no volume", ids))
+    open_faces = _free_edge_faces(shape, faces)
+    if open_faces:
+        out.append(Diagnostic("open_shell", "error", f"shell is not closed; {len(open_faces)} face(s) border free edges", tuple(sorted(open_faces))))
+    return out, len(solids), volume
+
+
+def _heal(shape: cq.Shape) -> cq.Shape:
+    """ShapeFix the shape and flip inverted solids."""
+
+    fixed = shape.fix()
+    solids = fixed.Solids()
+    if not solids or all(s.Volume() >= 0 for s in solids):
+        return fixed
+    flipped = [cq.Solid(s.wrapped.Reversed()) if s.Volume() < 0 else s for s in solids]
+    return flipped[0] if len(flipped) == 1 else cq.Compound.makeCompound(flipped)
+
+
+def _has_errors(shape: cq.Shape) -> bool:
+    return any(d.severity == "error" for d in _diagnose(shape, expect_solid=False)[0])
+
+
+def _locate(wp: cq.Workplane, empty: bool) -> Tuple[Optional[str], Optional[int]]:
+    """Traced (operation, line) of the first Workplane step that emptied the part or broke its solids."""
+
+    chain = []
+    node: Optional[cq.Workplane] = wp
+    while node is not None:
+        chain.append(node)
+        node = node.parent
+    for step in reversed(chain):
+        shapes = [o for o in step.objects if isinstance(o, cq.Shape)]
+        if empty:
+            bad = any(_is_empty(s) for s in shapes)
+        else:
+            bad = any(s.Solids() and _has_errors(s) for s in shapes)
+        if bad:
+            return getattr(step, _TRACE_ATTR, (None, None))
+    return None, None
+
+
+def check_shape(shape: ShapeLike, heal: bool = False, expect_solid: bool = True) -> ValidityReport:
+    """Check an output with OCCT BRepCheck, solid count, volume sign and shell closure.
+
+    With `heal`, failing shapes go through ShapeFix (and inverted solids are
+    flipped); the healed shape is returned when it has fewer errors. For a
+    traced Workplane, errors are attributed to the step that introduced them.
+    """
+
+    try:
+        base = _to_shape(shape)
+    except Exception:
+        base = None
+    diagnostics, solids, volume = _diagnose(base, expect_solid)
+    report = ValidityReport(base, tuple(diagnostics), solids, volume)
+    if heal and not report.ok and report.shape is not None and solids:
+        try:
+            fixed = _heal(base)
+        except Exception:
+            fixed = None
+        if fixed is not None:
+            fixed_diags, fixed_solids, fixed_volume = _diagnose(fixed, expect_solid)
+            healed = ValidityReport(fixed, tuple(fixed_diags), fixed_solids, fixed_volume, healed=True)
+            if len(healed.errors) < len(report.errors):
+                return healed
+    if not report.ok and isinstance(shape, cq.Workplane):
+        operation, line = _locate(shape, empty=base is None or _is_empty(base))
+        if operation is not None or line is not None:
+            located = tuple(replace(d, operation=operation, line=line) if d.severity == "error" else d for d in report.diagnostics)
+            report = replace(report, diagnostics=located)
+    return report
+
+
+def _caller() -> Tuple[Optional[str], Optional[int]]:
+    """(outermost public library function, caller's line) for the current newObject call."""
+
+    frame = sys._getframe(2)
+    operation = None
+    while frame is not None and frame.f_code.co_filename.startswith(_LIBRARY_DIRS) and not frame.f_code.co_filename.startswith(_TESTS_DIR):
+        name = frame.f_code.co_name
+        func = frame.f_locals.get("func") if name == "wrapper" else None
+        name = getattr(func, "__name__", name)
+        if not name.startswith("_") and name != "newObject":
+            operation = name
+        frame = frame.f_back
+    return operation, (frame.f_lineno if frame is not None else None)
+
+
+@contextmanager
+def trace_operations() -> Iterator[None]:
+    """Record which call and line created every Workplane step built in this block.
+
+    `check_shape` uses the records to name the offending operation.
+    """
+
+    original = cq.Workplane.newObject
+
+    def newObject(self, objlist):
+        result = original(self, objlist)
+        setattr(result, _TRACE_ATTR, _caller())
+        return result
+
+    cq.Workplane.newObject = newObject  # type: ignore[assignment]
+    try:
+        yield
+    finally:
+        cq.Workplane.newObject = original  # type: ignore[assignment]
@@ -0,0 +1,261 @@
+import csv
+import inspect
+import itertools
+import os
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Type, Union, get_type_hints
+
+import numpy as np
+import cadquery as cq
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError, create_model
+
+from .parallel import call, run_parallel
+from .sections import _to_shape
+from .utils import MATERIAL_DENSITY_G_CM3
+
+
+VariantSpec = Union[Mapping[str, Sequence[Any]], Sequence[Mapping[str, Any]]]
+
+# Numeric result columns, in table order
+METRICS = ("volume", "mass", "xmin", "ymin", "zmin", "xmax", "ymax", "zmax", "size_x", "size_y", "size_z", "bbox_volume")
+
+
+def parameter_grid(grid: Mapping[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """Cartesian product of per-parameter value lists, last key varying fastest."""
+
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[k] for k in keys))]
+
+
+def _params_model(builder: Callable[..., Any]) -> Tuple[Type[BaseModel], bool]:
+    """(pydantic model, takes_model) for a builder's parameters.
+
+    Builders taking a parameter model first (tube, rectangular enclosures) use
+    it directly; other builders get a model generated from their signature.
+    """
+
+    func = inspect.unwrap(builder)
+    sig = inspect.signature(func)
+    hints = get_type_hints(func)
+    params = list(sig.parameters.values())
+    if params:
+        first = hints.get(params[0].name)
+        if inspect.isclass(first) and issubclass(first, BaseModel):
+            return first, True
+    fields: Dict[str, Any] = {}
+    for p in params:
+        if p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD):
+            continue
+        default = ... if p.default is p.empty else p.default
+        fields[p.name] = (hints.get(p.name, Any), default)
+    model = create_model(f"{func.__name__}_params", __config__=ConfigDict(extra="forbid", arbitrary_types_allowed=True), **fields)
+    return model, False
+
+
+def _validate_bulk(model: Type[BaseModel], rows: List[Dict[str, Any]]) -> Tuple[List[Optional[BaseModel]], List[Optional[str]]]:
+    """Validate all rows in one pydantic call; per-row errors instead of a single failure."""
+
+    adapter = TypeAdapter(List[model])  # type: ignore[valid-type]
+    models: List[Optional[BaseModel]] = [None] * len(rows)
+    errors: List[Optional[str]] = [None] * len(rows)
+    pending = list(range(len(rows)))
+    while pending:
+        try:
+            validated = adapter.validate_python([rows[i] for i in pending])
+        except ValidationError as exc:
+            bad = set()
+            for err in exc.errors():
+                j = pending[err["loc"][0]]
+                bad.add(j)
+                loc = ".".join(str(part) for part in err["loc"][1:])
+                msg = f"{loc}: {err['msg']}" if loc else err["msg"]
+                errors[j] = msg if errors[j] is None else f"{errors[j]}; {msg}"
+            pending = [i for i in pending if i not in bad]
+            continue
+        for i, m in zip(pending, validated):
+            models[i] = m
+        break
+    return models, errors
+
+
+def _measure(builder: Callable[..., Any], args: Tuple[Any, ...], kwargs: Dict[str, Any], density: float) -> Tuple[Optional[List[float]], bool, Optional[str]]:
+    """Build one variant and return (metrics, valid, error); runs on pool workers."""
+
+    try:
+        shape = _to_shape(builder(*args, **kwargs))
+        bb = shape.BoundingBox()
+        volume = shape.Volume()
+        valid = shape.isValid()
+    except Exception as exc:
+        return None, False, f"{type(exc).__name__}: {exc}"
+    size = (bb.xlen, bb.ylen, bb.zlen)
+    metrics = [volume, volume * density / 1000.0, bb.xmin, bb.ymin, bb.zmin, bb.xmax, bb.ymax, bb.zmax, *size, size[0] * size[1] * size[2]]
+    return metrics, bool(valid), None
+
+
+@dataclass(frozen=True)
+class SweepTable:
+    """Columnar sweep results: one entry per variant in input order.
+
+    `params` holds the validated parameters; `metrics` is an (N, len(METRICS))
+    array (NaN where the variant failed validation or building). Volumes are
+    mm³, masses grams of solid material, bounding boxes mm.
+    """
+
+    builder: Callable[..., Any]
+    params: Tuple[Dict[str, Any], ...]
+    metrics: np.ndarray
+    valid: np.ndarray
+    errors: Tuple[Optional[str], ...]
+    material: str
+    fixed: Dict[str, Any] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.params)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """One column as an array: a metric, "valid", "error" or a parameter name."""
+
+        if name in METRICS:
+            return self.metrics[:, METRICS.index(name)]
+        if name == "valid":
+            return self.valid
+        if name == "error":
+            return np.array(self.errors, dtype=object)
+        return np.array([p.get(name) for p in self.params], dtype=object)
+
+    def param_names(self) -> List[str]:
+        names: List[str] = []
+        for p in self.params:
+            names.extend(k for k in p if k not in names)
+        return names
+
+    def columns(self) -> Dict[str, List[Any]]:
+        """The table as {column: values}, parameters first."""
+
+        out: Dict[str, List[Any]] = {name: [p.get(name) for p in self.params] for name in self.param_names()}
+        for i, name in enumerate(METRICS):
+            out[name] = [None if np.isnan(v) else float(v) for v in self.metrics[:, i]]
+        out["valid"] = [bool(v) for v in self.valid]
+        out["error"] = list(self.errors)
+        return out
+
+    def to_csv(self, path: str) -> None:
+        cols = self.columns()
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(list(cols))
+            writer.writerows(zip(*cols.values()))
+
+    def pareto(self, minimize: Sequence[str] = ("mass", "bbox_volume"), maximize: Sequence[str] = ()) -> List[int]:
+        """Indices of valid variants no other valid variant beats on every objective.
+
+        Objectives are metric or numeric parameter columns.
+        """
+
+        idx = np.flatnonzero(self.valid)
+        if len(idx) == 0:
+            return []
+        cols = [self[name].astype(float) for name in minimize] + [-self[name].astype(float) for name in maximize]
+        if not cols:
+            raise ValueError("at least one objective is required")
+        obj = np.stack(cols, axis=1)[idx]
+        # j dominates i when it is no worse everywhere and better somewhere
+        no_worse = np.all(obj[:, None, :] <= obj[None, :, :], axis=2)
+        better = np.any(obj[:, None, :] < obj[None, :, :], axis=2)
+        dominated = np.any(no_worse & better, axis=0)
+        return [int(i) for i in idx[~dominated]]
+
+    def build(self, index: int) -> Any:
+        """Rebuild one variant's geometry."""
+
+        args, kwargs = _call_args(self.builder, self.params[index], self.fixed)
+        return self.builder(*args, **kwargs)
+
+    def export(self, out_dir: str, indices: Optional[Sequence[int]] = None, fmt: str = "step", max_workers: Optional[int] = None) -> List[str]:
+        """Rebuild the given variants (default: all valid) and export them as `variant_<i>.<fmt>`."""
+
+        if indices is None:
+            indices = [int(i) for i in np.flatnonzero(self.valid)]
+        os.makedirs(out_dir, exist_ok=True)
+        calls = [call(self.builder, *a, **kw) for a, kw in (_call_args(self.builder, self.params[i], self.fixed) for i in indices)]
+        paths = []
+        for i, result in zip(indices, run_parallel(calls, max_workers=max_workers)):
+            path = os.path.join(out_dir, f"variant_{i:03d}.{fmt}")
+            cq.exporters.export(result if isinstance(result, cq.Workplane) else cq.Workplane("XY").add(result), path)
+            paths.append(path)
+        return paths
+
+    def export_pareto(
+        self,
+        out_dir: str,
+        minimize: Sequence[str] = ("mass", "bbox_volume"),
+        maximize: Sequence[str] = (),
+        fmt: str = "step",
+        max_workers: Optional[int] = None,
+    ) -> List[str]:
+        """Export only the Pareto-optimal variants."""
+
+        return self.export(out_dir, self.pareto(minimize, maximize), fmt, max_workers)
+
+
+def _call_args(builder: Callable[..., Any], params: Dict[str, Any], fixed: Dict[str, Any]) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+    model, takes_model = _params_model(builder)
+    if takes_model:
+        return (model(**params),), dict(fixed)
+    return (), {**params, **fixed}
+
+
+def sweep(
+    builder: Callable[..., Any],
+    variants: VariantSpec,
+    fixed: Optional[Dict[str, Any]] = None,
+    material: str = "PLA",
+    max_workers: Optional[int] = None,
+) -> SweepTable:
+    """Build every variant of a cadlib builder and measure it.
+
+    `variants` is a grid {param: [values]} (expanded with `parameter_grid`)
+    or a sequence of parameter dicts. All variants are validated in bulk
+    against the builder's parameter model before anything is built; invalid
+    ones are reported, not built. `fixed` are extra keyword arguments passed
+    to every call. Valid variants are built on the shared process pool and
+    only their measurements come back.
+    """
+
+    rows = parameter_grid(variants) if isinstance(variants, Mapping) else [dict(v) for v in variants]
+    if material not in MATERIAL_DENSITY_G_CM3:
+        raise ValueError(f"unknown material {material!r}; known: {sorted(MATERIAL_DENSITY_G_CM3)}")
+    density = MATERIAL_DENSITY_G_CM3[material]
+    fixed = dict(fixed or {})
+    model, takes_model = _params_model(builder)
+    if not takes_model:
+        # Fixed arguments take part in validation but are not table columns
+        rows_in = [{**r, **fixed} for r in rows]
+    else:
+        rows_in = rows
+    models, errors = _validate_bulk(model, rows_in)
+
+    params: List[Dict[str, Any]] = []
+    calls = {}
+    for i, m in enumerate(models):
+        if m is None:
+            params.append(dict(rows[i]))
+            continue
+        values = m.model_dump()
+        if takes_model:
+            params.append(values)
+            calls[str(i)] = call(_measure, builder, (m,), dict(fixed), density)
+        else:
+            params.append({k: v for k, v in values.items() if k not in fixed})
+            calls[str(i)] = call(_measure, builder, (), values, density)
+
+    metrics = np.full((len(rows), len(METRICS)), np.nan)
+    valid = np.zeros(len(rows), dtype=bool)
+    for key, (values, ok, err) in run_parallel(calls, max_workers=max_workers).items():
+        i = int(key)
+        if values is not None:
+            metrics[i] = values
+        valid[i] = ok
+        errors[i] = err if err is not None else (None if ok else "invalid shape")
+    return SweepTable(builder, tuple(params), metrics, valid, tuple(errors), material, fixed)
@@ -1,10 +1,16 @@
+from math import cos, radians, sin, sqrt
+from typing import List, Literal, Optional, Tuple
+
 import cadquery as cq
+from .cache import cached
 
 
+@cached
 def louvre_panel(length: float, width: float, thickness: float, slot_width: float, slot_pitch: float, tilt_deg: float = 35.0) -> cq.Workplane:
     """Generate a vented panel with angled louvres (self-supporting for FDM).
 
     Creates a rectangular plate and subtracts tilted slots.
+    All slots are placed copies of one slot body, cut in a single boolean.
     """
 
     plate = cq.Workplane("XY").rect(length, width).extrude(thickness)
@@ -12,17 +18,160 @@ def louvre_panel(length: float, width: float, thickness: float, slot_width: floa
     if n_slots <= 0:
         return plate
     y0 = -((n_slots - 1) * slot_pitch) / 2.0
-    for i in range(n_slots):
-        y = y0 + i * slot_pitch
-        slot = (
-            cq.Workplane("XY")
-            .workplane(offset=thickness / 2.0)
-            .transformed(rotate=(tilt_deg, 0, 0))
-            .center(0, y)
-            .rect(length * 0.8, slot_width)
-            .extrude(thickness)
-        )
-        plate = plate.cut(slot)
-    return plate
+    tilted = cq.Workplane("XY").workplane(offset=thickness / 2.0).transformed(rotate=(tilt_deg, 0, 0))
+    slot = tilted.center(0, y0).rect(length * 0.8, slot_width).extrude(thickness).val()
+    # Slots step along the tilted plane's Y axis
+    step = tilted.plane.yDir * slot_pitch
+    tools = [slot.moved(cq.Location(step * i)) for i in range(n_slots)]
+    return plate.newObject([plate.val().cut(*tools).clean()])
+
+
+PerforationPattern = Literal["round", "slot", "hex"]
+
+_EPS = 1e-9
+
+
+def _opening_wire(pattern: PerforationPattern, hole_size: float, slot_length: float) -> cq.Wire:
+    """Prototype opening outline centered on the origin in XY."""
+
+    r = hole_size / 2.0
+    if pattern == "round":
+        return cq.Wire.makeCircle(r, cq.Vector(), cq.Vector(0, 0, 1))
+    if pattern == "hex":
+        # hole_size is the across-flats width; vertices at 30°, 90°, ... put flats
+        # toward the in-row (0°) and staggered (±60°) neighbours, so rows tile as a honeycomb
+        rc = r / cos(radians(30.0))
+        pts = [cq.Vector(rc * cos(radians(30.0 + 60.0 * i)), rc * sin(radians(30.0 + 60.0 * i)), 0) for i in range(6)]
+        return cq.Wire.makePolygon(pts, close=True)
+    if pattern == "slot":
+        half = max(slot_length - hole_size, 0.0) / 2.0
+        if half <= 0:
+            return cq.Wire.makeCircle(r, cq.Vector(), cq.Vector(0, 0, 1))
+        edges = [
+            cq.Edge.makeLine(cq.Vector(-half, -r, 0), cq.Vector(half, -r, 0)),
+            cq.Edge.makeThreePointArc(cq.Vector(half, -r, 0), cq.Vector(half + r, 0, 0), cq.Vector(half, r, 0)),
+            cq.Edge.makeLine(cq.Vector(half, r, 0), cq.Vector(-half, r, 0)),
+            cq.Edge.makeThreePointArc(cq.Vector(-half, r, 0), cq.Vector(-half - r, 0, 0), cq.Vector(-half, -r, 0)),
+        ]
+        return cq.Wire.assembleEdges(edges)
+    raise ValueError("pattern must be 'round', 'slot' or 'hex'")
+
+
+def perforation_points(
+    region: Tuple[float, float, float, float],
+    pattern: PerforationPattern,
+    hole_size: float,
+    pitch: float,
+    slot_length: Optional[float] = None,
+    stagger: bool = True,
+) -> List[Tuple[float, float]]:
+    """Opening centers for a pattern whose openings fit fully inside `region`.
+
+    `region` is (xmin, ymin, xmax, ymax). Rows are spaced by `pitch` (by
+    pitch·√3/2 when staggered, which packs round and hex openings evenly);
+    staggered rows shift by half a pitch from the even rows, which are
+    centered in the region, and drop their last opening if it no longer fits.
+    """
+
+    xmin, ymin, xmax, ymax = region
+    length = slot_length if (pattern == "slot" and slot_length) else hole_size
+    half_x = length / 2.0
+    half_y = hole_size / 2.0
+    if pattern == "hex":
+        # Pointy side up: across flats along X, across corners along Y
+        half_y = hole_size / 2.0 / cos(radians(30.0))
+    if pitch <= max(hole_size, 0.0):
+        raise ValueError("pitch must be larger than hole_size")
+    x_pitch = max(pitch, length + (pitch - hole_size)) if pattern == "slot" else pitch
+    row_pitch = pitch * sqrt(3.0) / 2.0 if stagger and pattern != "slot" else pitch
+    if row_pitch <= 2 * half_y and not (stagger and pattern != "slot"):
+        # Unstaggered hex rows meet corner to corner
+        raise ValueError(f"pitch must be larger than {2 * half_y:.4g} for unstaggered rows")
 
+    ny = int(((ymax - ymin) - 2 * half_y) // row_pitch) + 1
+    if ny <= 0 or (ymax - ymin) < 2 * half_y:
+        return []
+    y_used = (ny - 1) * row_pitch
+    y0 = (ymin + ymax) / 2.0 - y_used / 2.0
+    span = (xmax - xmin) - 2 * half_x
+    if span < 0:
+        return []
+    nx = int(span // x_pitch) + 1
+    x0 = (xmin + xmax) / 2.0 - (nx - 1) * x_pitch / 2.0
+    x_last = xmax - half_x + _EPS
+    pts: List[Tuple[float, float]] = []
+    for j in range(ny):
+        shift = x_pitch / 2.0 if (stagger and j % 2 == 1) else 0.0
+        y = y0 + j * row_pitch
+        pts.extend((x, y) for x in (x0 + shift + i * x_pitch for i in range(nx)) if x <= x_last)
+    return pts
+
+
+def _opening_wires(
+    centers: List[Tuple[float, float]],
+    pattern: PerforationPattern,
+    hole_size: float,
+    slot_length: Optional[float],
+) -> List[cq.Wire]:
+    proto = _opening_wire(pattern, hole_size, slot_length or hole_size * 3.0)
+    return [proto.moved(cq.Location(cq.Vector(x, y, 0))) for (x, y) in centers]
+
+
+@cached
+def perforated_panel(
+    length: float,
+    width: float,
+    thickness: float,
+    pattern: PerforationPattern = "round",
+    hole_size: float = 3.0,
+    pitch: float = 5.0,
+    margin: float = 5.0,
+    slot_length: Optional[float] = None,
+    stagger: bool = True,
+    region: Optional[Tuple[float, float, float, float]] = None,
+) -> cq.Workplane:
+    """Rectangular panel perforated with round, slot or hex openings.
+
+    The panel outline and every opening are assembled as wires of one planar
+    face and extruded once, so no 3D booleans run regardless of hole count.
+    `region` (xmin, ymin, xmax, ymax) limits the pattern; by default it is the
+    panel inset by `margin`. The panel is centered in XY and extruded +Z.
+    """
+
+    if region is None:
+        region = (-length / 2.0 + margin, -width / 2.0 + margin, length / 2.0 - margin, width / 2.0 - margin)
+    centers = perforation_points(region, pattern, hole_size, pitch, slot_length, stagger)
+    outer = cq.Wire.makePolygon(
+        [
+            cq.Vector(-length / 2.0, -width / 2.0, 0),
+            cq.Vector(length / 2.0, -width / 2.0, 0),
+            cq.Vector(length / 2.0, width / 2.0, 0),
+            cq.Vector(-length / 2.0, width / 2.0, 0),
+        ],
+        close=True,
+    )
+    face = cq.Face.makeFromWires(outer, _opening_wires(centers, pattern, hole_size, slot_length))
+    return cq.Workplane("XY").add(cq.Solid.extrudeLinear(face, cq.Vector(0, 0, thickness)))
+
+
+@cached
+def perforation_tool(
+    region: Tuple[float, float, float, float],
+    depth: float,
+    pattern: PerforationPattern = "round",
+    hole_size: float = 3.0,
+    pitch: float = 5.0,
+    slot_length: Optional[float] = None,
+    stagger: bool = True,
+) -> cq.Workplane:
+    """Opening prisms for cutting a perforation into an existing wall in one boolean.
+
+    Openings start at Z=0 and extrude +Z by `depth`; one prototype prism is
+    extruded and the rest are placed copies, returned as a single compound.
+    """
 
+    centers = perforation_points(region, pattern, hole_size, pitch, slot_length, stagger)
+    proto_wire = _opening_wire(pattern, hole_size, slot_length or hole_size * 3.0)
+    proto = cq.Solid.extrudeLinear(cq.Face.makeFromWires(proto_wire), cq.Vector(0, 0, depth))
+    prisms = [proto.moved(cq.Location(cq.Vector(x, y, 0))) for (x, y) in centers]
+    return cq.Workplane("XY").add(cq.Compound.makeCompound(prisms))